@@ -0,0 +1,67 @@
+"""add composite indexes for list and filter queries
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # List endpoints: WHERE status = ? ORDER BY sort_order, name/title LIMIT ?
+    op.create_index(
+        'ix_candidates_status_sort_order_name',
+        'candidates',
+        ['status', 'sort_order', 'name'],
+    )
+    op.create_index(
+        'ix_positions_status_sort_order_title',
+        'positions',
+        ['status', 'sort_order', 'title'],
+    )
+
+    # positionId filter: SELECT candidate_id ... WHERE position_id = ?
+    # (covering; replaces the single-column position_id index)
+    op.create_index(
+        'ix_candidate_positions_position_candidate',
+        'candidate_positions',
+        ['position_id', 'candidate_id'],
+    )
+    op.drop_index('ix_candidate_positions_position_id', table_name='candidate_positions')
+
+    # Skill search subquery: SELECT candidate_id ... WHERE name LIKE ?
+    # (covering; replaces the single-column name index)
+    op.create_index('ix_skills_name_candidate', 'skills', ['name', 'candidate_id'])
+    op.drop_index('ix_skills_name', table_name='skills')
+
+    # selectinload of required skills: WHERE position_id IN (...)
+    op.create_index(
+        'ix_position_skills_position_name',
+        'position_skills',
+        ['position_id', 'name'],
+    )
+    op.drop_index('ix_position_skills_position_id', table_name='position_skills')
+
+
+def downgrade() -> None:
+    op.create_index('ix_position_skills_position_id', 'position_skills', ['position_id'])
+    op.drop_index('ix_position_skills_position_name', table_name='position_skills')
+
+    op.create_index('ix_skills_name', 'skills', ['name'])
+    op.drop_index('ix_skills_name_candidate', table_name='skills')
+
+    op.create_index('ix_candidate_positions_position_id', 'candidate_positions', ['position_id'])
+    op.drop_index('ix_candidate_positions_position_candidate', table_name='candidate_positions')
+
+    op.drop_index('ix_positions_status_sort_order_title', table_name='positions')
+    op.drop_index('ix_candidates_status_sort_order_name', table_name='candidates')
@@ -0,0 +1,117 @@
+"""add derived years_of_experience and search_text to candidates
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from collections import defaultdict
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+from dateutil.relativedelta import relativedelta
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+candidates = sa.table(
+    'candidates',
+    sa.column('id', sa.String),
+    sa.column('name', sa.String),
+    sa.column('email', sa.String),
+    sa.column('years_of_experience', sa.Integer),
+    sa.column('search_text', sa.Text),
+)
+experiences = sa.table(
+    'experiences',
+    sa.column('candidate_id', sa.String),
+    sa.column('start_date', sa.Date),
+    sa.column('end_date', sa.Date),
+)
+skills = sa.table(
+    'skills',
+    sa.column('candidate_id', sa.String),
+    sa.column('name', sa.String),
+)
+
+
+# Frozen copies of CandidateService as of this revision, so later edits to
+# the live calculations do not change what it writes
+def calculate_years_of_experience(experiences: list) -> int:
+    """Years covered by the experiences, overlaps merged, current roles up to today."""
+    today = date.today()
+    ranges = sorted((exp.start_date, exp.end_date or today) for exp in experiences)
+    if not ranges:
+        return 0
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    total_months = 0
+    for start, end in merged:
+        delta = relativedelta(end, start)
+        total_months += delta.years * 12 + delta.months
+    return round(total_months / 12)
+
+
+def build_search_text(name: str, email: str, skill_names: list[str]) -> str:
+    return ' '.join([name, email, *skill_names]).lower()
+
+
+def upgrade() -> None:
+    op.add_column(
+        'candidates',
+        sa.Column('years_of_experience', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.add_column('candidates', sa.Column('search_text', sa.Text(), nullable=True))
+
+    # Backfill existing rows
+    conn = op.get_bind()
+    experiences_by_candidate = defaultdict(list)
+    for row in conn.execute(
+        sa.select(experiences.c.candidate_id, experiences.c.start_date, experiences.c.end_date)
+    ):
+        experiences_by_candidate[row.candidate_id].append(row)
+    skills_by_candidate = defaultdict(list)
+    for row in conn.execute(sa.select(skills.c.candidate_id, skills.c.name)):
+        skills_by_candidate[row.candidate_id].append(row.name)
+
+    updates = [
+        {
+            'candidate_id': row.id,
+            'years_of_experience': calculate_years_of_experience(
+                experiences_by_candidate[row.id]
+            ),
+            'search_text': build_search_text(row.name, row.email, skills_by_candidate[row.id]),
+        }
+        for row in conn.execute(sa.select(candidates.c.id, candidates.c.name, candidates.c.email))
+    ]
+    if updates:
+        conn.execute(
+            candidates.update()
+            .where(candidates.c.id == sa.bindparam('candidate_id'))
+            .values(
+                years_of_experience=sa.bindparam('years_of_experience'),
+                search_text=sa.bindparam('search_text'),
+            ),
+            updates,
+        )
+
+    with op.batch_alter_table('candidates') as batch_op:
+        batch_op.alter_column('search_text', existing_type=sa.Text(), nullable=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('candidates') as batch_op:
+        batch_op.drop_column('search_text')
+        batch_op.drop_column('years_of_experience')
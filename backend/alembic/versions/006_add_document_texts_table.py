@@ -0,0 +1,38 @@
+"""add document_texts table for extracted document text
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'document_texts',
+        sa.Column('document_id', sa.String(36), primary_key=True),
+        sa.Column('candidate_id', sa.String(36), nullable=False),
+        sa.Column('status', sa.Enum('extracted', 'unsupported', 'failed', name='extractionstatus'), nullable=False),
+        sa.Column('content', sa.Text().with_variant(mysql.MEDIUMTEXT(), 'mysql'), nullable=False),
+        sa.Column('error', sa.String(500), nullable=True),
+        sa.Column('extracted_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['candidate_id'], ['candidates.id'], ondelete='CASCADE'),
+    )
+    op.create_index('ix_document_texts_candidate_id', 'document_texts', ['candidate_id'])
+
+
+def downgrade() -> None:
+    op.drop_table('document_texts')
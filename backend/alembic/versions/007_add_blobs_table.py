@@ -0,0 +1,90 @@
+"""add blobs table and move uploads to content-addressed storage
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+import os
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+documents = sa.table(
+    'documents',
+    sa.column('id', sa.String),
+    sa.column('storage_key', sa.String),
+    sa.column('size', sa.BigInteger),
+    sa.column('checksum', sa.String),
+)
+blobs = sa.table(
+    'blobs',
+    sa.column('sha256', sa.String),
+    sa.column('size', sa.BigInteger),
+    sa.column('ref_count', sa.Integer),
+    sa.column('created_at', sa.DateTime),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'blobs',
+        sa.Column('sha256', sa.String(64), primary_key=True),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), nullable=False, default=0),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_blobs_ref_count', 'blobs', ['ref_count'])
+    op.create_index('ix_documents_checksum', 'documents', ['checksum'])
+
+    # Move files uploaded under <document id>.<ext> to ab/cd/<sha256>
+    conn = op.get_bind()
+    root = Path(settings.STORAGE_PATH)
+    ref_counts, sizes = Counter(), {}
+    for row in conn.execute(
+        sa.select(documents.c.id, documents.c.storage_key, documents.c.size, documents.c.checksum)
+        .where(documents.c.storage_key.is_not(None))
+    ):
+        key = f"{row.checksum[:2]}/{row.checksum[2:4]}/{row.checksum}"
+        source, destination = root / row.storage_key, root / key
+        if source != destination and source.exists():
+            if destination.exists():
+                source.unlink()
+            else:
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(source, destination)
+        conn.execute(
+            documents.update().where(documents.c.id == row.id).values(storage_key=key)
+        )
+        ref_counts[row.checksum] += 1
+        sizes[row.checksum] = row.size
+
+    if ref_counts:
+        now = datetime.utcnow()
+        op.bulk_insert(
+            blobs,
+            [
+                {'sha256': sha256, 'size': sizes[sha256], 'ref_count': count, 'created_at': now}
+                for sha256, count in ref_counts.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    # Files stay where they are; documents.storage_key still points at them
+    op.drop_index('ix_documents_checksum', table_name='documents')
+    op.drop_table('blobs')
@@ -0,0 +1,38 @@
+"""add previews table for cached document previews
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing documents get previews lazily, on first request
+    op.create_table(
+        'previews',
+        sa.Column('sha256', sa.String(64), primary_key=True),
+        sa.Column('kind', sa.Enum('image', 'text', 'unavailable', name='previewkind'), nullable=False),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('error', sa.String(500), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('accessed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['sha256'], ['blobs.sha256'], ondelete='CASCADE'),
+    )
+    op.create_index('ix_previews_accessed_at', 'previews', ['accessed_at'])
+
+
+def downgrade() -> None:
+    # Preview files stay next to their blobs and go when the blob is collected
+    op.drop_table('previews')
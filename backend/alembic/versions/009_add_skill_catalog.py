@@ -0,0 +1,162 @@
+"""add skill catalog and canonical skill ids on skills and position_skills
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from collections import Counter
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Frozen copy of app.services.skill_catalog as of this revision, so later
+# edits to the live aliases or normalization do not change what it writes
+DEFAULT_ALIASES: dict[str, list[str]] = {
+    'JavaScript': ['JS', 'JavaScript ES6', 'ES6', 'ECMAScript'],
+    'TypeScript': ['TS'],
+    'Node.js': ['Node', 'NodeJS', 'Node JS'],
+    'React': ['ReactJS', 'React.js'],
+    'Vue.js': ['Vue', 'VueJS'],
+    'Python': ['Python 3', 'Python3'],
+    'Go': ['Golang'],
+    'C#': ['CSharp', 'C Sharp'],
+    'C++': ['CPP'],
+    'PostgreSQL': ['Postgres', 'psql'],
+    'Kubernetes': ['k8s'],
+    'AWS': ['Amazon Web Services'],
+    'GCP': ['Google Cloud', 'Google Cloud Platform'],
+    'Azure': ['Microsoft Azure'],
+    'Machine Learning': ['ML'],
+    'CI/CD': ['CICD'],
+}
+
+skill_catalog = sa.table(
+    'skill_catalog',
+    sa.column('id', sa.Integer),
+    sa.column('name', sa.String),
+    sa.column('normalized_name', sa.String),
+    sa.column('created_at', sa.DateTime),
+)
+skill_aliases = sa.table(
+    'skill_aliases',
+    sa.column('alias', sa.String),
+    sa.column('skill_id', sa.Integer),
+)
+skill_tables = [
+    sa.table('skills', sa.column('name', sa.String), sa.column('skill_id', sa.Integer)),
+    sa.table('position_skills', sa.column('name', sa.String), sa.column('skill_id', sa.Integer)),
+]
+
+
+def normalize_skill(name: str) -> str:
+    return ' '.join(name.split()).lower()
+
+
+def default_alias_map() -> dict[str, str]:
+    """Normalized spelling -> canonical name, for every DEFAULT_ALIASES entry."""
+    aliases = {}
+    for canonical, spellings in DEFAULT_ALIASES.items():
+        for spelling in [canonical, *spellings]:
+            aliases[normalize_skill(spelling)] = canonical
+    return aliases
+
+
+def upgrade() -> None:
+    op.create_table(
+        'skill_catalog',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('normalized_name', sa.String(255), nullable=False, unique=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_table(
+        'skill_aliases',
+        sa.Column('alias', sa.String(255), primary_key=True),
+        sa.Column('skill_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['skill_id'], ['skill_catalog.id'], ondelete='CASCADE'),
+    )
+    op.create_index('ix_skill_aliases_skill_id', 'skill_aliases', ['skill_id'])
+    for table, index, other in [
+        ('skills', 'ix_skills_skill_id_candidate', 'candidate_id'),
+        ('position_skills', 'ix_position_skills_skill_id_position', 'position_id'),
+    ]:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column('skill_id', sa.Integer(), nullable=True))
+            batch_op.create_foreign_key(
+                f'fk_{table}_skill_id', 'skill_catalog', ['skill_id'], ['id']
+            )
+            batch_op.create_index(index, ['skill_id', other])
+
+    # Catalog: the default canonical names, plus one entry per other
+    # normalized name in use, spelled the way it is most often written
+    conn = op.get_bind()
+    defaults = default_alias_map()
+    spellings: dict[str, Counter] = {}
+    for table in skill_tables:
+        for name, count in conn.execute(
+            sa.select(table.c.name, sa.func.count()).group_by(table.c.name)
+        ):
+            key = normalize_skill(name)
+            if key and key not in defaults:
+                spellings.setdefault(key, Counter())[" ".join(name.split())] += count
+
+    canonical = list(dict.fromkeys(defaults.values()))
+    canonical += [counts.most_common(1)[0][0] for counts in spellings.values()]
+    ids = {normalize_skill(name): number for number, name in enumerate(canonical, start=1)}
+    now = datetime.utcnow()
+    for start in range(0, len(canonical), BATCH_SIZE):
+        op.bulk_insert(
+            skill_catalog,
+            [
+                {'id': ids[normalize_skill(name)], 'name': name,
+                 'normalized_name': normalize_skill(name), 'created_at': now}
+                for name in canonical[start:start + BATCH_SIZE]
+            ],
+        )
+    aliases = {alias: ids[normalize_skill(name)] for alias, name in defaults.items()}
+    aliases.update({key: ids[key] for key in spellings})
+    alias_rows = [{'alias': alias, 'skill_id': skill_id} for alias, skill_id in aliases.items()]
+    for start in range(0, len(alias_rows), BATCH_SIZE):
+        op.bulk_insert(skill_aliases, alias_rows[start:start + BATCH_SIZE])
+
+    # Point existing rows at their catalog entry, a batch of names at a time
+    for table in skill_tables:
+        names = list(conn.execute(sa.select(table.c.name).distinct()).scalars())
+        for start in range(0, len(names), BATCH_SIZE):
+            rows = [
+                {'skill_name': name, 'catalog_id': aliases[normalize_skill(name)]}
+                for name in names[start:start + BATCH_SIZE]
+                if normalize_skill(name) in aliases
+            ]
+            if rows:
+                conn.execute(
+                    table.update()
+                    .where(table.c.name == sa.bindparam('skill_name'))
+                    .values(skill_id=sa.bindparam('catalog_id')),
+                    rows,
+                )
+
+
+def downgrade() -> None:
+    for table, index in [
+        ('position_skills', 'ix_position_skills_skill_id_position'),
+        ('skills', 'ix_skills_skill_id_candidate'),
+    ]:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_index(index)
+            batch_op.drop_constraint(f'fk_{table}_skill_id', type_='foreignkey')
+            batch_op.drop_column('skill_id')
+    op.drop_table('skill_aliases')
+    op.drop_table('skill_catalog')
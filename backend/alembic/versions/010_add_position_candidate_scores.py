@@ -0,0 +1,47 @@
+"""add position_candidate_scores table for materialized match rankings
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Filled by scripts/rebuild_position_scores.py, then kept current by writes
+    op.create_table(
+        'position_candidate_scores',
+        sa.Column('position_id', sa.String(36), primary_key=True),
+        sa.Column('candidate_id', sa.String(36), primary_key=True),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('skill_score', sa.Float(), nullable=False),
+        sa.Column('experience_score', sa.Float(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['position_id'], ['positions.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['candidate_id'], ['candidates.id'], ondelete='CASCADE'),
+    )
+    op.create_index(
+        'ix_position_candidate_scores_position_score',
+        'position_candidate_scores',
+        ['position_id', 'score'],
+    )
+    op.create_index(
+        'ix_position_candidate_scores_candidate_id',
+        'position_candidate_scores',
+        ['candidate_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('position_candidate_scores')
@@ -0,0 +1,76 @@
+"""add pipeline rollup tables for analytics
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'pipeline_position_stats',
+        sa.Column('position_id', sa.String(36), primary_key=True),
+        sa.Column('applications', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['position_id'], ['positions.id'], ondelete='CASCADE'),
+    )
+    op.create_index(
+        'ix_pipeline_position_stats_applications', 'pipeline_position_stats', ['applications']
+    )
+    op.create_table(
+        'pipeline_department_positions',
+        sa.Column('department', sa.String(255), primary_key=True),
+        sa.Column('status', sa.Enum('Open', 'Closed', 'On Hold', name='positionstatus'), primary_key=True),
+        sa.Column('positions', sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        'pipeline_department_applications',
+        sa.Column('department', sa.String(255), primary_key=True),
+        sa.Column('candidate_status', sa.Enum('Active', 'Hired', 'Rejected', 'Withdrawn', name='candidatestatus'), primary_key=True),
+        sa.Column('applications', sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        'pipeline_openings',
+        sa.Column('posted_date', sa.Date(), primary_key=True),
+        sa.Column('positions', sa.Integer(), nullable=False),
+    )
+
+    # Backfill from the base tables; writes keep them current from here on
+    op.execute(
+        "INSERT INTO pipeline_position_stats (position_id, applications) "
+        "SELECT position_id, COUNT(*) FROM candidate_positions GROUP BY position_id"
+    )
+    op.execute(
+        "INSERT INTO pipeline_department_positions (department, status, positions) "
+        "SELECT department, status, COUNT(*) FROM positions GROUP BY department, status"
+    )
+    op.execute(
+        "INSERT INTO pipeline_department_applications "
+        "(department, candidate_status, applications) "
+        "SELECT p.department, c.status, COUNT(*) FROM candidate_positions cp "
+        "JOIN positions p ON p.id = cp.position_id "
+        "JOIN candidates c ON c.id = cp.candidate_id "
+        "GROUP BY p.department, c.status"
+    )
+    op.execute(
+        "INSERT INTO pipeline_openings (posted_date, positions) "
+        "SELECT posted_date, COUNT(*) FROM positions GROUP BY posted_date"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('pipeline_openings')
+    op.drop_table('pipeline_department_applications')
+    op.drop_table('pipeline_department_positions')
+    op.drop_table('pipeline_position_stats')
@@ -0,0 +1,65 @@
+"""Analytics API endpoints."""
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_active_user
+from app.db.session import get_db
+from app.repositories.pipeline import PipelineRepository
+from app.schemas.analytics import (
+    DepartmentBreakdown,
+    OpeningsPeriod,
+    PipelineResponse,
+    PositionApplications,
+)
+
+router = APIRouter()
+
+
+@router.get("/pipeline", response_model=PipelineResponse)
+async def get_pipeline(
+    limit: int = Query(100, ge=1, le=1000),
+    interval: Literal["day", "month"] = Query("month"),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Get the recruiting pipeline overview.
+
+    - **limit**: Number of positions to list, those with the most applications first
+    - **interval**: Bucket openings by `day` or `month` of posting
+
+    Served from rollup tables that writes keep current, in four queries
+    regardless of how many candidates and applications there are.
+    Positions without applications are not listed.
+    """
+    positions = await PipelineRepository.get_position_stats(db, limit)
+
+    departments: dict[str, DepartmentBreakdown] = {}
+    for row in await PipelineRepository.get_department_positions(db):
+        breakdown = departments.setdefault(
+            row.department, DepartmentBreakdown(department=row.department)
+        )
+        breakdown.positions[row.status.value] = row.positions
+        breakdown.total_positions += row.positions
+    for row in await PipelineRepository.get_department_applications(db):
+        breakdown = departments.setdefault(
+            row.department, DepartmentBreakdown(department=row.department)
+        )
+        breakdown.applications[row.candidate_status.value] = row.applications
+        breakdown.total_applications += row.applications
+
+    openings: dict = {}
+    for row in await PipelineRepository.get_openings(db):
+        period = row.posted_date if interval == "day" else row.posted_date.replace(day=1)
+        openings[period] = openings.get(period, 0) + row.positions
+
+    return PipelineResponse(
+        positions=[PositionApplications(**row) for row in positions],
+        departments=[departments[name] for name in sorted(departments)],
+        openings=[
+            OpeningsPeriod(period=period, positions=count) for period, count in openings.items()
+        ],
+    )
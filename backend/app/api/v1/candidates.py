@@ -2,32 +2,57 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
-from app.api.deps import get_current_active_user, require_editor
+from app.api.deps import get_current_active_user, require_admin, require_editor
+from app.config import settings
 from app.db.session import get_db
 from app.models.candidate import CandidateStatus
+from app.models.document import Document, DocumentType
 from app.repositories.candidate import CandidateRepository
 from app.repositories.candidate_position import CandidatePositionRepository
+from app.repositories.document import DocumentRepository
 from app.schemas.candidate import (
+    CandidateBatchResponse,
     CandidateDetail,
+    CandidateImportResult,
     CandidateListItem,
     CandidateListResponse,
-    DocumentSchema,
+    CandidateWrite,
+    DocumentDetailSchema,
     EducationSchema,
     ExperienceSchema,
     SkillSchema,
 )
-from app.services.candidate import CandidateService
+from app.schemas.document import DocumentResponse
+from app.schemas.job import JobResponse
+from app.services.candidate_export import (
+    MEDIA_TYPES,
+    CandidateExportService,
+    ExportFormat,
+)
+from app.services.candidate_import import CandidateImportService
+from app.services.document_archive import DocumentArchiveService
+from app.services.document_preview import preview_generator
+from app.services.document_storage import DocumentStorageService, UploadTooLargeError
+from app.services.jobs import job_runner
+from app.services.skill_index import SkillExpressionError, skill_index
+from app.services.text_extraction import text_extractor
 
 router = APIRouter()
 
+MAX_BATCH_IDS = 100
+
 
 @router.get("", response_model=CandidateListResponse)
 async def list_candidates(
     status: Optional[CandidateStatus] = Query(CandidateStatus.ACTIVE),
     search: Optional[str] = Query(None),
+    search_documents: bool = Query(False, alias="searchDocuments"),
+    skills: Optional[str] = Query(None, max_length=1000),
     position_id: Optional[str] = Query(None, alias="positionId"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
@@ -39,10 +64,24 @@ async def list_candidates(
 
     - **status**: Filter by candidate status (default: Active)
     - **search**: Search by name, email, or skill (case-insensitive)
+    - **searchDocuments**: Also match search against uploaded document text
+      (slower: scans every extracted document; default: false)
+    - **skills**: Skill expression, e.g. `python AND kubernetes AND (aws OR gcp)`;
+      `python:advanced` requires at least that level
     - **positionId**: Filter candidates who applied to this position
     - **limit**: Maximum number of results (default: 100)
     - **offset**: Number of results to skip (default: 0)
     """
+    candidate_filter = None
+    if skills is not None:
+        try:
+            match = await skill_index.match(db, skills)
+        except SkillExpressionError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if not match.count:
+            return CandidateListResponse(candidates=[], total=0)
+        candidate_filter = match.condition
+
     candidates, total = await CandidateRepository.get_candidates(
         db=db,
         status=status,
@@ -50,19 +89,18 @@ async def list_candidates(
         position_id=position_id,
         limit=limit,
         offset=offset,
+        candidate_filter=candidate_filter,
+        search_documents=search_documents,
     )
 
     # Convert to response format
     candidate_list = []
     for candidate in candidates:
-        # Calculate years of experience
-        years_exp = CandidateService.calculate_years_of_experience(candidate.experiences)
-
         # Get applied position IDs
         applied_positions = [cp.position_id for cp in candidate.candidate_positions]
 
         # Convert skills
-        skills = [
+        skill_items = [
             SkillSchema(name=s.name, level=s.level)
             for s in candidate.skills
         ]
@@ -75,9 +113,9 @@ async def list_candidates(
             location=candidate.location,
             summary=candidate.summary,
             status=candidate.status,
-            years_of_experience=years_exp,
+            years_of_experience=candidate.years_of_experience,
             sort_order=candidate.sort_order,
-            skills=skills,
+            skills=skill_items,
             applied_positions=applied_positions,
         )
         candidate_list.append(candidate_item)
@@ -85,21 +123,8 @@ async def list_candidates(
     return CandidateListResponse(candidates=candidate_list, total=total)
 
 
-@router.get("/{candidate_id}", response_model=CandidateDetail)
-async def get_candidate(
-    candidate_id: str,
-    db: AsyncSession = Depends(get_db),
-    current_user = Depends(get_current_active_user),
-):
-    """Get a single candidate by ID with full details."""
-    candidate = await CandidateRepository.get_candidate_by_id(db, candidate_id)
-
-    if not candidate:
-        raise HTTPException(status_code=404, detail="Candidate not found")
-
-    # Calculate years of experience
-    years_exp = CandidateService.calculate_years_of_experience(candidate.experiences)
-
+def _candidate_detail(candidate) -> CandidateDetail:
+    """Build the detail response from a candidate with loaded relationships."""
     # Get applied position IDs
     applied_positions = [cp.position_id for cp in candidate.candidate_positions]
 
@@ -132,7 +157,9 @@ async def get_candidate(
     ]
 
     documents = [
-        DocumentSchema(type=d.type, name=d.name, url=d.url)
+        DocumentDetailSchema(
+            id=d.id, type=d.type, name=d.name, url=d.url, preview_url=_preview_url(d)
+        )
         for d in candidate.documents
     ]
 
@@ -144,7 +171,7 @@ async def get_candidate(
         location=candidate.location,
         summary=candidate.summary,
         status=candidate.status,
-        years_of_experience=years_exp,
+        years_of_experience=candidate.years_of_experience,
         sort_order=candidate.sort_order,
         experience=experience,
         education=education,
@@ -154,6 +181,348 @@ async def get_candidate(
     )
 
 
+def _preview_url(document: Document) -> Optional[str]:
+    """Preview endpoint of an uploaded document; linked documents have none."""
+    if not document.storage_key:
+        return None
+    return f"{settings.API_V1_PREFIX}/documents/{document.id}/preview"
+
+
+def _document_response(document: Document) -> DocumentResponse:
+    response = DocumentResponse.model_validate(document)
+    response.preview_url = _preview_url(document)
+    return response
+
+
+def _split_candidate_write(candidate_data: CandidateWrite) -> tuple[dict, dict]:
+    """Split a write payload into candidate columns and nested row dicts."""
+    fields = candidate_data.model_dump(
+        exclude={"experience", "education", "skills", "documents"}
+    )
+    nested = {
+        "experiences": [e.model_dump() for e in candidate_data.experience],
+        "education": [e.model_dump() for e in candidate_data.education],
+        "skills": [s.model_dump() for s in candidate_data.skills],
+        "documents": [d.model_dump() for d in candidate_data.documents],
+    }
+    return fields, nested
+
+
+def _index_skills(candidate) -> None:
+    """Bring the skill index up to date with a candidate just written."""
+    skill_index.update_candidate(candidate.id, [(s.skill_id, s.level) for s in candidate.skills])
+
+
+@router.post("", response_model=CandidateDetail, status_code=201)
+async def create_candidate(
+    candidate_data: CandidateWrite,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_editor),
+):
+    """
+    Create a candidate with experience, education, skills and documents.
+
+    Requires editor or admin role.
+    """
+    fields, nested = _split_candidate_write(candidate_data)
+    try:
+        candidate = await CandidateRepository.create_candidate(db, fields, nested)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    _index_skills(candidate)
+    return _candidate_detail(candidate)
+
+
+@router.get("/export")
+async def export_candidates(
+    export_format: ExportFormat = Query("csv", alias="format"),
+    status: Optional[CandidateStatus] = Query(CandidateStatus.ACTIVE),
+    search: Optional[str] = Query(None),
+    search_documents: bool = Query(False, alias="searchDocuments"),
+    skills: Optional[str] = Query(None, max_length=1000),
+    position_id: Optional[str] = Query(None, alias="positionId"),
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_active_user),
+):
+    """
+    Export all candidates matching the list filters as a file.
+
+    - **format**: csv, xlsx or ndjson (default: csv)
+    - **status**, **search**, **searchDocuments**, **skills**, **positionId**: same as
+      the list endpoint
+
+    Rows are streamed from a server-side cursor, so memory stays constant
+    and no total count is computed.
+    """
+    candidate_filter = None
+    if skills is not None:
+        try:
+            candidate_filter = (await skill_index.match(db, skills)).condition
+        except SkillExpressionError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    body = CandidateExportService.export(
+        db.bind,
+        export_format,
+        status=status,
+        search=search,
+        position_id=position_id,
+        candidate_filter=candidate_filter,
+        search_documents=search_documents,
+    )
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="candidates.{export_format}"'
+        },
+    )
+
+
+@router.get("/batch", response_model=CandidateBatchResponse)
+async def get_candidates_batch(
+    ids: str = Query(..., description="Comma-separated candidate IDs"),
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_active_user),
+):
+    """
+    Get several candidates by ID with full details in one request.
+
+    - **ids**: Comma-separated candidate IDs (at most 100; repeats are ignored)
+
+    Candidates are returned in request order and each relationship is
+    loaded once for the whole set. Unknown ids are listed in `missing`.
+    """
+    candidate_ids = list(dict.fromkeys(i.strip() for i in ids.split(",") if i.strip()))
+    if not candidate_ids:
+        raise HTTPException(status_code=400, detail="No candidate ids given")
+    if len(candidate_ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {MAX_BATCH_IDS} candidate ids per request"
+        )
+
+    found = await CandidateRepository.get_candidates_by_ids(db, candidate_ids)
+
+    return CandidateBatchResponse(
+        candidates=[_candidate_detail(found[i]) for i in candidate_ids if i in found],
+        missing=[i for i in candidate_ids if i not in found],
+    )
+
+
+@router.post("/import", response_model=CandidateImportResult)
+async def import_candidates(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_admin),
+):
+    """
+    Bulk import candidates from a CSV or xlsx file (requires admin role).
+
+    The first row holds column names matching the candidate fields (name,
+    email, phone, location, summary, status, sortOrder). Rows are upserted
+    on email in batches; invalid rows are skipped and reported.
+    """
+    try:
+        return await CandidateImportService.import_candidates(
+            db, file.file, file.filename or ""
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/import/jobs", response_model=JobResponse, status_code=202)
+async def start_candidate_import_job(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_admin),
+):
+    """
+    Queue a candidate import to run in the background (requires admin role).
+
+    Accepts the same files as /import but returns immediately; poll
+    GET /jobs/{id} for progress and the import summary.
+    """
+    filename = file.filename or ""
+    try:
+        CandidateImportService.check_format(filename)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    path = await run_in_threadpool(CandidateImportService.spool_upload, file.file, filename)
+    job = await job_runner.submit(
+        db,
+        "candidate_import",
+        {"path": path, "filename": filename},
+        created_by=current_user.id,
+    )
+    return JobResponse.model_validate(job)
+
+
+@router.get("/{candidate_id}", response_model=CandidateDetail)
+async def get_candidate(
+    candidate_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_active_user),
+):
+    """Get a single candidate by ID with full details."""
+    candidate = await CandidateRepository.get_candidate_by_id(db, candidate_id)
+
+    if not candidate:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+
+    return _candidate_detail(candidate)
+
+
+@router.put("/{candidate_id}", response_model=CandidateDetail)
+async def update_candidate(
+    candidate_id: str,
+    candidate_data: CandidateWrite,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_editor),
+):
+    """
+    Update a candidate (requires editor or admin role).
+
+    Replaces all fields and nested collections with the ones sent.
+    """
+    candidate = await CandidateRepository.get_candidate_by_id(db, candidate_id)
+
+    if not candidate:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+
+    fields, nested = _split_candidate_write(candidate_data)
+    try:
+        updated_candidate = await CandidateRepository.update_candidate(
+            db, candidate, fields, nested
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    _index_skills(updated_candidate)
+    return _candidate_detail(updated_candidate)
+
+
+@router.post(
+    "/{candidate_id}/documents",
+    response_model=DocumentResponse,
+    status_code=201,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["file"],
+                        "properties": {
+                            "file": {"type": "string", "format": "binary"},
+                            "type": {"type": "string", "enum": [t.value for t in DocumentType]},
+                            "name": {"type": "string"},
+                        },
+                    }
+                }
+            },
+        }
+    },
+)
+async def upload_document(
+    candidate_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_editor),
+):
+    """
+    Upload a document for a candidate (requires editor or admin role).
+
+    Multipart form with a **file** part plus optional **type** (default CV)
+    and **name** (default: the file name). The body is streamed to
+    STORAGE_PATH as it arrives, with its SHA-256 computed on the way, and
+    stored once per content: a duplicate of an existing file only adds a
+    reference to it. Text extraction for search and the preview are queued
+    in the background.
+    """
+    if not await DocumentRepository.candidate_exists(db, candidate_id):
+        raise HTTPException(status_code=404, detail="Candidate not found")
+    # Release the connection while the body streams in
+    await db.commit()
+
+    max_bytes = settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+    content_length = request.headers.get("content-length", "")
+    # Allow for multipart framing on top of the file itself
+    if content_length.isdigit() and int(content_length) > max_bytes + 64 * 1024:
+        raise HTTPException(status_code=413, detail="File exceeds the upload limit")
+
+    try:
+        upload = await DocumentStorageService.receive_upload(
+            request.headers.get("content-type", ""), request.stream(), max_bytes
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        document_type = DocumentType(upload.fields.get("type") or DocumentType.CV.value)
+    except ValueError:
+        await DocumentStorageService.discard_upload(upload)
+        raise HTTPException(status_code=400, detail="Invalid document type")
+
+    try:
+        document = await DocumentRepository.create_document(
+            db,
+            {
+                "id": upload.document_id,
+                "candidate_id": candidate_id,
+                "type": document_type,
+                "name": upload.fields.get("name") or upload.filename,
+                "url": f"{settings.API_V1_PREFIX}/documents/{upload.document_id}/content",
+                "storage_key": upload.storage_key,
+                "content_type": upload.content_type,
+                "size": upload.size,
+                "checksum": upload.checksum,
+            },
+            place_file=lambda: run_in_threadpool(
+                DocumentStorageService.place_blob, upload.temp_path, upload.storage_key
+            ),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    finally:
+        # Gone already if it became (or duplicated) a blob
+        await DocumentStorageService.discard_upload(upload)
+
+    text_extractor.enqueue(document.id)
+    preview_generator.enqueue(document.id)
+    return _document_response(document)
+
+
+@router.get("/{candidate_id}/documents.zip")
+async def download_candidate_documents(
+    candidate_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Download all of a candidate's uploaded documents as one ZIP archive.
+
+    The archive is written while it is sent, without a temp file or an
+    in-memory copy. Linked (URL-only) documents are not included.
+    """
+    if not await DocumentRepository.candidate_exists(db, candidate_id):
+        raise HTTPException(status_code=404, detail="Candidate not found")
+
+    documents = await DocumentRepository.get_stored_documents(db, candidate_id=candidate_id)
+    entries = DocumentArchiveService.candidate_entries(documents)
+    return StreamingResponse(
+        DocumentArchiveService.stream_zip(entries),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="candidate-{candidate_id}-documents.zip"'
+        },
+    )
+
+
 @router.post("/{candidate_id}/positions/{position_id}", status_code=201)
 async def add_position_to_candidate(
     candidate_id: str,
@@ -0,0 +1,156 @@
+"""Documents API endpoints."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.api.deps import get_current_active_user, require_editor
+from app.core.etag import format_etag, if_none_match
+from app.core.ranges import FileRangeResponse, RangeNotSatisfiableError, parse_range
+from app.db.session import get_db
+from app.models.preview import PreviewKind
+from app.repositories.document import DocumentRepository
+from app.services.document_preview import MEDIA_TYPES as PREVIEW_MEDIA_TYPES
+from app.services.document_preview import preview_generator
+from app.services.document_storage import DocumentStorageService
+
+router = APIRouter()
+
+
+@router.api_route("/{document_id}/content", methods=["GET", "HEAD"])
+async def get_document_content(
+    document_id: str,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    if_range: Optional[str] = Header(None, alias="If-Range"),
+    if_none_match_header: Optional[str] = Header(None, alias="If-None-Match"),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Download an uploaded document's file.
+
+    The strong ETag is the stored SHA-256, so If-None-Match answers 304
+    without touching the file. A single byte Range is served as 206 (or 416
+    past the end); If-Range falls back to the whole file when the ETag no
+    longer matches. Whole files go out through the server's zero-copy
+    pathsend extension where available.
+    """
+    document = await DocumentRepository.get_document_by_id(db, document_id)
+
+    if not document:
+        raise HTTPException(status_code=404, detail="Document not found")
+    if not document.storage_key:
+        raise HTTPException(status_code=404, detail="Document has no stored content")
+
+    etag = format_etag(document.checksum)
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, no-cache",
+    }
+    if if_none_match_header and if_none_match(if_none_match_header, etag):
+        return Response(status_code=304, headers=headers)
+
+    path = DocumentStorageService.path_for(document.storage_key)
+    try:
+        stat_result = await run_in_threadpool(path.stat)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Document content is missing")
+
+    size = stat_result.st_size
+    file_options = {
+        "headers": headers,
+        "media_type": document.content_type,
+        "filename": document.name,
+        "content_disposition_type": "inline",
+    }
+    if range_header and (if_range is None or if_range.strip() == etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except RangeNotSatisfiableError:
+            raise HTTPException(
+                status_code=416,
+                detail="Range not satisfiable",
+                headers={"Content-Range": f"bytes */{size}"},
+            )
+        if byte_range is not None:
+            return FileRangeResponse(path, *byte_range, size, **file_options)
+
+    return FileResponse(path, stat_result=stat_result, **file_options)
+
+
+@router.get("/{document_id}/preview")
+async def get_document_preview(
+    document_id: str,
+    if_none_match_header: Optional[str] = Header(None, alias="If-None-Match"),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Get a preview of an uploaded document's first page.
+
+    A PNG for PDFs and images, a text snippet for DOCX and text files.
+    Previews are generated on upload, or on first request for documents
+    stored before then. A document's content never changes, so the
+    response may be cached for a year.
+    """
+    document = await DocumentRepository.get_document_by_id(db, document_id)
+
+    if not document:
+        raise HTTPException(status_code=404, detail="Document not found")
+    if not document.storage_key:
+        raise HTTPException(status_code=404, detail="Document has no stored content")
+
+    etag = format_etag(f"{document.checksum}-preview")
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=31536000, immutable"}
+    if if_none_match_header and if_none_match(if_none_match_header, etag):
+        return Response(status_code=304, headers=headers)
+
+    preview = await preview_generator.get_or_create(db, document)
+    if preview is None:
+        raise HTTPException(
+            status_code=503, detail="Preview is being generated", headers={"Retry-After": "1"}
+        )
+    if preview.kind == PreviewKind.UNAVAILABLE:
+        raise HTTPException(status_code=404, detail="No preview available for this document")
+
+    path = DocumentStorageService.preview_path(
+        DocumentStorageService.path_for(document.storage_key), preview.kind.value
+    )
+    try:
+        stat_result = await run_in_threadpool(path.stat)
+    except FileNotFoundError:
+        # Evicted by a concurrent request since it was generated
+        raise HTTPException(
+            status_code=503, detail="Preview is being generated", headers={"Retry-After": "1"}
+        )
+    return FileResponse(
+        path,
+        stat_result=stat_result,
+        headers=headers,
+        media_type=PREVIEW_MEDIA_TYPES[preview.kind],
+    )
+
+
+@router.delete("/{document_id}")
+async def delete_document(
+    document_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_editor),
+):
+    """
+    Delete a document (requires editor or admin role).
+
+    Its stored file is shared with identical uploads, so it is only removed
+    by garbage collection once no document references it.
+    """
+    document = await DocumentRepository.get_document_by_id(db, document_id)
+
+    if not document:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    await DocumentRepository.delete_document(db, document)
+    return {"message": "Document deleted"}
@@ -0,0 +1,33 @@
+"""Background jobs API endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_active_user
+from app.db.session import get_db
+from app.models.user import UserRole
+from app.repositories.job import JobRepository
+from app.schemas.job import JobResponse
+
+router = APIRouter()
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Get a background job's status, progress and result.
+
+    Visible to the user who started it and to admins.
+    """
+    job = await JobRepository.get_job_by_id(db, job_id)
+
+    if not job or (
+        job.created_by != current_user.id and current_user.role != UserRole.ADMIN
+    ):
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return JobResponse.model_validate(job)
@@ -2,19 +2,35 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user, require_editor
+from app.core.etag import if_match as etag_if_match
+from app.core.etag import version_etag
 from app.db.session import get_db
 from app.models.position import PositionStatus
+from app.repositories.candidate_position import CandidatePositionRepository
+from app.repositories.document import DocumentRepository
 from app.repositories.position import PositionRepository
+from app.repositories.position_score import PositionScoreRepository
 from app.schemas.position import (
+    CandidateAssignmentResult,
+    CandidateMatchItem,
+    PositionCandidatesRequest,
+    PositionCandidatesResponse,
     PositionDetail,
+    PositionDetailWithTopCandidates,
     PositionListItem,
     PositionListResponse,
+    PositionMatchesResponse,
+    PositionPatch,
     PositionUpdate,
+    TopCandidateItem,
 )
+from app.services.document_archive import DocumentArchiveService
+from app.services.matching import matching_service
 
 router = APIRouter()
 
@@ -72,18 +88,8 @@ async def list_positions(
     return PositionListResponse(positions=position_list, total=total)
 
 
-@router.get("/{position_id}", response_model=PositionDetail)
-async def get_position(
-    position_id: str,
-    db: AsyncSession = Depends(get_db),
-    current_user=Depends(get_current_active_user),
-):
-    """Get a single position by ID with full details."""
-    position = await PositionRepository.get_position_by_id(db, position_id)
-
-    if not position:
-        raise HTTPException(status_code=404, detail="Position not found")
-
+def _position_detail(position) -> PositionDetail:
+    """Build the detail response from a position with loaded relationships."""
     # Get required skill names
     required_skills = [skill.name for skill in position.required_skills]
 
@@ -106,10 +112,101 @@ async def get_position(
     )
 
 
+@router.get("/{position_id}", response_model=PositionDetailWithTopCandidates)
+async def get_position(
+    position_id: str,
+    response: Response,
+    top: int = Query(10, ge=0, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Get a single position by ID with full details.
+
+    - **top**: Number of best-ranked candidates to include (0 for none)
+
+    Top candidates are read from the stored scores, which writes keep
+    current; nothing is scored on this request. The ETag header carries
+    the position version for use with PATCH If-Match.
+    """
+    position = await PositionRepository.get_position_by_id(db, position_id)
+
+    if not position:
+        raise HTTPException(status_code=404, detail="Position not found")
+
+    top_candidates = await PositionScoreRepository.get_top(db, position_id, top)
+    response.headers["ETag"] = version_etag(position.updated_at)
+    return PositionDetailWithTopCandidates(
+        **_position_detail(position).model_dump(),
+        top_candidates=[TopCandidateItem(**row) for row in top_candidates],
+    )
+
+
+@router.get("/{position_id}/documents.zip")
+async def download_position_documents(
+    position_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Download the uploaded documents of every candidate linked to a position.
+
+    One ZIP archive with a folder per candidate, written while it is sent
+    without a temp file or an in-memory copy.
+    """
+    if not await DocumentRepository.position_exists(db, position_id):
+        raise HTTPException(status_code=404, detail="Position not found")
+
+    documents = await DocumentRepository.get_stored_documents(db, position_id=position_id)
+    entries = DocumentArchiveService.position_entries(documents)
+    return StreamingResponse(
+        DocumentArchiveService.stream_zip(entries),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="position-{position_id}-documents.zip"'
+        },
+    )
+
+
+@router.get("/{position_id}/matches", response_model=PositionMatchesResponse)
+async def get_position_matches(
+    position_id: str,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """
+    Rank active candidates against a position's requirements.
+
+    Scores combine the level at which each required skill is held with
+    experience relative to the minimum; every active candidate is scored
+    in one vectorized pass over a cached skill matrix.
+
+    - **limit**: Number of candidates to return (default: 20, max: 100)
+    """
+    position = await PositionRepository.get_position_by_id(db, position_id)
+
+    if not position:
+        raise HTTPException(status_code=404, detail="Position not found")
+
+    matches, scored = await matching_service.top_matches(
+        db,
+        [(skill.name, skill.skill_id) for skill in position.required_skills],
+        position.min_experience_years,
+        limit,
+    )
+    return PositionMatchesResponse(
+        position_id=position.id,
+        matches=[CandidateMatchItem.model_validate(match) for match in matches],
+        scored=scored,
+    )
+
+
 @router.put("/{position_id}", response_model=PositionDetail)
 async def update_position(
     position_id: str,
     position_data: PositionUpdate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(require_editor),
 ):
@@ -138,27 +235,116 @@ async def update_position(
         required_skills=position_data.required_skills,
     )
 
-    # Reload to get updated skills
-    await db.refresh(updated_position)
+    # Built from the in-memory state; update_position keeps it in sync
+    response.headers["ETag"] = version_etag(updated_position.updated_at)
+    return _position_detail(updated_position)
+
+
+@router.patch("/{position_id}", response_model=PositionDetail)
+async def patch_position(
+    position_id: str,
+    position_data: PositionPatch,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_editor),
+):
+    """
+    Partially update a position (requires editor or admin role).
+
+    Only the fields sent are changed; required skills are left alone unless
+    requiredSkills is given. The If-Match header must carry the ETag from a
+    previous read: a stale ETag returns 412 instead of overwriting another
+    editor's changes.
+    """
+    if if_match is None:
+        raise HTTPException(status_code=428, detail="If-Match header required")
+
     position = await PositionRepository.get_position_by_id(db, position_id)
 
-    # Get required skill names
-    required_skills = [skill.name for skill in position.required_skills]
+    if not position:
+        raise HTTPException(status_code=404, detail="Position not found")
 
-    # Get candidate IDs
-    candidate_ids = [cp.candidate_id for cp in position.candidate_positions]
+    stale_exception = HTTPException(
+        status_code=412, detail="Position was modified by another request"
+    )
+    if not etag_if_match(if_match, version_etag(position.updated_at)):
+        raise stale_exception
 
-    return PositionDetail(
-        id=position.id,
-        title=position.title,
-        department=position.department,
-        location=position.location,
-        description=position.description,
-        requirements=position.requirements,
-        required_skills=required_skills,
-        min_experience_years=position.min_experience_years,
-        status=position.status,
-        posted_date=position.posted_date,
-        candidates=candidate_ids,
-        sort_order=position.sort_order,
+    changes = position_data.model_dump(exclude_unset=True, exclude={"required_skills"})
+    required_skills = (
+        position_data.required_skills
+        if "required_skills" in position_data.model_fields_set
+        else None
+    )
+
+    if changes or required_skills is not None:
+        updated = await PositionRepository.patch_position(
+            db, position, changes, required_skills
+        )
+        if not updated:
+            raise stale_exception
+
+    response.headers["ETag"] = version_etag(position.updated_at)
+    return _position_detail(position)
+
+
+@router.post("/{position_id}/candidates", response_model=PositionCandidatesResponse)
+async def add_candidates_to_position(
+    position_id: str,
+    request: PositionCandidatesRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_editor),
+):
+    """
+    Assign many candidates to a position in one transaction.
+
+    Returns a per-candidate outcome: added, already_assigned or not_found.
+    Requires editor or admin role.
+    """
+    try:
+        outcomes = await CandidatePositionRepository.add_candidates_to_position(
+            db, position_id, request.candidate_ids
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    if outcomes is None:
+        raise HTTPException(status_code=404, detail="Position not found")
+
+    return PositionCandidatesResponse(
+        position_id=position_id,
+        results=[
+            CandidateAssignmentResult(candidate_id=candidate_id, status=outcome)
+            for candidate_id, outcome in outcomes.items()
+        ],
+    )
+
+
+@router.delete("/{position_id}/candidates", response_model=PositionCandidatesResponse)
+async def remove_candidates_from_position(
+    position_id: str,
+    request: PositionCandidatesRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(require_editor),
+):
+    """
+    Unassign many candidates from a position in one transaction.
+
+    Returns a per-candidate outcome: removed or not_assigned.
+    Requires editor or admin role.
+    """
+    outcomes = await CandidatePositionRepository.remove_candidates_from_position(
+        db, position_id, request.candidate_ids
+    )
+
+    if outcomes is None:
+        raise HTTPException(status_code=404, detail="Position not found")
+
+    return PositionCandidatesResponse(
+        position_id=position_id,
+        results=[
+            CandidateAssignmentResult(candidate_id=candidate_id, status=outcome)
+            for candidate_id, outcome in outcomes.items()
+        ],
     )
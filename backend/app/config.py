@@ -23,6 +23,28 @@ class Settings(BaseSettings):
 
     # Storage
     STORAGE_PATH: str = "./storage/documents"
+    MAX_UPLOAD_SIZE_MB: int = 100
+
+    # Background jobs
+    JOB_WORKERS: int = 2
+
+    # Document text extraction
+    EXTRACTION_WORKERS: int = 2
+    EXTRACTION_QUEUE_SIZE: int = 1000
+    EXTRACTION_TIMEOUT_SECONDS: float = 30.0
+
+    # Document previews
+    PREVIEW_WORKERS: int = 1
+    PREVIEW_QUEUE_SIZE: int = 1000
+    PREVIEW_TIMEOUT_SECONDS: float = 30.0
+    PREVIEW_WIDTH: int = 600
+    PREVIEW_CACHE_MB: int = 1024
+
+    # Skill index (rebuilt periodically to pick up writes from other processes)
+    SKILL_INDEX_REFRESH_SECONDS: float = 300.0
+
+    # Stored years of experience (current roles count up to today)
+    EXPERIENCE_REFRESH_HOURS: float = 24.0
 
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, extra="ignore")
 
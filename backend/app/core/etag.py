@@ -0,0 +1,39 @@
+"""Entity tag helpers for conditional requests (If-Match / If-None-Match)."""
+
+from datetime import datetime, timedelta, timezone
+
+
+def format_etag(value: str, weak: bool = False) -> str:
+    """Quote an opaque value as an ETag header value."""
+    return f'{"W/" if weak else ""}"{value}"'
+
+
+def version_etag(updated_at: datetime) -> str:
+    """Build a strong ETag from a row's updated_at timestamp."""
+    micros = int(updated_at.replace(tzinfo=timezone.utc).timestamp() * 1_000_000)
+    return format_etag(f"v{micros}")
+
+
+def next_version(previous: datetime) -> datetime:
+    """
+    Return a new updated_at value strictly later than previous.
+
+    Values are whole seconds so the in-memory value equals what MySQL stores
+    in a DATETIME column (which has no fractional seconds), keeping ETags
+    stable across reloads. Rapid edits are spaced a second apart so every
+    write still yields a new version.
+    """
+    now = datetime.utcnow().replace(microsecond=0)
+    return max(now, previous.replace(microsecond=0) + timedelta(seconds=1))
+
+
+def if_match(header: str, etag: str) -> bool:
+    """Evaluate an If-Match header (strong comparison) against an ETag."""
+    tags = [part.strip() for part in header.split(",")]
+    return "*" in tags or (not etag.startswith("W/") and etag in tags)
+
+
+def if_none_match(header: str, etag: str) -> bool:
+    """Return True if an If-None-Match header matches (weak comparison)."""
+    tags = [part.strip().removeprefix("W/") for part in header.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
@@ -1,11 +1,47 @@
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
 
 from app.config import settings
 
+
+def create_engine(url: str, **kwargs) -> AsyncEngine:
+    """
+    Create an async engine for MySQL (aiomysql) or SQLite (aiosqlite).
+
+    SQLite needs foreign key enforcement switched on per connection, and an
+    in-memory database must share a single connection to be visible at all.
+    File databases use WAL journaling so readers do not block the single
+    writer.
+    """
+    if url.startswith("sqlite") and ":memory:" in url:
+        kwargs.setdefault("poolclass", StaticPool)
+        kwargs.setdefault("connect_args", {"check_same_thread": False})
+
+    new_engine = create_async_engine(url, **kwargs)
+
+    if new_engine.dialect.name == "sqlite":
+
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            if ":memory:" not in url:
+                cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.close()
+
+    return new_engine
+
+
 # Create async engine
-engine = create_async_engine(
+engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
@@ -1,10 +1,42 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
+from app.services.document_preview import preview_generator
+from app.services.experience_refresh import experience_refresher
+from app.services.jobs import job_runner
+from app.services.skill_index import skill_index
+from app.services.text_extraction import text_extractor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Run the background workers and periodic refreshes for the app's lifetime.
+
+    Startup is inside the try, so whatever started before a failure is
+    stopped again; each stop() is a no-op for a service that never started.
+    """
+    try:
+        await job_runner.start()
+        await text_extractor.start()
+        await preview_generator.start()
+        await skill_index.start()
+        await experience_refresher.start()
+        yield
+    finally:
+        await experience_refresher.stop()
+        await skill_index.stop()
+        await preview_generator.stop()
+        await text_extractor.stop()
+        await job_runner.stop()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
+    lifespan=lifespan,
     debug=settings.DEBUG,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url=f"{settings.API_V1_PREFIX}/docs",
@@ -44,8 +76,11 @@ async def health():
 
 
 # Import and include routers
-from app.api.v1 import auth, candidates, positions
+from app.api.v1 import analytics, auth, candidates, documents, jobs, positions
 
 app.include_router(auth.router, prefix=f"{settings.API_V1_PREFIX}/auth", tags=["auth"])
 app.include_router(candidates.router, prefix=f"{settings.API_V1_PREFIX}/candidates", tags=["candidates"])
 app.include_router(positions.router, prefix=f"{settings.API_V1_PREFIX}/positions", tags=["positions"])
+app.include_router(documents.router, prefix=f"{settings.API_V1_PREFIX}/documents", tags=["documents"])
+app.include_router(jobs.router, prefix=f"{settings.API_V1_PREFIX}/jobs", tags=["jobs"])
+app.include_router(analytics.router, prefix=f"{settings.API_V1_PREFIX}/analytics", tags=["analytics"])
@@ -1,12 +1,24 @@
 # Import all models for Alembic to detect
+from app.models.blob import Blob
 from app.models.candidate import Candidate, CandidateStatus
 from app.models.candidate_position import CandidatePosition
 from app.models.document import Document, DocumentType
+from app.models.document_text import DocumentText, ExtractionStatus
 from app.models.education import Education
 from app.models.experience import Experience
+from app.models.job import Job, JobStatus
+from app.models.pipeline_stats import (
+    PipelineDepartmentApplications,
+    PipelineDepartmentPositions,
+    PipelineOpenings,
+    PipelinePositionStats,
+)
 from app.models.position import Position, PositionStatus
+from app.models.position_candidate_score import PositionCandidateScore
 from app.models.position_skill import PositionSkill
+from app.models.preview import Preview, PreviewKind
 from app.models.skill import Skill, SkillLevel
+from app.models.skill_catalog import SkillAlias, SkillCatalog
 from app.models.user import User, UserRole
 
 __all__ = [
@@ -20,8 +32,22 @@ __all__ = [
     "Education",
     "Skill",
     "SkillLevel",
+    "SkillCatalog",
+    "SkillAlias",
     "Document",
     "DocumentType",
+    "DocumentText",
+    "ExtractionStatus",
+    "Blob",
+    "Preview",
+    "PreviewKind",
     "PositionSkill",
+    "PositionCandidateScore",
     "CandidatePosition",
+    "PipelinePositionStats",
+    "PipelineDepartmentPositions",
+    "PipelineDepartmentApplications",
+    "PipelineOpenings",
+    "Job",
+    "JobStatus",
 ]
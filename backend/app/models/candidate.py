@@ -2,7 +2,7 @@ import enum
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import DateTime, Enum, Integer, String, Text
+from sqlalchemy import DateTime, Enum, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -35,6 +35,10 @@ class Candidate(Base):
         default=CandidateStatus.ACTIVE
     )
     sort_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Derived fields, rewritten with every CandidateRepository write; rows
+    # written elsewhere need CandidateRepository.refresh_derived_fields
+    years_of_experience: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    search_text: Mapped[str] = mapped_column(Text, nullable=False, default="")
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False
     )
@@ -60,5 +64,10 @@ class Candidate(Base):
         "CandidatePosition", back_populates="candidate", cascade="all, delete-orphan"
     )
 
+    # Matches the list query: WHERE status = ? ORDER BY sort_order, name
+    __table_args__ = (
+        Index("ix_candidates_status_sort_order_name", "status", "sort_order", "name"),
+    )
+
     def __repr__(self) -> str:
         return f"<Candidate {self.name} ({self.email})>"
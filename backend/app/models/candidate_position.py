@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -29,9 +29,11 @@ class CandidatePosition(Base):
     candidate: Mapped["Candidate"] = relationship("Candidate", back_populates="candidate_positions")
     position: Mapped["Position"] = relationship("Position", back_populates="candidate_positions")
 
-    # Ensure unique candidate-position pairs
+    # Ensure unique candidate-position pairs; the reverse composite covers
+    # the positionId filter on the candidate list
     __table_args__ = (
         UniqueConstraint("candidate_id", "position_id", name="uq_candidate_position"),
+        Index("ix_candidate_positions_position_candidate", "position_id", "candidate_id"),
     )
 
     def __repr__(self) -> str:
@@ -1,8 +1,9 @@
 import enum
 from datetime import datetime
+from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String
+from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -33,6 +34,12 @@ class Document(Base):
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     url: Mapped[str] = mapped_column(String(512), nullable=False)
+    # Set for files uploaded into STORAGE_PATH (storage_key is the blob path
+    # derived from checksum); external links leave them empty
+    storage_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    content_type: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    checksum: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     uploaded_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False
     )
@@ -40,5 +47,9 @@ class Document(Base):
     # Relationships
     candidate: Mapped["Candidate"] = relationship("Candidate", back_populates="documents")
 
+    __table_args__ = (
+        Index("ix_documents_checksum", "checksum"),
+    )
+
     def __repr__(self) -> str:
         return f"<Document {self.name} ({self.type})>"
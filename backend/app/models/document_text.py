@@ -0,0 +1,48 @@
+import enum
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ExtractionStatus(str, enum.Enum):
+    """Document text extraction outcome."""
+    EXTRACTED = "extracted"
+    UNSUPPORTED = "unsupported"
+    FAILED = "failed"
+
+
+class DocumentText(Base):
+    """Plain text extracted from an uploaded document, used by search."""
+
+    __tablename__ = "document_texts"
+
+    document_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("documents.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Denormalized so search can go straight from text to candidate
+    candidate_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False
+    )
+    status: Mapped[ExtractionStatus] = mapped_column(
+        Enum(ExtractionStatus, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+    )
+    content: Mapped[str] = mapped_column(
+        Text().with_variant(MEDIUMTEXT(), "mysql"), nullable=False, default=""
+    )
+    error: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    extracted_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_document_texts_candidate_id", "candidate_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<DocumentText {self.document_id} ({self.status})>"
@@ -0,0 +1,78 @@
+from datetime import date
+
+from sqlalchemy import Date, Enum, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.candidate import CandidateStatus
+from app.models.position import PositionStatus
+
+# Rollups behind the pipeline analytics. PipelineRepository applies deltas
+# when applications change and recomputes the affected rows when candidate
+# status or positions change; groups that drop to zero have no row.
+
+
+class PipelinePositionStats(Base):
+    """Number of applications (candidate_positions rows) per position."""
+
+    __tablename__ = "pipeline_position_stats"
+
+    position_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("positions.id", ondelete="CASCADE"), primary_key=True
+    )
+    applications: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Busiest positions first
+    __table_args__ = (
+        Index("ix_pipeline_position_stats_applications", "applications"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<PipelinePositionStats {self.position_id}: {self.applications}>"
+
+
+class PipelineDepartmentPositions(Base):
+    """Number of positions per department and position status."""
+
+    __tablename__ = "pipeline_department_positions"
+
+    department: Mapped[str] = mapped_column(String(255), primary_key=True)
+    status: Mapped[PositionStatus] = mapped_column(
+        Enum(PositionStatus, values_callable=lambda x: [e.value for e in x]),
+        primary_key=True,
+    )
+    positions: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<PipelineDepartmentPositions {self.department} {self.status}: {self.positions}>"
+
+
+class PipelineDepartmentApplications(Base):
+    """Number of applications per department and applicant (candidate) status."""
+
+    __tablename__ = "pipeline_department_applications"
+
+    department: Mapped[str] = mapped_column(String(255), primary_key=True)
+    candidate_status: Mapped[CandidateStatus] = mapped_column(
+        Enum(CandidateStatus, values_callable=lambda x: [e.value for e in x]),
+        primary_key=True,
+    )
+    applications: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PipelineDepartmentApplications {self.department} "
+            f"{self.candidate_status}: {self.applications}>"
+        )
+
+
+class PipelineOpenings(Base):
+    """Number of positions posted per day."""
+
+    __tablename__ = "pipeline_openings"
+
+    posted_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    positions: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<PipelineOpenings {self.posted_date}: {self.positions}>"
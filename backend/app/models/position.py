@@ -2,7 +2,7 @@ import enum
 from datetime import date, datetime
 from uuid import uuid4
 
-from sqlalchemy import Date, DateTime, Enum, Integer, String, Text
+from sqlalchemy import Date, DateTime, Enum, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -52,5 +52,10 @@ class Position(Base):
         "CandidatePosition", back_populates="position", cascade="all, delete-orphan"
     )
 
+    # Matches the list query: WHERE status = ? ORDER BY sort_order, title
+    __table_args__ = (
+        Index("ix_positions_status_sort_order_title", "status", "sort_order", "title"),
+    )
+
     def __repr__(self) -> str:
         return f"<Position {self.title} ({self.department})>"
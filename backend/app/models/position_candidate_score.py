@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class PositionCandidateScore(Base):
+    """
+    Materialized match score of an active candidate for an open position.
+
+    Only pairs where the candidate holds at least one of the position's
+    required skills are stored; rows are rewritten when either side's
+    scoring inputs change.
+    """
+
+    __tablename__ = "position_candidate_scores"
+
+    position_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("positions.id", ondelete="CASCADE"), primary_key=True
+    )
+    candidate_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True
+    )
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    skill_score: Mapped[float] = mapped_column(Float, nullable=False)
+    experience_score: Mapped[float] = mapped_column(Float, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+    # Top-N per position is an index range scan; candidate refreshes
+    # delete by candidate
+    __table_args__ = (
+        Index("ix_position_candidate_scores_position_score", "position_id", "score"),
+        Index("ix_position_candidate_scores_candidate_id", "candidate_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<PositionCandidateScore {self.position_id} {self.candidate_id} {self.score}>"
@@ -1,6 +1,7 @@
+from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -18,9 +19,18 @@ class PositionSkill(Base):
         String(36), ForeignKey("positions.id", ondelete="CASCADE"), nullable=False
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Canonical skill the name resolves to; set on write
+    skill_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("skill_catalog.id"), nullable=True
+    )
 
     # Relationships
     position: Mapped["Position"] = relationship("Position", back_populates="required_skills")
 
+    __table_args__ = (
+        Index("ix_position_skills_position_name", "position_id", "name"),
+        Index("ix_position_skills_skill_id_position", "skill_id", "position_id"),
+    )
+
     def __repr__(self) -> str:
         return f"<PositionSkill {self.name}>"
@@ -0,0 +1,50 @@
+import enum
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class PreviewKind(str, enum.Enum):
+    """What a document preview holds."""
+    IMAGE = "image"
+    TEXT = "text"
+    UNAVAILABLE = "unavailable"
+
+
+class Preview(Base):
+    """
+    Cached first-page preview of a stored file, next to its blob.
+
+    Keyed by content like the blob, so identical uploads share a preview.
+    accessed_at drives least-recently-used eviction from the preview cache.
+    """
+
+    __tablename__ = "previews"
+
+    sha256: Mapped[str] = mapped_column(
+        String(64), ForeignKey("blobs.sha256", ondelete="CASCADE"), primary_key=True
+    )
+    kind: Mapped[PreviewKind] = mapped_column(
+        Enum(PreviewKind, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+    )
+    # Bytes on disk; 0 for unavailable previews, which have no file
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    error: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    accessed_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_previews_accessed_at", "accessed_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<Preview {self.sha256} ({self.kind})>"
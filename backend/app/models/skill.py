@@ -1,7 +1,8 @@
 import enum
+from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import Enum, ForeignKey, String
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -27,6 +28,10 @@ class Skill(Base):
         String(36), ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Canonical skill the name resolves to; set on write
+    skill_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("skill_catalog.id"), nullable=True
+    )
     level: Mapped[SkillLevel] = mapped_column(
         Enum(SkillLevel, values_callable=lambda x: [e.value for e in x]),
         nullable=False
@@ -35,5 +40,12 @@ class Skill(Base):
     # Relationships
     candidate: Mapped["Candidate"] = relationship("Candidate", back_populates="skills")
 
+    # Covers the skill search subquery: SELECT candidate_id WHERE name LIKE ?
+    # and joins on the canonical skill
+    __table_args__ = (
+        Index("ix_skills_name_candidate", "name", "candidate_id"),
+        Index("ix_skills_skill_id_candidate", "skill_id", "candidate_id"),
+    )
+
     def __repr__(self) -> str:
         return f"<Skill {self.name} ({self.level})>"
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+
+class SkillCatalog(Base):
+    """A canonical skill that free-text skill names resolve to."""
+
+    __tablename__ = "skill_catalog"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # Display name, e.g. "JavaScript"
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    # normalize_skill(name); keeps concurrent writers from creating duplicates
+    normalized_name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+    # Relationships
+    aliases: Mapped[list["SkillAlias"]] = relationship(
+        "SkillAlias", back_populates="skill", cascade="all, delete-orphan"
+    )
+
+    def __repr__(self) -> str:
+        return f"<SkillCatalog {self.id} {self.name}>"
+
+
+class SkillAlias(Base):
+    """A normalized spelling ("js", "javascript es6") of a catalog skill."""
+
+    __tablename__ = "skill_aliases"
+
+    alias: Mapped[str] = mapped_column(String(255), primary_key=True)
+    skill_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("skill_catalog.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # Relationships
+    skill: Mapped["SkillCatalog"] = relationship("SkillCatalog", back_populates="aliases")
+
+    __table_args__ = (
+        Index("ix_skill_aliases_skill_id", "skill_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SkillAlias {self.alias} -> {self.skill_id}>"
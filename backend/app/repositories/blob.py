@@ -0,0 +1,100 @@
+"""Blob repository for content-addressed document storage."""
+
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.blob import Blob
+from app.models.document import Document
+
+
+class BlobRepository:
+    """Data access layer for stored file contents and their reference counts."""
+
+    @staticmethod
+    async def add_reference(db: AsyncSession, sha256: str, size: int) -> None:
+        """
+        Count one more document using a blob, creating its row if needed.
+
+        A single upsert, which also locks the row until the caller commits,
+        so garbage collection cannot remove the blob in between. Does not
+        commit.
+        """
+        values = {"sha256": sha256, "size": size, "ref_count": 1, "created_at": datetime.utcnow()}
+        dialect = db.get_bind().dialect.name
+        if dialect == "sqlite":
+            stmt = sqlite_insert(Blob).values(values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["sha256"], set_={"ref_count": Blob.ref_count + 1}
+            )
+        elif dialect == "mysql":
+            stmt = mysql_insert(Blob).values(values)
+            stmt = stmt.on_duplicate_key_update(ref_count=Blob.ref_count + 1)
+        else:
+            stmt = insert(Blob).values(values)
+        await db.execute(stmt)
+
+    @staticmethod
+    async def release_reference(db: AsyncSession, sha256: str) -> None:
+        """Count one document fewer using a blob. Does not commit."""
+        await db.execute(
+            update(Blob)
+            .where(Blob.sha256 == sha256, Blob.ref_count > 0)
+            .values(ref_count=Blob.ref_count - 1)
+        )
+
+    @staticmethod
+    async def get_unreferenced(db: AsyncSession, limit: int) -> list[str]:
+        """Up to limit blobs that no document references."""
+        result = await db.execute(
+            select(Blob.sha256).where(Blob.ref_count == 0).order_by(Blob.sha256).limit(limit)
+        )
+        return list(result.scalars())
+
+    @staticmethod
+    async def delete_unreferenced(db: AsyncSession, candidates: list[str]) -> list[str]:
+        """
+        Delete the candidate blobs that are still unreferenced.
+
+        The DELETE re-checks ref_count, so a blob referenced again since it
+        was listed survives. Returns the hashes actually deleted; their rows
+        stay locked until the caller commits, which it should do only after
+        removing the files. Does not commit.
+        """
+        await db.execute(
+            delete(Blob).where(Blob.sha256.in_(candidates), Blob.ref_count == 0)
+        )
+        remaining = await db.execute(select(Blob.sha256).where(Blob.sha256.in_(candidates)))
+        return sorted(set(candidates) - set(remaining.scalars()))
+
+    @staticmethod
+    async def existing(db: AsyncSession, hashes: list[str]) -> set[str]:
+        """Which of the given hashes have a blob row."""
+        result = await db.execute(select(Blob.sha256).where(Blob.sha256.in_(hashes)))
+        return set(result.scalars())
+
+    @staticmethod
+    async def recount_references(db: AsyncSession) -> int:
+        """
+        Recompute every ref_count from the documents table and commit.
+
+        Repairs counts that drifted because documents were removed outside
+        the repositories (e.g. by a cascading candidate delete). Returns the
+        number of blobs whose count changed.
+        """
+        actual = (
+            select(func.count())
+            .where(Document.checksum == Blob.sha256, Document.storage_key.is_not(None))
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            update(Blob)
+            .where(Blob.ref_count != actual)
+            .values(ref_count=actual)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return result.rowcount
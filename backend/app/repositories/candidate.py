@@ -1,14 +1,50 @@
 """Candidate repository for database operations."""
 
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Optional
+from uuid import uuid4
 
-from sqlalchemy import or_, select, func
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    bindparam,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.session import make_transient_to_detached
 
 from app.models.candidate import Candidate, CandidateStatus
 from app.models.candidate_position import CandidatePosition
-from app.models.skill import Skill
+from app.models.document import Document
+from app.models.document_text import DocumentText
+from app.models.education import Education
+from app.models.experience import Experience
+from app.models.skill import Skill, SkillLevel
+from app.repositories.pipeline import PipelineRepository
+from app.repositories.position_score import PositionScoreRepository
+from app.repositories.skill_catalog import SkillCatalogRepository
+from app.services.candidate import CandidateService
+from app.services.skill_catalog import normalize_skill
+
+# Candidate relationship name -> model for the nested collections written
+# together with the candidate
+NESTED_COLLECTIONS = {
+    "experiences": Experience,
+    "education": Education,
+    "skills": Skill,
+    "documents": Document,
+}
 
 
 class CandidateRepository:
@@ -22,40 +58,73 @@ class CandidateRepository:
         position_id: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        candidate_filter: Optional[ColumnElement[bool]] = None,
+        search_documents: bool = False,
     ) -> tuple[list[Candidate], int]:
         """
         Get candidates with filters and pagination.
 
+        candidate_filter, if given, is an extra condition on candidates (the
+        skills filter, as resolved by the skill index).
+        search_documents also matches search against extracted document
+        text, which scans every document_texts row.
+
         Returns tuple of (candidates, total_count).
         """
         # Base query
         query = select(Candidate).options(
-            selectinload(Candidate.experiences),
             selectinload(Candidate.skills),
             selectinload(Candidate.candidate_positions),
         )
 
+        query = CandidateRepository._apply_filters(
+            query, status, search, position_id, candidate_filter, search_documents
+        )
+
+        # Get total count (before pagination)
+        count_query = select(func.count()).select_from(query.subquery())
+        total_result = await db.execute(count_query)
+        total = total_result.scalar() or 0
+
+        # Apply pagination and ordering
+        query = query.order_by(Candidate.sort_order, Candidate.name)
+        query = query.limit(limit).offset(offset)
+
+        # Execute query
+        result = await db.execute(query)
+        candidates = result.scalars().all()
+
+        return list(candidates), total
+
+    @staticmethod
+    def _apply_filters(
+        query: Select,
+        status: Optional[CandidateStatus],
+        search: Optional[str],
+        position_id: Optional[str],
+        candidate_filter: Optional[ColumnElement[bool]] = None,
+        search_documents: bool = False,
+    ) -> Select:
+        """Apply the list endpoint filters to a query over candidates."""
         # Filter by status
         if status:
             query = query.where(Candidate.status == status)
 
-        # Search by name, email, or skill
+        # Search by name, email or skill, matched in the stored lowercase
+        # search_text, so no join to skills is needed
         if search:
-            search_term = f"%{search}%"
+            search_filter = Candidate.search_text.like(f"%{search.lower()}%")
 
-            # Subquery for candidates with matching skills
-            skill_subquery = (
-                select(Skill.candidate_id)
-                .where(Skill.name.ilike(search_term))
-            )
-
-            query = query.where(
-                or_(
-                    Candidate.name.ilike(search_term),
-                    Candidate.email.ilike(search_term),
-                    Candidate.id.in_(skill_subquery),
+            # Opt-in: no index serves a substring match on document text,
+            # so this scans every extracted document
+            if search_documents:
+                document_subquery = (
+                    select(DocumentText.candidate_id)
+                    .where(DocumentText.content.ilike(f"%{search}%"))
                 )
-            )
+                search_filter = or_(search_filter, Candidate.id.in_(document_subquery))
+
+            query = query.where(search_filter)
 
         # Filter by position
         if position_id:
@@ -65,20 +134,104 @@ class CandidateRepository:
             )
             query = query.where(Candidate.id.in_(position_subquery))
 
-        # Get total count (before pagination)
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
+        if candidate_filter is not None:
+            query = query.where(candidate_filter)
 
-        # Apply pagination and ordering
-        query = query.order_by(Candidate.sort_order, Candidate.name)
-        query = query.limit(limit).offset(offset)
+        return query
 
-        # Execute query
-        result = await db.execute(query)
-        candidates = result.scalars().all()
+    @staticmethod
+    async def stream_candidates(
+        db: AsyncSession,
+        status: Optional[CandidateStatus] = CandidateStatus.ACTIVE,
+        search: Optional[str] = None,
+        position_id: Optional[str] = None,
+        batch_size: int = 1000,
+        candidate_filter: Optional[ColumnElement[bool]] = None,
+        search_documents: bool = False,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Stream filtered candidates with their skills, batch_size at a time.
 
-        return list(candidates), total
+        Runs a single candidates-outer-join-skills query through a server-side
+        cursor (yield_per), so memory does not grow with the result and no
+        count or relationship queries are issued. Rows arrive ordered by
+        candidate and are folded into one dict per candidate with a "skills"
+        list of (name, level) pairs and a "skill_ids" list of (catalog id,
+        level) pairs for the resolved ones; years_of_experience is the
+        stored value. candidate_filter and search_documents are as for
+        get_candidates.
+        """
+        query = select(
+            Candidate.id,
+            Candidate.name,
+            Candidate.email,
+            Candidate.phone,
+            Candidate.location,
+            Candidate.summary,
+            Candidate.status,
+            Candidate.years_of_experience,
+            Candidate.sort_order,
+            Skill.name.label("skill_name"),
+            Skill.level.label("skill_level"),
+            Skill.skill_id,
+        ).outerjoin(Skill, Skill.candidate_id == Candidate.id)
+        query = CandidateRepository._apply_filters(
+            query, status, search, position_id, candidate_filter, search_documents
+        )
+        query = query.order_by(Candidate.sort_order, Candidate.name, Candidate.id)
+
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+
+        batch: list[dict] = []
+        current: Optional[dict] = None
+        async for partition in result.partitions():
+            for row in partition:
+                if current is None or current["id"] != row.id:
+                    if current is not None:
+                        batch.append(current)
+                    current = {
+                        key: value
+                        for key, value in row._mapping.items()
+                        if key not in ("skill_name", "skill_level", "skill_id")
+                    }
+                    current["skills"] = []
+                    current["skill_ids"] = []
+                if row.skill_name is not None:
+                    current["skills"].append((row.skill_name, row.skill_level))
+                if row.skill_id is not None:
+                    current["skill_ids"].append((row.skill_id, row.skill_level))
+
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if current is not None:
+            batch.append(current)
+        if batch:
+            yield batch
+
+    @staticmethod
+    async def stream_skills(
+        db: AsyncSession, batch_size: int = 1000
+    ) -> AsyncIterator[list[tuple[str, int, SkillLevel]]]:
+        """Stream every resolved (candidate_id, skill_id, level) row, batch_size at a time."""
+        query = select(Skill.candidate_id, Skill.skill_id, Skill.level).where(
+            Skill.skill_id.is_not(None)
+        )
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+
+    @staticmethod
+    async def get_data_version(db: AsyncSession) -> tuple[int, Optional[datetime]]:
+        """
+        (row count, latest updated_at) of the candidates table.
+
+        Every candidate write bumps updated_at and deletes change the count,
+        so caches built from candidate data can check this cheaply.
+        """
+        result = await db.execute(select(func.count(), func.max(Candidate.updated_at)))
+        return tuple(result.one())
 
     @staticmethod
     async def get_candidate_by_id(
@@ -100,3 +253,371 @@ class CandidateRepository:
 
         result = await db.execute(query)
         return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_candidates_by_ids(
+        db: AsyncSession,
+        candidate_ids: list[str],
+    ) -> dict[str, Candidate]:
+        """
+        Get many candidates by ID with all related data, keyed by ID.
+
+        Each relationship is loaded with one IN query across the whole set,
+        so the query count does not grow with the number of ids. Unknown ids
+        are left out.
+        """
+        if not candidate_ids:
+            return {}
+        query = (
+            select(Candidate)
+            .where(Candidate.id.in_(candidate_ids))
+            .options(
+                selectinload(Candidate.experiences),
+                selectinload(Candidate.education),
+                selectinload(Candidate.skills),
+                selectinload(Candidate.documents),
+                selectinload(Candidate.candidate_positions),
+            )
+        )
+
+        result = await db.execute(query)
+        return {candidate.id: candidate for candidate in result.scalars().all()}
+
+    @staticmethod
+    async def create_candidate(
+        db: AsyncSession,
+        fields: dict,
+        nested: dict[str, list[dict]],
+    ) -> Candidate:
+        """
+        Create a candidate together with its nested collections.
+
+        fields holds the candidate columns; nested maps each relationship in
+        NESTED_COLLECTIONS to a list of row dicts. Every collection is written
+        with one multi-row INSERT in the same transaction as the candidate,
+        and the derived fields are computed from the same input. The
+        candidate's position scores are written in the same transaction.
+
+        Raises ValueError if the email is already taken.
+        """
+        now = datetime.utcnow()
+        values = {
+            **fields,
+            "id": str(uuid4()),
+            "created_at": now,
+            "updated_at": now,
+            **CandidateRepository._derived_fields(fields, nested),
+        }
+
+        try:
+            await db.execute(insert(Candidate).values(**values))
+            children = await CandidateRepository._insert_nested(db, values["id"], nested)
+            await PositionScoreRepository.refresh_candidates(db, [values["id"]])
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise ValueError("A candidate with this email already exists")
+
+        # Attach the rows just written instead of selecting them back
+        candidate = Candidate(**values)
+        make_transient_to_detached(candidate)
+        db.add(candidate)
+        for relationship, objects in children.items():
+            set_committed_value(candidate, relationship, objects)
+        set_committed_value(candidate, "candidate_positions", [])
+
+        return candidate
+
+    @staticmethod
+    async def update_candidate(
+        db: AsyncSession,
+        candidate: Candidate,
+        fields: dict,
+        nested: dict[str, list[dict]],
+    ) -> Candidate:
+        """
+        Replace a candidate's fields and nested collections.
+
+        The candidate must have its nested collections loaded (as returned by
+        get_candidate_by_id). Each collection is replaced with one DELETE and
+        one multi-row INSERT; the in-memory candidate is left matching the
+        database, so callers can build a response without reloading it.
+        Uploaded documents (those with stored files) are kept; only linked
+        documents are replaced. The candidate's position scores, and the
+        pipeline rollups if the status changed, are recomputed in the same
+        transaction.
+
+        Raises ValueError if the email belongs to another candidate.
+        """
+        values = {
+            **fields,
+            "updated_at": datetime.utcnow(),
+            **CandidateRepository._derived_fields(fields, nested),
+        }
+        status_changed = values.get("status", candidate.status) != candidate.status
+
+        try:
+            await db.execute(
+                update(Candidate)
+                .where(Candidate.id == candidate.id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            for relationship, model in NESTED_COLLECTIONS.items():
+                stmt = delete(model).where(model.candidate_id == candidate.id)
+                if model is Document:
+                    # Uploaded files are managed through the documents endpoints
+                    stmt = stmt.where(Document.storage_key.is_(None))
+                await db.execute(stmt)
+            children = await CandidateRepository._insert_nested(db, candidate.id, nested)
+            await PositionScoreRepository.refresh_candidates(db, [candidate.id])
+            if status_changed:
+                await PipelineRepository.refresh_candidates(db, [candidate.id])
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise ValueError("A candidate with this email already exists")
+
+        stored_documents = [d for d in candidate.documents if d.storage_key]
+        children["documents"] = stored_documents + children["documents"]
+        for relationship in NESTED_COLLECTIONS:
+            for obj in getattr(candidate, relationship):
+                if obj not in stored_documents:
+                    db.expunge(obj)
+        for key, value in values.items():
+            set_committed_value(candidate, key, value)
+        for relationship, objects in children.items():
+            set_committed_value(candidate, relationship, objects)
+
+        return candidate
+
+    @staticmethod
+    async def upsert_candidates(db: AsyncSession, rows: list[dict]) -> int:
+        """
+        Insert or update a batch of candidates keyed on email.
+
+        Uses one INSERT ... ON DUPLICATE KEY UPDATE (ON CONFLICT DO UPDATE on
+        SQLite) per set of columns in the batch. Existing candidates only
+        have the columns present in their row overwritten, and keep their
+        id, created_at and nested collections; new candidates get the column
+        defaults for the rest. Derived fields are refreshed for
+        every row in the batch, and so are their position scores and pipeline
+        rollups. Commits and returns the number of distinct emails written.
+        """
+        now = datetime.utcnow()
+        # Last occurrence wins when a batch repeats an email
+        by_email = {row["email"]: row for row in rows}
+        values = [
+            {
+                "years_of_experience": 0,
+                "search_text": "",
+                **row,
+                "id": str(uuid4()),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for row in by_email.values()
+        ]
+        if not values:
+            return 0
+
+        # Rows only overwrite the columns they carry, so group them by their
+        # keys; each group runs as executemany against the Core table: the
+        # statement compiles once (and is cached) while the driver still
+        # sends multi-row batches
+        groups: dict[tuple[str, ...], list[dict]] = {}
+        for row in values:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        table = Candidate.__table__
+        preserved = {"id", "email", "created_at", "years_of_experience", "search_text"}
+        for keys, group in groups.items():
+            updated_columns = [key for key in keys if key not in preserved]
+            if db.get_bind().dialect.name == "sqlite":
+                stmt = sqlite_insert(table)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[table.c.email],
+                    set_={key: stmt.excluded[key] for key in updated_columns},
+                )
+            else:
+                stmt = mysql_insert(table)
+                stmt = stmt.on_duplicate_key_update(
+                    {key: stmt.inserted[key] for key in updated_columns}
+                )
+            await db.execute(stmt, group)
+
+        ids = list(
+            (await db.execute(select(Candidate.id).where(Candidate.email.in_(list(by_email)))))
+            .scalars()
+        )
+        refreshed = await CandidateRepository.refresh_derived_fields(db, ids)
+        # Status may have changed
+        await PositionScoreRepository.refresh_candidates(db, ids)
+        await PipelineRepository.refresh_candidates(db, ids)
+        await db.commit()
+
+        # Keep the identity map from growing across batches
+        for candidate in refreshed:
+            db.expunge(candidate)
+
+        return len(values)
+
+    @staticmethod
+    async def refresh_derived_fields(
+        db: AsyncSession,
+        candidate_ids: list[str],
+    ) -> list[Candidate]:
+        """
+        Recompute stored derived fields for candidates written elsewhere.
+
+        For rows inserted outside create/update_candidate (seeding, imports).
+        Loads experiences and skills for all ids in two queries and issues one
+        executemany UPDATE. Returns the loaded candidates. Does not commit.
+        """
+        if not candidate_ids:
+            return []
+
+        query = (
+            select(Candidate)
+            .where(Candidate.id.in_(candidate_ids))
+            .options(selectinload(Candidate.experiences), selectinload(Candidate.skills))
+            .execution_options(populate_existing=True)
+        )
+        candidates = (await db.execute(query)).scalars().all()
+
+        rows = [
+            {
+                "candidate_id": candidate.id,
+                "years_of_experience": CandidateService.calculate_years_of_experience(
+                    candidate.experiences
+                ),
+                "search_text": CandidateService.build_search_text(
+                    candidate.name, candidate.email, [s.name for s in candidate.skills]
+                ),
+            }
+            for candidate in candidates
+        ]
+        await db.execute(
+            update(Candidate.__table__)
+            .where(Candidate.__table__.c.id == bindparam("candidate_id"))
+            .values(
+                years_of_experience=bindparam("years_of_experience"),
+                search_text=bindparam("search_text"),
+            ),
+            rows,
+        )
+        for candidate, row in zip(candidates, rows):
+            set_committed_value(candidate, "years_of_experience", row["years_of_experience"])
+            set_committed_value(candidate, "search_text", row["search_text"])
+
+        return list(candidates)
+
+    @staticmethod
+    async def refresh_current_experience(db: AsyncSession, batch_size: int = 1000) -> int:
+        """
+        Recompute stored years_of_experience for candidates in a current role.
+
+        A role without an end date counts up to today, so the stored value
+        goes stale as time passes; this walks those candidates in id order,
+        batch_size at a time, and rewrites only the values that changed,
+        along with those candidates' position scores. Commits after each
+        batch; returns the number of candidates updated.
+        """
+        current_role = select(Experience.candidate_id).where(Experience.end_date.is_(None))
+        updated, last_id = 0, None
+        while True:
+            query = (
+                select(Candidate)
+                .where(Candidate.id.in_(current_role))
+                .options(selectinload(Candidate.experiences))
+                .order_by(Candidate.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                query = query.where(Candidate.id > last_id)
+            candidates = (await db.execute(query)).scalars().all()
+            if not candidates:
+                break
+            last_id = candidates[-1].id
+
+            rows = []
+            for candidate in candidates:
+                years = CandidateService.calculate_years_of_experience(candidate.experiences)
+                if years != candidate.years_of_experience:
+                    rows.append({"candidate_id": candidate.id, "years_of_experience": years})
+            if rows:
+                await db.execute(
+                    update(Candidate.__table__)
+                    .where(Candidate.__table__.c.id == bindparam("candidate_id"))
+                    .values(years_of_experience=bindparam("years_of_experience")),
+                    rows,
+                )
+                await PositionScoreRepository.refresh_candidates(
+                    db, [row["candidate_id"] for row in rows]
+                )
+            await db.commit()
+            db.expunge_all()
+            updated += len(rows)
+        return updated
+
+    @staticmethod
+    def _derived_fields(fields: dict, nested: dict[str, list[dict]]) -> dict:
+        """Compute the stored derived columns from the write payload."""
+        experiences = [Experience(**row) for row in nested.get("experiences", [])]
+        skill_names = [row["name"] for row in nested.get("skills", [])]
+        return {
+            "years_of_experience": CandidateService.calculate_years_of_experience(experiences),
+            "search_text": CandidateService.build_search_text(
+                fields["name"], fields["email"], skill_names
+            ),
+        }
+
+    @staticmethod
+    async def _insert_nested(
+        db: AsyncSession,
+        candidate_id: str,
+        nested: dict[str, list[dict]],
+    ) -> dict[str, list]:
+        """
+        Insert every nested collection with one statement per table.
+
+        Returns the written rows as detached ORM objects keyed by
+        relationship name. Skills are resolved to catalog ids on the way.
+        Does not commit.
+        """
+        uploaded_at = datetime.utcnow()
+        skill_ids = await SkillCatalogRepository.resolve(
+            db, [row["name"] for row in nested.get("skills", [])]
+        )
+        children = {}
+        for relationship, model in NESTED_COLLECTIONS.items():
+            rows = [
+                {**row, "id": str(uuid4()), "candidate_id": candidate_id}
+                for row in nested.get(relationship, [])
+            ]
+            if model is Skill:
+                rows = [
+                    {**row, "skill_id": skill_ids.get(normalize_skill(row["name"]))}
+                    for row in rows
+                ]
+            if model is Document:
+                rows = [
+                    {
+                        "uploaded_at": uploaded_at,
+                        "storage_key": None,
+                        "content_type": None,
+                        "size": None,
+                        "checksum": None,
+                        **row,
+                    }
+                    for row in rows
+                ]
+            if rows:
+                await db.execute(insert(model), rows)
+
+            objects = [model(**row) for row in rows]
+            for obj in objects:
+                make_transient_to_detached(obj)
+                db.add(obj)
+            children[relationship] = objects
+        return children
@@ -1,14 +1,19 @@
 """Candidate-Position relationship repository."""
 
+from datetime import datetime
 from typing import Optional
+from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import and_, delete, exists, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.candidate import Candidate
 from app.models.candidate_position import CandidatePosition
 from app.models.position import Position
+from app.repositories.pipeline import PipelineRepository
 
 
 class CandidatePositionRepository:
@@ -23,46 +28,53 @@ class CandidatePositionRepository:
         """
         Add a position to a candidate (candidate applies to position).
 
+        Inserts optimistically and lets the foreign keys and the
+        uq_candidate_position constraint do the validation, so the happy
+        path is a single INSERT, the pipeline rollup deltas, and COMMIT. All
+        column values are generated client-side, so no refresh is needed.
+
         Raises ValueError if relationship already exists.
         Raises ValueError if candidate or position not found.
         """
-        # Verify candidate exists
-        candidate_result = await db.execute(
-            select(Candidate).where(Candidate.id == candidate_id)
-        )
-        candidate = candidate_result.scalar_one_or_none()
-        if not candidate:
-            raise ValueError("Candidate not found")
+        values = {
+            "id": str(uuid4()),
+            "candidate_id": candidate_id,
+            "position_id": position_id,
+            "applied_at": datetime.utcnow(),
+        }
 
-        # Verify position exists
-        position_result = await db.execute(
-            select(Position).where(Position.id == position_id)
-        )
-        position = position_result.scalar_one_or_none()
-        if not position:
-            raise ValueError("Position not found")
-
-        # Check if relationship already exists
-        existing = await db.execute(
-            select(CandidatePosition).where(
-                CandidatePosition.candidate_id == candidate_id,
-                CandidatePosition.position_id == position_id,
-            )
-        )
-        if existing.scalar_one_or_none():
-            raise ValueError("Candidate has already applied to this position")
-
-        # Create relationship
-        link = CandidatePosition(candidate_id=candidate_id, position_id=position_id)
-        db.add(link)
+        if db.get_bind().dialect.name == "sqlite":
+            # aiosqlite leaves the cursor of a failed statement open, which
+            # stalls other writers; let SQLite skip duplicates instead.
+            stmt = sqlite_insert(CandidatePosition).values(values).on_conflict_do_nothing()
+        else:
+            stmt = insert(CandidatePosition).values(values)
 
+        # Only the INSERT's integrity errors mean a duplicate or missing row
         try:
-            await db.commit()
-            await db.refresh(link)
-            return link
+            inserted = (await db.execute(stmt)).rowcount == 1
         except IntegrityError:
-            await db.rollback()
-            raise ValueError("Failed to create relationship")
+            inserted = False
+        if inserted:
+            await PipelineRepository.add_applications(db, position_id, [candidate_id])
+            await db.commit()
+            return CandidatePosition(**values)
+        await db.rollback()
+
+        # Error path only: one query tells FK violations from duplicates
+        # without relying on dialect-specific error messages.
+        result = await db.execute(
+            select(
+                exists().where(Candidate.id == candidate_id),
+                exists().where(Position.id == position_id),
+            )
+        )
+        candidate_exists, position_exists = result.one()
+        if not candidate_exists:
+            raise ValueError("Candidate not found")
+        if not position_exists:
+            raise ValueError("Position not found")
+        raise ValueError("Candidate has already applied to this position")
 
     @staticmethod
     async def remove_position_from_candidate(
@@ -76,19 +88,15 @@ class CandidatePositionRepository:
         Returns True if removed, False if relationship didn't exist.
         """
         result = await db.execute(
-            select(CandidatePosition).where(
+            delete(CandidatePosition).where(
                 CandidatePosition.candidate_id == candidate_id,
                 CandidatePosition.position_id == position_id,
             )
         )
-        link = result.scalar_one_or_none()
-
-        if not link:
-            return False
-
-        await db.delete(link)
+        if result.rowcount > 0:
+            await PipelineRepository.remove_applications(db, position_id, [candidate_id])
         await db.commit()
-        return True
+        return result.rowcount > 0
 
     @staticmethod
     async def get_relationship(
@@ -104,3 +112,148 @@ class CandidatePositionRepository:
             )
         )
         return result.scalar_one_or_none()
+
+    @staticmethod
+    async def add_candidates_to_position(
+        db: AsyncSession,
+        position_id: str,
+        candidate_ids: list[str],
+    ) -> Optional[dict[str, str]]:
+        """
+        Link many candidates to a position in one transaction.
+
+        All ids are validated with a single query and the new links are
+        written with one multi-row INSERT. Returns a mapping of candidate id
+        to outcome ("added", "already_assigned" or "not_found") in request
+        order, or None if the position does not exist.
+
+        Raises ValueError if a candidate or the position is deleted between
+        the check and the insert; nothing is written then.
+        """
+        if not await CandidatePositionRepository._position_exists(db, position_id):
+            return None
+
+        requested = list(dict.fromkeys(candidate_ids))
+
+        # One query: which candidates exist, and which are already linked
+        result = await db.execute(
+            select(Candidate.id, CandidatePosition.id)
+            .outerjoin(
+                CandidatePosition,
+                and_(
+                    CandidatePosition.candidate_id == Candidate.id,
+                    CandidatePosition.position_id == position_id,
+                ),
+            )
+            .where(Candidate.id.in_(requested))
+        )
+        linked = {candidate_id: link_id is not None for candidate_id, link_id in result}
+
+        outcomes: dict[str, str] = {}
+        rows = []
+        applied_at = datetime.utcnow()
+        for candidate_id in requested:
+            if candidate_id not in linked:
+                outcomes[candidate_id] = "not_found"
+            elif linked[candidate_id]:
+                outcomes[candidate_id] = "already_assigned"
+            else:
+                outcomes[candidate_id] = "added"
+                rows.append(
+                    {
+                        "id": str(uuid4()),
+                        "candidate_id": candidate_id,
+                        "position_id": position_id,
+                        "applied_at": applied_at,
+                    }
+                )
+
+        if rows:
+            # Skip duplicates so a concurrent single link cannot fail the batch;
+            # foreign key violations still raise
+            if db.get_bind().dialect.name == "sqlite":
+                stmt = sqlite_insert(CandidatePosition).values(rows).on_conflict_do_nothing()
+            else:
+                stmt = mysql_insert(CandidatePosition).values(rows)
+                stmt = stmt.on_duplicate_key_update({"candidate_id": stmt.inserted.candidate_id})
+            try:
+                await db.execute(stmt)
+            except IntegrityError:
+                await db.rollback()
+                raise ValueError("A candidate or the position was deleted during assignment")
+
+            # Count only our rows: a concurrent link of the same candidate
+            # was skipped, and its writer counts it
+            result = await db.execute(
+                select(CandidatePosition.candidate_id).where(
+                    CandidatePosition.id.in_([row["id"] for row in rows])
+                )
+            )
+            inserted = set(result.scalars())
+            for row in rows:
+                if row["candidate_id"] not in inserted:
+                    outcomes[row["candidate_id"]] = "already_assigned"
+            await PipelineRepository.add_applications(db, position_id, sorted(inserted))
+            await db.commit()
+
+        return outcomes
+
+    @staticmethod
+    async def remove_candidates_from_position(
+        db: AsyncSession,
+        position_id: str,
+        candidate_ids: list[str],
+    ) -> Optional[dict[str, str]]:
+        """
+        Unlink many candidates from a position in one transaction.
+
+        Returns a mapping of candidate id to outcome ("removed" or
+        "not_assigned") in request order, or None if the position does not
+        exist. Only links this call deleted count as removed, so a
+        concurrent unlink of the same candidate is reported once.
+        """
+        if not await CandidatePositionRepository._position_exists(db, position_id):
+            return None
+
+        requested = list(dict.fromkeys(candidate_ids))
+        requested_links = and_(
+            CandidatePosition.position_id == position_id,
+            CandidatePosition.candidate_id.in_(requested),
+        )
+
+        if db.get_bind().dialect.delete_returning:
+            result = await db.execute(
+                delete(CandidatePosition)
+                .where(requested_links)
+                .returning(CandidatePosition.candidate_id)
+            )
+            removed = set(result.scalars().all())
+        else:
+            # No DELETE ... RETURNING (MySQL): lock the links first, so a
+            # concurrent unlink waits for this one and finds nothing to delete
+            result = await db.execute(
+                select(CandidatePosition.candidate_id).where(requested_links).with_for_update()
+            )
+            removed = set(result.scalars().all())
+            if removed:
+                await db.execute(
+                    delete(CandidatePosition).where(
+                        CandidatePosition.position_id == position_id,
+                        CandidatePosition.candidate_id.in_(sorted(removed)),
+                    )
+                )
+
+        if removed:
+            await PipelineRepository.remove_applications(db, position_id, sorted(removed))
+        await db.commit()
+
+        return {
+            candidate_id: "removed" if candidate_id in removed else "not_assigned"
+            for candidate_id in requested
+        }
+
+    @staticmethod
+    async def _position_exists(db: AsyncSession, position_id: str) -> bool:
+        """Check whether a position exists without loading it."""
+        result = await db.execute(select(exists().where(Position.id == position_id)))
+        return bool(result.scalar())
@@ -0,0 +1,159 @@
+"""Document repository for database operations."""
+
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.candidate import Candidate
+from app.models.candidate_position import CandidatePosition
+from app.models.document import Document
+from app.models.document_text import DocumentText, ExtractionStatus
+from app.models.position import Position
+from app.repositories.blob import BlobRepository
+
+
+class DocumentRepository:
+    """Data access layer for candidate documents."""
+
+    @staticmethod
+    async def candidate_exists(db: AsyncSession, candidate_id: str) -> bool:
+        """Check for a candidate without loading it."""
+        result = await db.execute(select(exists().where(Candidate.id == candidate_id)))
+        return result.scalar()
+
+    @staticmethod
+    async def position_exists(db: AsyncSession, position_id: str) -> bool:
+        """Check for a position without loading it."""
+        result = await db.execute(select(exists().where(Position.id == position_id)))
+        return result.scalar()
+
+    @staticmethod
+    async def get_stored_documents(
+        db: AsyncSession,
+        candidate_id: Optional[str] = None,
+        position_id: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Stored files of one candidate, or of every candidate linked to a position.
+
+        Returns plain rows (candidate_id, candidate_name, name, storage_key,
+        uploaded_at) ordered by candidate, so they can be used after
+        the session is released.
+        """
+        query = (
+            select(
+                Document.candidate_id,
+                Candidate.name.label("candidate_name"),
+                Document.name,
+                Document.storage_key,
+                Document.uploaded_at,
+            )
+            .join(Candidate, Candidate.id == Document.candidate_id)
+            .where(Document.storage_key.is_not(None))
+        )
+        if candidate_id is not None:
+            query = query.where(Document.candidate_id == candidate_id)
+        if position_id is not None:
+            query = query.join(
+                CandidatePosition, CandidatePosition.candidate_id == Document.candidate_id
+            ).where(CandidatePosition.position_id == position_id)
+        result = await db.execute(
+            query.order_by(Candidate.name, Candidate.id, Document.uploaded_at, Document.id)
+        )
+        return [dict(row) for row in result.mappings()]
+
+    @staticmethod
+    async def create_document(
+        db: AsyncSession,
+        values: dict,
+        place_file: Callable[[], Awaitable[object]],
+    ) -> Document:
+        """
+        Insert a stored document, referencing its blob, and commit.
+
+        The blob reference is taken first and place_file (which moves the
+        content into the blob path) runs while that row is locked, so a
+        concurrent garbage collection cannot delete the blob in between.
+
+        Raises ValueError if the candidate no longer exists.
+        """
+        document = Document(**values)
+        try:
+            await BlobRepository.add_reference(db, document.checksum, document.size)
+            await place_file()
+            db.add(document)
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise ValueError("Candidate not found")
+        return document
+
+    @staticmethod
+    async def delete_document(db: AsyncSession, document: Document) -> None:
+        """
+        Delete a document and release its blob reference, then commit.
+
+        The file itself is left to garbage collection, as other documents
+        may share it.
+        """
+        await db.execute(delete(Document).where(Document.id == document.id))
+        if document.storage_key:
+            await BlobRepository.release_reference(db, document.checksum)
+        await db.commit()
+
+    @staticmethod
+    async def get_document_by_id(db: AsyncSession, document_id: str) -> Optional[Document]:
+        """Get a single document by ID."""
+        result = await db.execute(select(Document).where(Document.id == document_id))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_document_ids_for_extraction(
+        db: AsyncSession,
+        only_missing: bool = True,
+    ) -> list[str]:
+        """IDs of stored documents, optionally only those never extracted."""
+        query = select(Document.id).where(Document.storage_key.is_not(None))
+        if only_missing:
+            query = query.where(~exists().where(DocumentText.document_id == Document.id))
+        result = await db.execute(query.order_by(Document.uploaded_at))
+        return list(result.scalars())
+
+    @staticmethod
+    async def save_text(
+        db: AsyncSession,
+        document: Document,
+        status: ExtractionStatus,
+        content: str = "",
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Replace a document's extracted text and commit.
+
+        Does nothing if the document was deleted in the meantime.
+        """
+        await db.execute(delete(DocumentText).where(DocumentText.document_id == document.id))
+        db.add(
+            DocumentText(
+                document_id=document.id,
+                candidate_id=document.candidate_id,
+                status=status,
+                content=content,
+                error=error[:500] if error else None,
+            )
+        )
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+
+    @staticmethod
+    async def count_texts_by_status(db: AsyncSession) -> dict[ExtractionStatus, int]:
+        """Number of extracted documents per extraction status."""
+        result = await db.execute(
+            select(DocumentText.status, func.count()).group_by(DocumentText.status)
+        )
+        return dict(result.all())
@@ -0,0 +1,101 @@
+"""Job repository for database operations."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job import Job, JobStatus
+
+
+class JobRepository:
+    """Data access layer for background jobs."""
+
+    @staticmethod
+    async def create_job(
+        db: AsyncSession,
+        job_type: str,
+        params: dict[str, Any],
+        created_by: Optional[str] = None,
+    ) -> Job:
+        """Create a queued job and commit it."""
+        job = Job(
+            type=job_type,
+            status=JobStatus.QUEUED,
+            params=params,
+            processed=0,
+            created_by=created_by,
+        )
+        db.add(job)
+        await db.commit()
+        return job
+
+    @staticmethod
+    async def get_job_by_id(db: AsyncSession, job_id: str) -> Optional[Job]:
+        """Get a single job by ID."""
+        result = await db.execute(select(Job).where(Job.id == job_id))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_unfinished_job_ids(db: AsyncSession) -> tuple[list[str], list[str]]:
+        """Return (queued ids, running ids), oldest first."""
+        result = await db.execute(
+            select(Job.id, Job.status)
+            .where(Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]))
+            .order_by(Job.created_at)
+        )
+        queued, running = [], []
+        for job_id, status in result:
+            (queued if status == JobStatus.QUEUED else running).append(job_id)
+        return queued, running
+
+    @staticmethod
+    async def mark_running(db: AsyncSession, job_id: str) -> bool:
+        """
+        Move a queued job to running and commit.
+
+        Returns False if the job is no longer queued.
+        """
+        result = await db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.QUEUED)
+            .values(status=JobStatus.RUNNING, started_at=datetime.utcnow())
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+    @staticmethod
+    async def update_progress(
+        db: AsyncSession,
+        job_id: str,
+        processed: int,
+        total: Optional[int] = None,
+    ) -> None:
+        """Record progress for a running job and commit."""
+        values: dict[str, Any] = {"processed": processed}
+        if total is not None:
+            values["total"] = total
+        await db.execute(update(Job).where(Job.id == job_id).values(**values))
+        await db.commit()
+
+    @staticmethod
+    async def finish_job(
+        db: AsyncSession,
+        job_id: str,
+        status: JobStatus,
+        result: Optional[dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record the final status, result or error of a job and commit."""
+        await db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(
+                status=status,
+                result=result,
+                error=error,
+                finished_at=datetime.utcnow(),
+            )
+        )
+        await db.commit()
@@ -0,0 +1,312 @@
+"""Repository for the pipeline analytics rollups."""
+
+from collections.abc import Iterable
+from datetime import date
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.candidate import Candidate
+from app.models.candidate_position import CandidatePosition
+from app.models.pipeline_stats import (
+    PipelineDepartmentApplications,
+    PipelineDepartmentPositions,
+    PipelineOpenings,
+    PipelinePositionStats,
+)
+from app.models.position import Position
+
+
+class PipelineRepository:
+    """
+    Read and maintain the pipeline rollup tables.
+
+    Writers call these methods in their own transaction. Links and unlinks,
+    the hot path, apply +n/-n deltas with upserts keyed by the links
+    actually written, so their cost does not grow with the department.
+    Status and position changes, which move whole groups, delete the
+    touched keys' rows and recompute them with one INSERT ... SELECT. None
+    of the maintenance methods commit.
+    """
+
+    @staticmethod
+    async def get_position_stats(db: AsyncSession, limit: int) -> list[dict]:
+        """Positions with the most applications, most first."""
+        result = await db.execute(
+            select(
+                Position.id.label("position_id"),
+                Position.title,
+                Position.department,
+                Position.status,
+                PipelinePositionStats.applications,
+            )
+            .join(Position, Position.id == PipelinePositionStats.position_id)
+            .order_by(PipelinePositionStats.applications.desc(), Position.title)
+            .limit(limit)
+        )
+        return [dict(row._mapping) for row in result]
+
+    @staticmethod
+    async def get_department_positions(db: AsyncSession) -> list[PipelineDepartmentPositions]:
+        """Position counts per department and position status."""
+        result = await db.execute(select(PipelineDepartmentPositions))
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_department_applications(
+        db: AsyncSession,
+    ) -> list[PipelineDepartmentApplications]:
+        """Application counts per department and candidate status."""
+        result = await db.execute(select(PipelineDepartmentApplications))
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_openings(db: AsyncSession) -> list[PipelineOpenings]:
+        """Positions posted per day, oldest first."""
+        result = await db.execute(select(PipelineOpenings).order_by(PipelineOpenings.posted_date))
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def add_applications(
+        db: AsyncSession, position_id: str, candidate_ids: list[str]
+    ) -> None:
+        """Count links just inserted between a position and these candidates."""
+        await PipelineRepository._count_applications(db, position_id, candidate_ids, 1)
+
+    @staticmethod
+    async def remove_applications(
+        db: AsyncSession, position_id: str, candidate_ids: list[str]
+    ) -> None:
+        """Uncount links just deleted between a position and these candidates."""
+        await PipelineRepository._count_applications(db, position_id, candidate_ids, -1)
+
+    @staticmethod
+    async def refresh_candidates(db: AsyncSession, candidate_ids: Iterable[str]) -> None:
+        """Recompute the rollups after candidates' status changed."""
+        candidate_ids = list(set(candidate_ids))
+        if not candidate_ids:
+            return
+        departments = await db.execute(
+            select(Position.department)
+            .join(CandidatePosition, CandidatePosition.position_id == Position.id)
+            .where(CandidatePosition.candidate_id.in_(candidate_ids))
+            .distinct()
+        )
+        await PipelineRepository._refresh_department_applications(
+            db, list(departments.scalars())
+        )
+
+    @staticmethod
+    async def refresh_departments(db: AsyncSession, departments: Iterable[str]) -> None:
+        """Recompute departments' rows after positions moved between departments or statuses."""
+        departments = list(set(departments))
+        if not departments:
+            return
+        await db.execute(
+            delete(PipelineDepartmentPositions).where(
+                PipelineDepartmentPositions.department.in_(departments)
+            )
+        )
+        await db.execute(
+            insert(PipelineDepartmentPositions).from_select(
+                ["department", "status", "positions"],
+                select(Position.department, Position.status, func.count())
+                .where(Position.department.in_(departments))
+                .group_by(Position.department, Position.status),
+            )
+        )
+        await PipelineRepository._refresh_department_applications(db, departments)
+
+    @staticmethod
+    async def refresh_openings(db: AsyncSession, posted_dates: Iterable[date]) -> None:
+        """Recompute the opening counts of the given posting days."""
+        posted_dates = list(set(posted_dates))
+        if not posted_dates:
+            return
+        await db.execute(
+            delete(PipelineOpenings).where(PipelineOpenings.posted_date.in_(posted_dates))
+        )
+        await db.execute(
+            insert(PipelineOpenings).from_select(
+                ["posted_date", "positions"],
+                select(Position.posted_date, func.count())
+                .where(Position.posted_date.in_(posted_dates))
+                .group_by(Position.posted_date),
+            )
+        )
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> dict[str, int]:
+        """
+        Recompute every rollup from the base tables in one transaction.
+
+        For data written outside the repositories (seeding, generated
+        datasets, manual fixes). Commits; returns the rows written per table.
+        """
+        for model in (
+            PipelinePositionStats,
+            PipelineDepartmentPositions,
+            PipelineDepartmentApplications,
+            PipelineOpenings,
+        ):
+            await db.execute(delete(model))
+
+        await db.execute(
+            insert(PipelinePositionStats).from_select(
+                ["position_id", "applications"],
+                select(CandidatePosition.position_id, func.count()).group_by(
+                    CandidatePosition.position_id
+                ),
+            )
+        )
+        await db.execute(
+            insert(PipelineDepartmentPositions).from_select(
+                ["department", "status", "positions"],
+                select(Position.department, Position.status, func.count()).group_by(
+                    Position.department, Position.status
+                ),
+            )
+        )
+        await db.execute(
+            insert(PipelineDepartmentApplications).from_select(
+                ["department", "candidate_status", "applications"],
+                PipelineRepository._department_applications(),
+            )
+        )
+        await db.execute(
+            insert(PipelineOpenings).from_select(
+                ["posted_date", "positions"],
+                select(Position.posted_date, func.count()).group_by(Position.posted_date),
+            )
+        )
+
+        written = {}
+        for model in (
+            PipelinePositionStats,
+            PipelineDepartmentPositions,
+            PipelineDepartmentApplications,
+            PipelineOpenings,
+        ):
+            count = await db.execute(select(func.count()).select_from(model))
+            written[model.__tablename__] = count.scalar() or 0
+        await db.commit()
+        return written
+
+    @staticmethod
+    async def _count_applications(
+        db: AsyncSession, position_id: str, candidate_ids: list[str], sign: int
+    ) -> None:
+        """
+        Add sign per link to the position's and its department's counts.
+
+        One primary-key lookup finds the department and the candidates'
+        statuses; each rollup then takes one upsert, and on removal the
+        groups that dropped to zero are deleted.
+        """
+        if not candidate_ids:
+            return
+        result = await db.execute(
+            select(Position.department, Candidate.status, func.count())
+            .select_from(Candidate)
+            .join(Position, Position.id == position_id)
+            .where(Candidate.id.in_(candidate_ids))
+            .group_by(Position.department, Candidate.status)
+        )
+        groups = result.all()
+        if not groups:
+            return
+        department = groups[0].department
+
+        await PipelineRepository._add_counts(
+            db,
+            PipelinePositionStats,
+            ["position_id"],
+            [{"position_id": position_id, "applications": sign * sum(n for *_, n in groups)}],
+        )
+        await PipelineRepository._add_counts(
+            db,
+            PipelineDepartmentApplications,
+            ["department", "candidate_status"],
+            [
+                {"department": department, "candidate_status": status, "applications": sign * n}
+                for _, status, n in sorted(groups, key=lambda group: group.status.value)
+            ],
+        )
+        if sign < 0:
+            await db.execute(
+                delete(PipelinePositionStats).where(
+                    PipelinePositionStats.position_id == position_id,
+                    PipelinePositionStats.applications <= 0,
+                )
+            )
+            await db.execute(
+                delete(PipelineDepartmentApplications).where(
+                    PipelineDepartmentApplications.department == department,
+                    PipelineDepartmentApplications.applications <= 0,
+                )
+            )
+
+    @staticmethod
+    async def _add_counts(db: AsyncSession, model, keys: list[str], rows: list[dict]) -> None:
+        """
+        Add each row's applications to its group's row, creating missing rows.
+
+        ON CONFLICT / ON DUPLICATE KEY increments, so concurrent writers to
+        one group neither overwrite each other nor collide on the key.
+        """
+        table = model.__table__
+        dialect = db.get_bind().dialect.name
+        if dialect == "sqlite":
+            stmt = sqlite_insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=keys,
+                set_={"applications": table.c.applications + stmt.excluded.applications},
+            )
+            await db.execute(stmt, rows)
+        elif dialect == "mysql":
+            stmt = mysql_insert(table)
+            stmt = stmt.on_duplicate_key_update(
+                applications=table.c.applications + stmt.inserted.applications
+            )
+            await db.execute(stmt, rows)
+        else:
+            for row in rows:
+                result = await db.execute(
+                    update(table)
+                    .where(*(table.c[key] == row[key] for key in keys))
+                    .values(applications=table.c.applications + row["applications"])
+                )
+                if not result.rowcount:
+                    await db.execute(insert(table).values(row))
+
+    @staticmethod
+    async def _refresh_department_applications(db: AsyncSession, departments: list[str]) -> None:
+        """Recompute the application counts of the given departments."""
+        if not departments:
+            return
+        await db.execute(
+            delete(PipelineDepartmentApplications).where(
+                PipelineDepartmentApplications.department.in_(departments)
+            )
+        )
+        await db.execute(
+            insert(PipelineDepartmentApplications).from_select(
+                ["department", "candidate_status", "applications"],
+                PipelineRepository._department_applications().where(
+                    Position.department.in_(departments)
+                ),
+            )
+        )
+
+    @staticmethod
+    def _department_applications():
+        """Applications grouped by (department, candidate status)."""
+        return (
+            select(Position.department, Candidate.status, func.count())
+            .select_from(CandidatePosition)
+            .join(Position, Position.id == CandidatePosition.position_id)
+            .join(Candidate, Candidate.id == CandidatePosition.candidate_id)
+            .group_by(Position.department, Candidate.status)
+        )
@@ -1,13 +1,21 @@
 """Position repository for database operations."""
 
 from typing import Optional
+from uuid import uuid4
 
-from sqlalchemy import or_, select, func
+from sqlalchemy import delete, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.session import make_transient_to_detached
 
+from app.core.etag import next_version
 from app.models.position import Position, PositionStatus
 from app.models.position_skill import PositionSkill
+from app.repositories.pipeline import PipelineRepository
+from app.repositories.position_score import PositionScoreRepository
+from app.repositories.skill_catalog import SkillCatalogRepository
+from app.services.skill_catalog import normalize_skill
 
 
 class PositionRepository:
@@ -94,8 +102,20 @@ class PositionRepository:
         posted_date,
         required_skills: list[str],
     ) -> Position:
-        """Update a position and its required skills."""
-        # Update position fields
+        """
+        Update a position and reconcile its required skills by diff.
+
+        Only skill names that were added or removed are written, each set
+        with a single statement. The in-memory position is left matching the
+        database, so callers can build a response without reloading it.
+        Candidate scores are recomputed in the same transaction if skills,
+        minimum experience or status changed, and the pipeline rollups if
+        department, status or posted date changed.
+        """
+        scored_before = (position.min_experience_years, position.status)
+        rolled_up_before = (position.department, position.status, position.posted_date)
+
+        # Update position fields; a full update always gets a new version
         position.title = title
         position.department = department
         position.location = location
@@ -104,20 +124,143 @@ class PositionRepository:
         position.min_experience_years = min_experience_years
         position.status = status
         position.posted_date = posted_date
+        position.updated_at = next_version(position.updated_at)
+
+        skills_changed = await PositionRepository._reconcile_required_skills(
+            db, position, required_skills
+        )
+        if skills_changed or scored_before != (min_experience_years, status):
+            await PositionScoreRepository.refresh_position(db, position)
+        await PositionRepository._refresh_pipeline(db, position, *rolled_up_before)
+        await db.commit()
+
+        return position
+
+    @staticmethod
+    async def patch_position(
+        db: AsyncSession,
+        position: Position,
+        changes: dict,
+        required_skills: Optional[list[str]] = None,
+    ) -> bool:
+        """
+        Apply a partial update guarded by the position's current version.
 
-        # Update required skills - delete old ones and add new ones
-        # Delete existing skills
-        for skill in position.required_skills:
-            await db.delete(skill)
+        The UPDATE only matches if updated_at still equals the value the
+        caller loaded (compare-and-swap), so no row lock is held between the
+        read and the write. Required skills are only touched when given.
+        Candidate scores are recomputed in the same transaction if skills,
+        minimum experience or status changed, and the pipeline rollups if
+        department, status or posted date changed.
 
-        await db.flush()
+        Returns False, without writing anything, if another writer got there
+        first.
+        """
+        expected_version = position.updated_at
+        values = {**changes, "updated_at": next_version(expected_version)}
+        rolled_up_before = (position.department, position.status, position.posted_date)
+
+        result = await db.execute(
+            update(Position)
+            .where(Position.id == position.id, Position.updated_at == expected_version)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            await db.rollback()
+            return False
 
-        # Add new skills
-        for skill_name in required_skills:
-            new_skill = PositionSkill(position_id=position.id, name=skill_name)
-            db.add(new_skill)
+        # Mirror the written values without marking the object dirty
+        for key, value in values.items():
+            set_committed_value(position, key, value)
+
+        rescore = "min_experience_years" in changes or "status" in changes
+        if required_skills is not None:
+            rescore |= await PositionRepository._reconcile_required_skills(
+                db, position, required_skills
+            )
+        if rescore:
+            await PositionScoreRepository.refresh_position(db, position)
+        await PositionRepository._refresh_pipeline(db, position, *rolled_up_before)
 
         await db.commit()
-        await db.refresh(position)
+        return True
 
-        return position
+    @staticmethod
+    async def _refresh_pipeline(
+        db: AsyncSession,
+        position: Position,
+        department: str,
+        status: PositionStatus,
+        posted_date,
+    ) -> None:
+        """Refresh the pipeline rollups the position left and entered, if it moved."""
+        if (department, status) != (position.department, position.status):
+            await PipelineRepository.refresh_departments(db, [department, position.department])
+        if posted_date != position.posted_date:
+            await PipelineRepository.refresh_openings(db, [posted_date, position.posted_date])
+
+    @staticmethod
+    async def _reconcile_required_skills(
+        db: AsyncSession,
+        position: Position,
+        required_skills: list[str],
+    ) -> bool:
+        """
+        Bring the position's required skills in line with the given names.
+
+        Issues at most one DELETE and one multi-row INSERT, resolving added
+        names to catalog ids first, and replaces the loaded collection
+        without marking it dirty. Versioning is left to the caller. Does
+        not commit; returns whether any skill was added or removed.
+        """
+        desired = list(dict.fromkeys(required_skills))
+        current = {skill.name: skill for skill in position.required_skills}
+
+        removed = [name for name in current if name not in desired]
+        added = [name for name in desired if name not in current]
+
+        if removed:
+            await db.execute(
+                delete(PositionSkill).where(
+                    PositionSkill.position_id == position.id,
+                    PositionSkill.name.in_(removed),
+                )
+            )
+            for name in removed:
+                db.expunge(current.pop(name))
+
+        skill_ids = await SkillCatalogRepository.resolve(db, added)
+        new_skills = [
+            PositionSkill(
+                id=str(uuid4()),
+                position_id=position.id,
+                name=name,
+                skill_id=skill_ids.get(normalize_skill(name)),
+            )
+            for name in added
+        ]
+        if new_skills:
+            await db.execute(
+                insert(PositionSkill).values(
+                    [
+                        {
+                            "id": skill.id,
+                            "position_id": skill.position_id,
+                            "name": skill.name,
+                            "skill_id": skill.skill_id,
+                        }
+                        for skill in new_skills
+                    ]
+                )
+            )
+            # Attach the rows just inserted as persistent objects, no SELECT
+            for skill in new_skills:
+                make_transient_to_detached(skill)
+                db.add(skill)
+                current[skill.name] = skill
+
+        set_committed_value(
+            position, "required_skills", [current[name] for name in desired]
+        )
+        return bool(removed or added)
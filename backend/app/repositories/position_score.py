@@ -0,0 +1,208 @@
+"""Repository for the materialized position_candidate_scores ranking."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.candidate import Candidate, CandidateStatus
+from app.models.position import Position, PositionStatus
+from app.models.position_candidate_score import PositionCandidateScore
+from app.models.position_skill import PositionSkill
+from app.models.skill import Skill
+from app.services.match_scoring import score_candidate, skill_weights
+
+
+class PositionScoreRepository:
+    """
+    Keep position_candidate_scores in step with candidates and positions.
+
+    A row exists for every open position and active candidate holding at
+    least one of its required skills. Writers call refresh_candidates or
+    refresh_position in their own transaction, so only the rows of the
+    changed candidate or position are recomputed and reads never score.
+    """
+
+    @staticmethod
+    async def get_top(db: AsyncSession, position_id: str, limit: int) -> list[dict]:
+        """The position's best-scoring candidates, best first."""
+        if limit <= 0:
+            return []
+        result = await db.execute(
+            select(
+                PositionCandidateScore.candidate_id,
+                Candidate.name,
+                PositionCandidateScore.score,
+                PositionCandidateScore.skill_score,
+                PositionCandidateScore.experience_score,
+            )
+            .join(Candidate, Candidate.id == PositionCandidateScore.candidate_id)
+            .where(PositionCandidateScore.position_id == position_id)
+            .order_by(PositionCandidateScore.score.desc(), PositionCandidateScore.candidate_id)
+            .limit(limit)
+        )
+        return [dict(row._mapping) for row in result]
+
+    @staticmethod
+    async def refresh_candidates(db: AsyncSession, candidate_ids: list[str]) -> int:
+        """
+        Recompute the rows of candidates whose skills, experience or status changed.
+
+        Scores each active candidate against the open positions requiring
+        any of their skills, in four queries for the whole batch. Returns
+        the number of rows written. Does not commit.
+        """
+        if not candidate_ids:
+            return 0
+        await db.execute(
+            delete(PositionCandidateScore).where(
+                PositionCandidateScore.candidate_id.in_(candidate_ids)
+            )
+        )
+
+        years = dict(
+            (
+                await db.execute(
+                    select(Candidate.id, Candidate.years_of_experience).where(
+                        Candidate.id.in_(candidate_ids),
+                        Candidate.status == CandidateStatus.ACTIVE,
+                    )
+                )
+            ).all()
+        )
+        if not years:
+            return 0
+        skills = defaultdict(list)
+        for candidate_id, skill_id, level in await db.execute(
+            select(Skill.candidate_id, Skill.skill_id, Skill.level).where(
+                Skill.candidate_id.in_(list(years)), Skill.skill_id.is_not(None)
+            )
+        ):
+            skills[candidate_id].append((skill_id, level))
+        held = {skill_id for pairs in skills.values() for skill_id, _ in pairs}
+        if not held:
+            return 0
+
+        relevant = (
+            select(PositionSkill.position_id)
+            .where(PositionSkill.skill_id.in_(held))
+            .distinct()
+        )
+        positions = (
+            await db.execute(
+                select(Position)
+                .where(Position.status == PositionStatus.OPEN, Position.id.in_(relevant))
+                .options(selectinload(Position.required_skills))
+            )
+        ).scalars()
+
+        rows = []
+        for position in positions:
+            rows.extend(
+                PositionScoreRepository._score_rows(
+                    position, ((c, years[c], skills[c]) for c in skills)
+                )
+            )
+        if rows:
+            await db.execute(insert(PositionCandidateScore), rows)
+        return len(rows)
+
+    @staticmethod
+    async def refresh_position(db: AsyncSession, position: Position) -> int:
+        """
+        Recompute a position's rows after its requirements or status changed.
+
+        The position must have required_skills loaded. Scores the active
+        candidates holding any required skill; closed positions keep no
+        rows. Returns the number of rows written. Does not commit.
+        """
+        await db.execute(
+            delete(PositionCandidateScore).where(
+                PositionCandidateScore.position_id == position.id
+            )
+        )
+        required = {s.skill_id for s in position.required_skills if s.skill_id is not None}
+        if position.status != PositionStatus.OPEN or not required:
+            return 0
+
+        holders = (
+            select(Skill.candidate_id).where(Skill.skill_id.in_(required)).distinct()
+        )
+        candidates: dict[str, tuple[int, list]] = {}
+        for candidate_id, years, skill_id, level in await db.execute(
+            select(Candidate.id, Candidate.years_of_experience, Skill.skill_id, Skill.level)
+            .join(Skill, Skill.candidate_id == Candidate.id)
+            .where(
+                Candidate.id.in_(holders),
+                Candidate.status == CandidateStatus.ACTIVE,
+                Skill.skill_id.is_not(None),
+            )
+        ):
+            candidates.setdefault(candidate_id, (years, []))[1].append((skill_id, level))
+
+        rows = PositionScoreRepository._score_rows(
+            position, ((c, years, pairs) for c, (years, pairs) in candidates.items())
+        )
+        if rows:
+            await db.execute(insert(PositionCandidateScore), rows)
+        return len(rows)
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> int:
+        """
+        Recompute the whole table, one position per transaction.
+
+        For data written outside the repositories (seeding, generated
+        datasets) or after changing the scoring. Commits; returns the
+        number of rows written.
+        """
+        await db.execute(delete(PositionCandidateScore))
+        await db.commit()
+        position_ids = list(
+            (
+                await db.execute(select(Position.id).where(Position.status == PositionStatus.OPEN))
+            ).scalars()
+        )
+        written = 0
+        for position_id in position_ids:
+            position = (
+                await db.execute(
+                    select(Position)
+                    .where(Position.id == position_id)
+                    .options(selectinload(Position.required_skills))
+                )
+            ).scalar_one_or_none()
+            if position is not None:
+                written += await PositionScoreRepository.refresh_position(db, position)
+            await db.commit()
+            db.expunge_all()
+        return written
+
+    @staticmethod
+    def _score_rows(
+        position: Position,
+        candidates: Iterable[tuple[str, int, list]],
+    ) -> list[dict]:
+        """Score rows for (candidate id, years, [(skill id, level)]) holding a required skill."""
+        required = [skill.skill_id for skill in position.required_skills]
+        now = datetime.utcnow()
+        rows = []
+        for candidate_id, years, pairs in candidates:
+            score, skill_score, experience_score = score_candidate(
+                skill_weights(pairs), required, years, position.min_experience_years
+            )
+            if skill_score > 0:
+                rows.append(
+                    {
+                        "position_id": position.id,
+                        "candidate_id": candidate_id,
+                        "score": score,
+                        "skill_score": skill_score,
+                        "experience_score": experience_score,
+                        "computed_at": now,
+                    }
+                )
+        return rows
@@ -0,0 +1,108 @@
+"""Preview repository for the document preview cache."""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.preview import Preview, PreviewKind
+
+
+class PreviewRepository:
+    """Data access layer for cached previews and their LRU bookkeeping."""
+
+    @staticmethod
+    async def get_preview(db: AsyncSession, sha256: str) -> Optional[Preview]:
+        """The cached preview of a blob, if any."""
+        result = await db.execute(
+            select(Preview)
+            .where(Preview.sha256 == sha256)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def save_preview(
+        db: AsyncSession,
+        sha256: str,
+        kind: PreviewKind,
+        size: int,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Record (or replace) a blob's preview and commit.
+
+        Does nothing if the blob was collected in the meantime.
+        """
+        now = datetime.utcnow()
+        values = {
+            "sha256": sha256,
+            "kind": kind,
+            "size": size,
+            "error": error[:500] if error else None,
+            "created_at": now,
+            "accessed_at": now,
+        }
+        replaced = {key: values[key] for key in ("kind", "size", "error", "created_at")}
+        dialect = db.get_bind().dialect.name
+        try:
+            if dialect == "sqlite":
+                stmt = sqlite_insert(Preview).values(values)
+                stmt = stmt.on_conflict_do_update(index_elements=["sha256"], set_=replaced)
+                await db.execute(stmt)
+            elif dialect == "mysql":
+                stmt = mysql_insert(Preview).values(values).on_duplicate_key_update(**replaced)
+                await db.execute(stmt)
+            else:
+                # No upsert: replace an existing row, else insert one; a
+                # concurrent insert raises IntegrityError like a collected blob
+                result = await db.execute(
+                    update(Preview).where(Preview.sha256 == sha256).values(**replaced)
+                )
+                if not result.rowcount:
+                    await db.execute(insert(Preview).values(values))
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+
+    @staticmethod
+    async def touch(db: AsyncSession, preview: Preview, min_interval: timedelta) -> None:
+        """
+        Mark a preview as used now, for LRU eviction, and commit.
+
+        Skipped if it was marked within min_interval, so popular previews do
+        not cost a write per request.
+        """
+        now = datetime.utcnow()
+        if now - preview.accessed_at < min_interval:
+            return
+        await db.execute(
+            update(Preview).where(Preview.sha256 == preview.sha256).values(accessed_at=now)
+        )
+        await db.commit()
+
+    @staticmethod
+    async def total_size(db: AsyncSession) -> int:
+        """Bytes used by all cached preview files."""
+        result = await db.execute(select(func.coalesce(func.sum(Preview.size), 0)))
+        return int(result.scalar())
+
+    @staticmethod
+    async def get_least_recent(db: AsyncSession, limit: int) -> list[tuple[str, PreviewKind, int]]:
+        """Up to limit (sha256, kind, size) of the least recently used preview files."""
+        result = await db.execute(
+            select(Preview.sha256, Preview.kind, Preview.size)
+            .where(Preview.size > 0)
+            .order_by(Preview.accessed_at, Preview.sha256)
+            .limit(limit)
+        )
+        return [tuple(row) for row in result.all()]
+
+    @staticmethod
+    async def delete_previews(db: AsyncSession, hashes: list[str]) -> None:
+        """Forget previews. Does not commit."""
+        await db.execute(delete(Preview).where(Preview.sha256.in_(hashes)))
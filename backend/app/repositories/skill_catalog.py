@@ -0,0 +1,123 @@
+"""Skill catalog repository for resolving skill names to canonical ids."""
+
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.position_skill import PositionSkill
+from app.models.skill import Skill
+from app.models.skill_catalog import SkillAlias, SkillCatalog
+from app.services.skill_catalog import normalize_skill
+
+
+class SkillCatalogRepository:
+    """Data access layer for the skill catalog and its aliases."""
+
+    @staticmethod
+    async def lookup(db: AsyncSession, names: Iterable[str]) -> dict[str, int]:
+        """Catalog ids of the names that are known aliases, keyed by normalized name."""
+        keys = {normalize_skill(name) for name in names} - {""}
+        if not keys:
+            return {}
+        result = await db.execute(
+            select(SkillAlias.alias, SkillAlias.skill_id).where(SkillAlias.alias.in_(keys))
+        )
+        return dict(result.all())
+
+    @staticmethod
+    async def resolve(db: AsyncSession, names: Iterable[str]) -> dict[str, int]:
+        """
+        Catalog ids for skill names, keyed by normalized name.
+
+        Names that are not yet aliases become catalog entries of their own,
+        spelled as first given. The inserts ignore rows another writer added
+        meanwhile and the ids are read back, so concurrent writers agree.
+        Names that are blank are left out. Does not commit.
+        """
+        spellings: dict[str, str] = {}
+        for name in names:
+            key = normalize_skill(name)
+            if key:
+                spellings.setdefault(key, " ".join(name.split()))
+        ids = await SkillCatalogRepository.lookup(db, spellings)
+        missing = {key: name for key, name in spellings.items() if key not in ids}
+        if not missing:
+            return ids
+
+        now = datetime.utcnow()
+        await db.execute(
+            _insert_ignore(db, SkillCatalog, "normalized_name"),
+            [
+                {"name": name, "normalized_name": key, "created_at": now}
+                for key, name in missing.items()
+            ],
+        )
+        created = await db.execute(
+            select(SkillCatalog.normalized_name, SkillCatalog.id).where(
+                SkillCatalog.normalized_name.in_(missing)
+            )
+        )
+        await db.execute(
+            _insert_ignore(db, SkillAlias, "alias"),
+            [{"alias": key, "skill_id": skill_id} for key, skill_id in created.all()],
+        )
+        ids.update(await SkillCatalogRepository.lookup(db, missing))
+        return ids
+
+    @staticmethod
+    async def canonicalize_skills(db: AsyncSession, batch_size: int = 1000) -> int:
+        """
+        Set skill_id on candidate and position skills written without one.
+
+        For rows inserted outside the repositories (seeding, generated
+        datasets). Works through batch_size distinct names at a time with
+        one executemany UPDATE per table, committing after each batch.
+        Returns the number of distinct names resolved.
+        """
+        resolved = 0
+        for model in (Skill, PositionSkill):
+            skipped: set[str] = set()
+            while True:
+                query = select(model.name).where(model.skill_id.is_(None)).distinct()
+                if skipped:
+                    query = query.where(model.name.not_in(skipped))
+                names = list((await db.execute(query.limit(batch_size))).scalars())
+                if not names:
+                    break
+                ids = await SkillCatalogRepository.resolve(db, names)
+                rows = []
+                for name in names:
+                    skill_id = ids.get(normalize_skill(name))
+                    if skill_id is None:
+                        skipped.add(name)
+                    else:
+                        rows.append({"skill_name": name, "skill_id": skill_id})
+                if rows:
+                    table = model.__table__
+                    await db.execute(
+                        update(table)
+                        .where(
+                            table.c.name == bindparam("skill_name"),
+                            table.c.skill_id.is_(None),
+                        )
+                        .values(skill_id=bindparam("skill_id")),
+                        rows,
+                    )
+                await db.commit()
+                resolved += len(rows)
+        return resolved
+
+
+def _insert_ignore(db: AsyncSession, model, key: str):
+    """INSERT that skips rows whose unique key already exists."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        return sqlite_insert(model).on_conflict_do_nothing(index_elements=[key])
+    if dialect == "mysql":
+        stmt = mysql_insert(model)
+        return stmt.on_duplicate_key_update({key: stmt.inserted[key]})
+    return insert(model)
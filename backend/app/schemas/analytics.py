@@ -0,0 +1,50 @@
+"""Analytics schemas."""
+
+from datetime import date
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.position import PositionStatus
+
+
+class PositionApplications(BaseModel):
+    """Applications received by one position."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    position_id: str = Field(alias="positionId")
+    title: str
+    department: str
+    status: PositionStatus
+    applications: int
+
+
+class DepartmentBreakdown(BaseModel):
+    """A department's positions by status and applications by candidate status."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    department: str
+    positions: dict[str, int] = {}  # Position status -> count
+    applications: dict[str, int] = {}  # Candidate status -> count
+    total_positions: int = Field(0, alias="totalPositions")
+    total_applications: int = Field(0, alias="totalApplications")
+
+
+class OpeningsPeriod(BaseModel):
+    """Positions posted in one day or month."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    period: date  # First day of the period
+    positions: int
+
+
+class PipelineResponse(BaseModel):
+    """Recruiting pipeline overview."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    positions: list[PositionApplications]
+    departments: list[DepartmentBreakdown]
+    openings: list[OpeningsPeriod]
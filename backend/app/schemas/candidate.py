@@ -54,6 +54,16 @@ class DocumentSchema(BaseModel):
     url: str
 
 
+class DocumentDetailSchema(DocumentSchema):
+    """Document as listed in candidate details."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    id: str
+    # Set for uploaded files only
+    preview_url: Optional[str] = Field(None, alias="previewUrl")
+
+
 # Main candidate schemas
 class CandidateListItem(BaseModel):
     """Candidate list item (summary view)."""
@@ -94,12 +104,61 @@ class CandidateDetail(BaseModel):
     experience: list[ExperienceSchema] = []
     education: list[EducationSchema] = []
     skills: list[SkillSchema] = []
-    documents: list[DocumentSchema] = []
+    documents: list[DocumentDetailSchema] = []
     applied_positions: list[str] = Field(default=[], alias="appliedPositions")
 
 
+class CandidateWrite(BaseModel):
+    """
+    Candidate create/update payload.
+
+    Nested collections replace whatever the candidate had before.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    name: str = Field(..., min_length=1)
+    email: EmailStr
+    phone: str = Field(..., min_length=1)
+    location: str = Field(..., min_length=1)
+    summary: str = Field(..., min_length=1)
+    status: CandidateStatus = CandidateStatus.ACTIVE
+    sort_order: int = Field(0, alias="sortOrder")
+
+    experience: list[ExperienceSchema] = []
+    education: list[EducationSchema] = []
+    skills: list[SkillSchema] = []
+    documents: list[DocumentSchema] = []
+
+
 class CandidateListResponse(BaseModel):
     """Response for candidate list endpoint."""
 
     candidates: list[CandidateListItem]
     total: int
+
+
+class CandidateBatchResponse(BaseModel):
+    """Response for the batch detail endpoint."""
+
+    candidates: list[CandidateDetail]  # In request order
+    missing: list[str]  # Requested ids with no candidate
+
+
+class CandidateImportError(BaseModel):
+    """A spreadsheet row that failed validation."""
+
+    row: int
+    message: str
+
+
+class CandidateImportResult(BaseModel):
+    """Summary of a candidate import."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    rows_read: int = Field(alias="rowsRead")
+    imported: int
+    invalid: int
+    # Capped so a badly broken file does not produce an unbounded response
+    errors: list[CandidateImportError] = []
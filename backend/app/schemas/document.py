@@ -0,0 +1,25 @@
+"""Document schemas."""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.document import DocumentType
+
+
+class DocumentResponse(BaseModel):
+    """An uploaded document with its storage metadata."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    id: str
+    candidate_id: str = Field(alias="candidateId")
+    type: DocumentType
+    name: str
+    url: str
+    preview_url: Optional[str] = Field(None, alias="previewUrl")
+    content_type: Optional[str] = Field(None, alias="contentType")
+    size: Optional[int] = None
+    checksum: Optional[str] = None
+    uploaded_at: datetime = Field(alias="uploadedAt")
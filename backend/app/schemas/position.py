@@ -1,8 +1,9 @@
 """Position schemas matching Exercise 1 JSON contract."""
 
 from datetime import date
+from typing import Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from app.models.position import PositionStatus
 
@@ -45,6 +46,24 @@ class PositionDetail(BaseModel):
     sort_order: int = Field(alias="sortOrder")
 
 
+class TopCandidateItem(BaseModel):
+    """A candidate's stored match score for a position."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    candidate_id: str = Field(alias="candidateId")
+    name: str
+    score: float
+    skill_score: float = Field(alias="skillScore")
+    experience_score: float = Field(alias="experienceScore")
+
+
+class PositionDetailWithTopCandidates(PositionDetail):
+    """Position detail with its best-ranked candidates, best first."""
+
+    top_candidates: list[TopCandidateItem] = Field(default=[], alias="topCandidates")
+
+
 class PositionUpdate(BaseModel):
     """Position update schema."""
 
@@ -69,8 +88,83 @@ class PositionUpdate(BaseModel):
         return v
 
 
+class PositionPatch(BaseModel):
+    """Partial position update; only the fields sent are changed."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    title: Optional[str] = Field(None, min_length=1)
+    department: Optional[str] = Field(None, min_length=1)
+    location: Optional[str] = Field(None, min_length=1)
+    description: Optional[str] = Field(None, min_length=1)
+    requirements: Optional[str] = Field(None, min_length=1)
+    required_skills: Optional[list[str]] = Field(None, alias="requiredSkills")
+    min_experience_years: Optional[int] = Field(None, ge=0, alias="minExperienceYears")
+    status: Optional[PositionStatus] = None
+    posted_date: Optional[date] = Field(None, alias="postedDate")
+
+    @model_validator(mode="after")
+    def validate_no_nulls(self):
+        """Reject explicit nulls; omit a field to leave it unchanged."""
+        for name in self.model_fields_set:
+            if getattr(self, name) is None:
+                raise ValueError(f"{name} cannot be null")
+        return self
+
+
 class PositionListResponse(BaseModel):
     """Response for position list endpoint."""
 
     positions: list[PositionListItem]
     total: int
+
+
+class PositionCandidatesRequest(BaseModel):
+    """Bulk assign/unassign request: candidate IDs for one position."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    candidate_ids: list[str] = Field(alias="candidateIds", min_length=1, max_length=1000)
+
+
+class CandidateAssignmentResult(BaseModel):
+    """Outcome for a single candidate ID in a bulk request."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    candidate_id: str = Field(alias="candidateId")
+    status: Literal["added", "already_assigned", "removed", "not_assigned", "not_found"]
+
+
+class PositionCandidatesResponse(BaseModel):
+    """Per-candidate report for a bulk assign/unassign request."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    position_id: str = Field(alias="positionId")
+    results: list[CandidateAssignmentResult]
+
+
+class CandidateMatchItem(BaseModel):
+    """One candidate's match score against a position."""
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    candidate_id: str = Field(alias="candidateId")
+    name: str
+    score: float
+    skill_score: float = Field(alias="skillScore")
+    experience_score: float = Field(alias="experienceScore")
+    years_of_experience: int = Field(alias="yearsOfExperience")
+    matched_skills: list[str] = Field(alias="matchedSkills")
+    missing_skills: list[str] = Field(alias="missingSkills")
+
+
+class PositionMatchesResponse(BaseModel):
+    """Best-matching active candidates for a position, best first."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    position_id: str = Field(alias="positionId")
+    matches: list[CandidateMatchItem]
+    scored: int  # Active candidates considered
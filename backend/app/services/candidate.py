@@ -52,3 +52,12 @@ class CandidateService:
 
         # Round to nearest year
         return round(total_months / 12)
+
+    @staticmethod
+    def build_search_text(name: str, email: str, skill_names: list[str]) -> str:
+        """
+        Build the lowercase text that candidate search matches against.
+
+        Stored on the candidate so a search needs no join to skills.
+        """
+        return " ".join([name, email, *skill_names]).lower()
@@ -0,0 +1,157 @@
+"""Streaming candidate export as CSV, XLSX or NDJSON."""
+
+import csv
+import io
+import json
+import tempfile
+from collections.abc import AsyncIterator
+from typing import Literal, Optional
+
+from openpyxl import Workbook
+from sqlalchemy import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.models.candidate import CandidateStatus
+from app.repositories.candidate import CandidateRepository
+
+ExportFormat = Literal["csv", "xlsx", "ndjson"]
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "ndjson": "application/x-ndjson",
+}
+
+# Column header -> key in the rows produced by CandidateRepository.stream_candidates
+COLUMNS = {
+    "id": "id",
+    "name": "name",
+    "email": "email",
+    "phone": "phone",
+    "location": "location",
+    "summary": "summary",
+    "status": "status",
+    "yearsOfExperience": "years_of_experience",
+    "sortOrder": "sort_order",
+    "skills": "skills",
+}
+
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+class CandidateExportService:
+    """Encode streamed candidates into export formats."""
+
+    @staticmethod
+    async def export(
+        engine: AsyncEngine,
+        export_format: ExportFormat,
+        status: Optional[CandidateStatus] = CandidateStatus.ACTIVE,
+        search: Optional[str] = None,
+        position_id: Optional[str] = None,
+        batch_size: int = 1000,
+        candidate_filter: Optional[ColumnElement[bool]] = None,
+        search_documents: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the encoded export for the filtered candidates.
+
+        candidate_filter restricts the export to the candidates matching a
+        skills expression. The export opens its own session on
+        engine: the response body is produced after the request's session
+        has been released.
+        """
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            batches = CandidateRepository.stream_candidates(
+                session,
+                status,
+                search,
+                position_id,
+                batch_size,
+                candidate_filter,
+                search_documents,
+            )
+            if export_format == "xlsx":
+                encoded = CandidateExportService._xlsx(batches)
+            elif export_format == "ndjson":
+                encoded = CandidateExportService._ndjson(batches)
+            else:
+                encoded = CandidateExportService._csv(batches)
+
+            async for chunk in encoded:
+                yield chunk
+
+    @staticmethod
+    async def _csv(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+        """Encode batches as CSV, one chunk per batch."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(COLUMNS)
+        async for batch in batches:
+            writer.writerows(_flat_row(candidate) for candidate in batch)
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    @staticmethod
+    async def _ndjson(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+        """Encode batches as newline-delimited JSON objects."""
+        async for batch in batches:
+            lines = []
+            for candidate in batch:
+                cells = {
+                    **candidate,
+                    "status": candidate["status"].value,
+                    "skills": [
+                        {"name": name, "level": level.value}
+                        for name, level in candidate["skills"]
+                    ],
+                }
+                record = {header: cells[key] for header, key in COLUMNS.items()}
+                lines.append(json.dumps(record) + "\n")
+            yield "".join(lines).encode("utf-8")
+
+    @staticmethod
+    async def _xlsx(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+        """
+        Encode batches as an XLSX workbook.
+
+        openpyxl's write-only mode spools rows to a temporary file instead of
+        keeping cells in memory; the zip container can only be produced once
+        every row is written, so the finished file is then streamed back in
+        chunks.
+        """
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Candidates")
+        sheet.append(list(COLUMNS))
+
+        async for batch in batches:
+            rows = [_flat_row(candidate) for candidate in batch]
+            await run_in_threadpool(_append_rows, sheet, rows)
+
+        with tempfile.TemporaryFile() as output:
+            await run_in_threadpool(workbook.save, output)
+            output.seek(0)
+            while chunk := await run_in_threadpool(output.read, FILE_CHUNK_SIZE):
+                yield chunk
+
+
+def _flat_row(candidate: dict) -> list:
+    """Render a candidate as spreadsheet cells, skills as "Name (Level); ..."."""
+    cells = {
+        **candidate,
+        "status": candidate["status"].value,
+        "skills": "; ".join(
+            f"{name} ({level.value})" for name, level in candidate["skills"]
+        ),
+    }
+    return [cells[key] for key in COLUMNS.values()]
+
+
+def _append_rows(sheet, rows: list[list]) -> None:
+    """Append rows to a write-only worksheet."""
+    for row in rows:
+        sheet.append(row)
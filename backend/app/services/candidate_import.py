@@ -0,0 +1,201 @@
+"""Streaming spreadsheet import for candidates."""
+
+import shutil
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+import pandas as pd
+from openpyxl import load_workbook
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.repositories.candidate import CandidateRepository
+from app.schemas.candidate import (
+    CandidateImportError,
+    CandidateImportResult,
+    CandidateWrite,
+)
+from app.services.jobs import ProgressReporter, job_handler
+
+SUPPORTED_FORMATS = (".csv", ".xlsx")
+DEFAULT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+
+
+class CandidateImportService:
+    """Import candidates from CSV or Excel files, upserting on email."""
+
+    @staticmethod
+    def iter_rows(file: BinaryIO, filename: str, chunk_size: int) -> Iterator[dict]:
+        """
+        Yield raw rows as dicts keyed by header, without loading the file.
+
+        CSV is read in pandas chunks of chunk_size rows; xlsx through
+        openpyxl's read-only mode, which streams the sheet XML. Empty cells
+        are dropped so schema defaults apply.
+
+        Raises ValueError for unsupported file types.
+        """
+        suffix = Path(filename).suffix.lower()
+
+        if suffix == ".csv":
+            chunks = pd.read_csv(
+                file, chunksize=chunk_size, dtype=str, keep_default_na=False
+            )
+            for chunk in chunks:
+                for record in chunk.to_dict("records"):
+                    yield {
+                        key.strip(): value.strip()
+                        for key, value in record.items()
+                        if value.strip()
+                    }
+            return
+
+        if suffix == ".xlsx":
+            workbook = load_workbook(file, read_only=True, data_only=True)
+            try:
+                rows = workbook.active.iter_rows(values_only=True)
+                header = [str(cell).strip() if cell is not None else "" for cell in next(rows, [])]
+                for values in rows:
+                    yield {
+                        key: _cell_to_str(value)
+                        for key, value in zip(header, values)
+                        if key and value is not None and str(value).strip()
+                    }
+            finally:
+                workbook.close()
+            return
+
+        CandidateImportService.check_format(filename)
+
+    @staticmethod
+    def iter_batches(
+        rows: Iterator[dict],
+        batch_size: int,
+        result: CandidateImportResult,
+    ) -> Iterator[list[dict]]:
+        """
+        Validate rows with CandidateWrite and yield them in batches.
+
+        Invalid rows are counted (and the first few recorded) on result.
+        Row numbers match the spreadsheet, with the header as row 1.
+        """
+        batch = []
+        for row_number, raw in enumerate(rows, start=2):
+            if not raw:
+                continue
+            result.rows_read += 1
+            try:
+                candidate = CandidateWrite.model_validate(raw)
+            except ValidationError as e:
+                result.invalid += 1
+                if len(result.errors) < MAX_REPORTED_ERRORS:
+                    result.errors.append(
+                        CandidateImportError(row=row_number, message=_summarize(e))
+                    )
+                continue
+
+            # Only the columns the row filled in, so an update leaves the rest
+            batch.append(
+                candidate.model_dump(
+                    exclude={"experience", "education", "skills", "documents"},
+                    exclude_unset=True,
+                )
+            )
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    async def import_candidates(
+        db: AsyncSession,
+        file: BinaryIO,
+        filename: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress: Optional[ProgressReporter] = None,
+    ) -> CandidateImportResult:
+        """
+        Stream a CSV or xlsx file into the candidates table.
+
+        Parsing runs in a worker thread one batch at a time, so only a single
+        batch is held in memory and the event loop is not blocked. Each batch
+        is upserted on email and committed on its own; progress, if given, is
+        called with the rows read so far after every batch.
+
+        Raises ValueError for unsupported file types.
+        """
+        CandidateImportService.check_format(filename)
+        result = CandidateImportResult(rows_read=0, imported=0, invalid=0)
+        rows = CandidateImportService.iter_rows(file, filename, batch_size)
+        batches = CandidateImportService.iter_batches(rows, batch_size, result)
+
+        while True:
+            batch = await run_in_threadpool(next, batches, None)
+            if batch is None:
+                break
+            result.imported += await CandidateRepository.upsert_candidates(db, batch)
+            if progress is not None:
+                await progress(result.rows_read)
+
+        return result
+
+    @staticmethod
+    def check_format(filename: str) -> None:
+        """Raise ValueError unless filename has a supported extension."""
+        suffix = Path(filename).suffix.lower()
+        if suffix not in SUPPORTED_FORMATS:
+            raise ValueError(
+                f"Unsupported file type '{suffix}'; expected one of {', '.join(SUPPORTED_FORMATS)}"
+            )
+
+    @staticmethod
+    def spool_upload(file: BinaryIO, filename: str) -> str:
+        """
+        Copy an upload to a temporary file for a background import.
+
+        Returns the path; the import job deletes it when done.
+        """
+        suffix = Path(filename).suffix.lower()
+        with tempfile.NamedTemporaryFile(
+            prefix="candidate-import-", suffix=suffix, delete=False
+        ) as spooled:
+            shutil.copyfileobj(file, spooled)
+        return spooled.name
+
+
+@job_handler("candidate_import")
+async def run_import_job(
+    db: AsyncSession,
+    params: dict[str, Any],
+    report: ProgressReporter,
+) -> dict[str, Any]:
+    """Background job: import a spooled upload, then delete it."""
+    path = Path(params["path"])
+    try:
+        with path.open("rb") as file:
+            result = await CandidateImportService.import_candidates(
+                db, file, params["filename"], progress=report
+            )
+    finally:
+        path.unlink(missing_ok=True)
+    return result.model_dump(by_alias=True)
+
+
+def _cell_to_str(value) -> str:
+    """Render an Excel cell as the string a CSV would hold."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _summarize(error: ValidationError) -> str:
+    """Flatten a pydantic error into one line."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+        for item in error.errors()
+    )
@@ -0,0 +1,140 @@
+"""Streaming ZIP archives of stored documents."""
+
+import logging
+import os
+import zipfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import PurePosixPath
+
+from app.services.document_storage import DocumentStorageService
+
+logger = logging.getLogger(__name__)
+
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class ArchiveEntry:
+    """One stored file and the path it gets inside the archive."""
+
+    name: str
+    storage_key: str
+    modified: datetime
+
+
+class _ZipOutput:
+    """
+    Write-only sink that hands zipfile's output back in pieces.
+
+    It has no tell() or seek(), so zipfile writes in streaming mode: sizes
+    and CRCs go into data descriptors after each entry instead of being
+    patched into headers it has already written.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class DocumentArchiveService:
+    """Bundle stored documents into ZIP archives on the fly."""
+
+    @staticmethod
+    def candidate_entries(documents: list[dict]) -> list[ArchiveEntry]:
+        """Archive entries for one candidate's documents, at the top level."""
+        used: set[str] = set()
+        return [_entry(_unique_name(document["name"], used), document) for document in documents]
+
+    @staticmethod
+    def position_entries(documents: list[dict]) -> list[ArchiveEntry]:
+        """Archive entries for a position, one folder per candidate."""
+        folders: dict[str, str] = {}
+        used_folders: set[str] = set()
+        used_names: dict[str, set[str]] = {}
+        entries = []
+        for document in documents:
+            candidate_id = document["candidate_id"]
+            if candidate_id not in folders:
+                folders[candidate_id] = _unique_name(document["candidate_name"], used_folders)
+                used_names[candidate_id] = set()
+            name = _unique_name(document["name"], used_names[candidate_id])
+            entries.append(_entry(f"{folders[candidate_id]}/{name}", document))
+        return entries
+
+    @staticmethod
+    def stream_zip(entries: list[ArchiveEntry]) -> Iterator[bytes]:
+        """
+        Yield a ZIP archive of the entries' files as it is written.
+
+        Blocking; the response iterates it in a worker thread. Each file is
+        copied in FILE_CHUNK_SIZE pieces and everything zipfile has produced
+        is yielded after every piece, so memory use does not depend on the
+        number or size of the files. Files are stored uncompressed: PDFs,
+        DOCX and images are compressed already. Files missing from disk are
+        skipped, since the response has already started.
+        """
+        output = _ZipOutput()
+        with zipfile.ZipFile(output, mode="w", compression=zipfile.ZIP_STORED) as archive:
+            for entry in entries:
+                path = DocumentStorageService.path_for(entry.storage_key)
+                try:
+                    source = open(path, "rb")
+                except FileNotFoundError:
+                    logger.warning("Skipping %s in archive: %s is missing", entry.name, path)
+                    continue
+                with source:
+                    info = zipfile.ZipInfo(entry.name, _zip_timestamp(entry.modified))
+                    # Lets zipfile decide up front whether the entry needs ZIP64
+                    info.file_size = os.fstat(source.fileno()).st_size
+                    with archive.open(info, mode="w") as target:
+                        while chunk := source.read(FILE_CHUNK_SIZE):
+                            target.write(chunk)
+                            if data := output.drain():
+                                yield data
+                if data := output.drain():
+                    yield data
+        yield output.drain()
+
+
+def _entry(name: str, document: dict) -> ArchiveEntry:
+    return ArchiveEntry(
+        name=name,
+        storage_key=document["storage_key"],
+        modified=document["uploaded_at"],
+    )
+
+
+def _unique_name(name: str, used: set[str]) -> str:
+    """
+    A safe archive path component, numbered if already used.
+
+    Path separators are replaced so user-supplied names cannot escape
+    their folder; "cv.pdf" then "cv.pdf" become "cv.pdf" and "cv (2).pdf".
+    """
+    safe = name.replace("/", "_").replace("\\", "_").strip().lstrip(".") or "document"
+    candidate, number = safe, 1
+    while candidate.lower() in used:
+        number += 1
+        path = PurePosixPath(safe)
+        candidate = f"{path.stem} ({number}){path.suffix}"
+    used.add(candidate.lower())
+    return candidate
+
+
+def _zip_timestamp(moment: datetime) -> tuple[int, int, int, int, int, int]:
+    """ZIP timestamps cannot predate 1980."""
+    moment = max(moment, datetime(1980, 1, 1))
+    return (moment.year, moment.month, moment.day, moment.hour, moment.minute, moment.second)
@@ -0,0 +1,243 @@
+"""First-page document previews, rendered on a process pool and cached on disk."""
+
+import asyncio
+import io
+import os
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.document import Document
+from app.models.preview import Preview, PreviewKind
+from app.repositories.document import DocumentRepository
+from app.repositories.preview import PreviewRepository
+from app.services.document_storage import DocumentStorageService
+from app.services.text_extraction import UnsupportedDocumentError, document_format, extract_text
+from app.services.worker_pool import DocumentWorkerPool
+
+PREVIEW_TEXT_CHARS = 2000
+IMAGE_FORMATS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp", ".tif", ".tiff"}
+MEDIA_TYPES = {
+    PreviewKind.IMAGE: "image/png",
+    PreviewKind.TEXT: "text/plain; charset=utf-8",
+}
+# accessed_at only needs to be roughly right to pick eviction victims
+ACCESS_RESOLUTION = timedelta(hours=1)
+EVICTION_BATCH_SIZE = 100
+
+
+def preview_format(name: str, content_type: Optional[str]) -> str:
+    """Like document_format, with any image/* content type mapped to an image format."""
+    file_format = document_format(name, content_type)
+    if file_format not in IMAGE_FORMATS and (content_type or "").lower().startswith("image/"):
+        return ".png"
+    return file_format
+
+
+def render_preview(source: str, destination: str, file_format: str, width: int) -> tuple[str, int]:
+    """
+    Write a preview of a file's first page and return (kind, bytes written).
+
+    PDFs have their first page rendered and images are scaled down, both to
+    a PNG at most `width` pixels wide; DOCX and text files get a snippet of
+    their opening text. The preview is written to destination plus the
+    kind's suffix, atomically. Runs inside a worker process.
+
+    Raises UnsupportedDocumentError for other formats.
+    """
+    if file_format == ".pdf" or file_format in IMAGE_FORMATS:
+        image = _pdf_first_page(source, width) if file_format == ".pdf" else _image(source, width)
+        data = io.BytesIO()
+        image.save(data, format="PNG", optimize=True)
+        kind, content = PreviewKind.IMAGE, data.getvalue()
+    else:
+        text = extract_text(source, file_format, PREVIEW_TEXT_CHARS).strip()
+        kind, content = PreviewKind.TEXT, text.encode("utf-8")
+
+    path = DocumentStorageService.preview_path(destination, kind.value)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(content)
+    os.replace(temp_path, path)
+    return kind.value, len(content)
+
+
+def _pdf_first_page(source: str, width: int):
+    """Render page one of a PDF at the given width (height capped at twice that)."""
+    import pypdfium2
+
+    pdf = pypdfium2.PdfDocument(source)
+    try:
+        if len(pdf) == 0:
+            raise UnsupportedDocumentError("PDF has no pages")
+        page = pdf[0]
+        page_width, page_height = page.get_size()
+        scale = min(width / page_width, 2 * width / page_height)
+        return page.render(scale=scale).to_pil()
+    finally:
+        pdf.close()
+
+
+def _image(source: str, width: int):
+    """Scale an image (its first frame) down to the given width."""
+    from PIL import Image
+
+    with Image.open(source) as image:
+        image.draft("RGB", (width, 2 * width))
+        image.thumbnail((width, 2 * width))
+        return image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+
+class PreviewGenerator(DocumentWorkerPool):
+    """
+    Generate document previews on a process pool and manage the cache.
+
+    Uploads queue their preview; documents stored earlier get one on first
+    request. Previews live next to their blob and are shared by identical
+    uploads. Once the files add up to more than cache_bytes, the least
+    recently requested previews are deleted, to be regenerated on demand.
+    """
+
+    name = "Preview generation"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        workers: int,
+        queue_size: int,
+        timeout: float,
+        width: int,
+        cache_bytes: int,
+    ):
+        super().__init__(workers, queue_size, timeout)
+        self.session_factory = session_factory
+        self.width = width
+        self.cache_bytes = cache_bytes
+
+    async def get_or_create(self, db: AsyncSession, document: Document) -> Optional[Preview]:
+        """
+        A stored document's preview, generating it now if there is none.
+
+        Marks the preview as used. Returns None if the preview could not be
+        generated this time because the worker pool was restarting.
+        """
+        preview = await PreviewRepository.get_preview(db, document.checksum)
+        if preview is not None and preview.kind != PreviewKind.UNAVAILABLE:
+            path = DocumentStorageService.preview_path(
+                DocumentStorageService.path_for(document.storage_key), preview.kind.value
+            )
+            if not await run_in_threadpool(path.exists):
+                # Evicted while we looked, or removed by hand
+                preview = None
+        if preview is None:
+            try:
+                preview = await self._generate(db, document)
+            except BrokenProcessPool:
+                return None
+        if preview is not None:
+            await PreviewRepository.touch(db, preview, ACCESS_RESOLUTION)
+        return preview
+
+    async def evict(self, db: AsyncSession) -> int:
+        """
+        Delete least recently used previews until the cache fits; return how many.
+
+        Rows are deleted before their files are removed and committed after,
+        like blob garbage collection.
+        """
+        evicted = 0
+        excess = await PreviewRepository.total_size(db) - self.cache_bytes
+        while excess > 0:
+            victims = []
+            for sha256, kind, size in await PreviewRepository.get_least_recent(
+                db, EVICTION_BATCH_SIZE
+            ):
+                victims.append((sha256, kind))
+                excess -= size
+                if excess <= 0:
+                    break
+            if not victims:
+                break
+            await PreviewRepository.delete_previews(db, [sha256 for sha256, _ in victims])
+            await run_in_threadpool(
+                _unlink_previews,
+                [
+                    (DocumentStorageService.storage_key_for(sha256), kind)
+                    for sha256, kind in victims
+                ],
+            )
+            await db.commit()
+            evicted += len(victims)
+        return evicted
+
+    async def _process(self, document_id: str, attempt: int) -> None:
+        """Generate the preview of a newly uploaded document, unless its blob has one."""
+        async with self.session_factory() as session:
+            document = await DocumentRepository.get_document_by_id(session, document_id)
+            if document is None or not document.storage_key:
+                return
+            if await PreviewRepository.get_preview(session, document.checksum) is not None:
+                return
+            # End the read transaction while rendering (keeps the loaded document)
+            await session.commit()
+            try:
+                await self._generate(session, document)
+            except BrokenProcessPool:
+                if not self.retry(document_id, attempt):
+                    await PreviewRepository.save_preview(
+                        session, document.checksum, PreviewKind.UNAVAILABLE, 0,
+                        "Preview process died",
+                    )
+
+    async def _generate(self, db: AsyncSession, document: Document) -> Optional[Preview]:
+        """
+        Render a document's preview and record it, evicting if over budget.
+
+        Uses the process pool when it runs (in the server) and a thread
+        otherwise. Failures are recorded as unavailable previews, so they
+        are not retried on every request. Raises BrokenProcessPool if the
+        pool restarted mid-render.
+        """
+        source = DocumentStorageService.path_for(document.storage_key)
+        args = (str(source), str(source), preview_format(document.name, document.content_type))
+        kind, size, error = PreviewKind.UNAVAILABLE, 0, None
+        try:
+            if self.running:
+                result = await self.run(render_preview, *args, self.width)
+            else:
+                result = await run_in_threadpool(render_preview, *args, self.width)
+            kind, size = PreviewKind(result[0]), result[1]
+        except asyncio.TimeoutError:
+            error = f"Timed out after {self.timeout:g}s"
+        except BrokenProcessPool:
+            raise
+        except UnsupportedDocumentError as e:
+            error = str(e)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+
+        await PreviewRepository.save_preview(db, document.checksum, kind, size, error)
+        if size:
+            await self.evict(db)
+        return await PreviewRepository.get_preview(db, document.checksum)
+
+
+def _unlink_previews(previews: list[tuple[str, PreviewKind]]) -> None:
+    """Delete preview files given (blob storage key, kind) pairs."""
+    for storage_key, kind in previews:
+        path = DocumentStorageService.path_for(storage_key)
+        DocumentStorageService.preview_path(path, kind.value).unlink(missing_ok=True)
+
+
+preview_generator = PreviewGenerator(
+    AsyncSessionLocal,
+    workers=settings.PREVIEW_WORKERS,
+    queue_size=settings.PREVIEW_QUEUE_SIZE,
+    timeout=settings.PREVIEW_TIMEOUT_SECONDS,
+    width=settings.PREVIEW_WIDTH,
+    cache_bytes=settings.PREVIEW_CACHE_MB * 1024 * 1024,
+)
@@ -0,0 +1,371 @@
+"""Streaming document uploads into content-addressed storage under STORAGE_PATH."""
+
+import hashlib
+import os
+import time
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Optional
+from uuid import uuid4
+
+from multipart.multipart import MultipartParser, parse_options_header
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.repositories.blob import BlobRepository
+
+FILE_FIELD = "file"
+MAX_FIELD_SIZE = 64 * 1024
+TEMP_PREFIX = ".upload-"
+GC_BATCH_SIZE = 500
+# Cached previews sit next to their blob as <sha256><suffix>, by preview kind
+PREVIEW_SUFFIXES = {"image": ".preview.png", "text": ".preview.txt"}
+
+
+class UploadTooLargeError(ValueError):
+    """The uploaded file exceeds MAX_UPLOAD_SIZE_MB."""
+
+
+@dataclass
+class StoredUpload:
+    """
+    A received file, plus the form fields sent with it.
+
+    The content sits in temp_path until place_blob() moves it to
+    storage_key, the blob path derived from its checksum.
+    """
+
+    document_id: str
+    storage_key: str
+    temp_path: Path
+    filename: str
+    content_type: str
+    size: int
+    checksum: str
+    fields: dict[str, str] = field(default_factory=dict)
+
+
+class _UploadSink:
+    """Temp file in the storage directory that hashes what it writes."""
+
+    def __init__(self, directory: Path):
+        self.path = directory / f"{TEMP_PREFIX}{uuid4().hex}"
+        self.file: BinaryIO = open(self.path, "xb")
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, chunks: list[bytes]) -> None:
+        for chunk in chunks:
+            self.sha256.update(chunk)
+            self.file.write(chunk)
+            self.size += len(chunk)
+
+    def finish(self) -> None:
+        """Flush everything to disk and close."""
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+    def discard(self) -> None:
+        self.file.close()
+        self.path.unlink(missing_ok=True)
+
+
+class DocumentStorageService:
+    """
+    Store uploaded candidate documents on local disk, once per content.
+
+    Files live at ab/cd/<sha256> under STORAGE_PATH: identical uploads share
+    one blob, and two levels of 256 shards keep every directory small. The
+    blobs table counts the documents referencing each blob; unreferenced
+    blobs are removed by scripts/gc_blobs.py.
+    """
+
+    @staticmethod
+    def storage_root() -> Path:
+        """Directory uploaded files live in (created on first use)."""
+        root = Path(settings.STORAGE_PATH)
+        root.mkdir(parents=True, exist_ok=True)
+        return root
+
+    @staticmethod
+    def path_for(storage_key: str) -> Path:
+        """Absolute path of a stored file."""
+        return Path(settings.STORAGE_PATH) / storage_key
+
+    @staticmethod
+    def storage_key_for(checksum: str) -> str:
+        """Sharded blob path for a SHA-256 hex digest."""
+        return f"{checksum[:2]}/{checksum[2:4]}/{checksum}"
+
+    @staticmethod
+    def preview_path(blob_path: str | os.PathLike[str], kind: str) -> Path:
+        """Where a blob's cached preview of the given kind lives."""
+        blob_path = Path(blob_path)
+        return blob_path.with_name(blob_path.name + PREVIEW_SUFFIXES[kind])
+
+    @staticmethod
+    def place_blob(temp_path: Path, storage_key: str) -> bool:
+        """
+        Move a received file to its blob path, unless the blob already exists.
+
+        Returns True if the file was stored, False if it was a duplicate (the
+        temp file is dropped and nothing else is written; only the blob's
+        mtime is refreshed, so the orphan sweep leaves it alone until the
+        new reference is committed).
+        """
+        destination = DocumentStorageService.path_for(storage_key)
+        if destination.exists():
+            temp_path.unlink(missing_ok=True)
+            os.utime(destination)
+            return False
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp_path, destination)
+        return True
+
+    @staticmethod
+    async def receive_upload(
+        content_type: str,
+        body: AsyncIterator[bytes],
+        max_bytes: int,
+    ) -> StoredUpload:
+        """
+        Parse a multipart/form-data body and stream its file part to disk.
+
+        The body is fed chunk by chunk to a push parser; file data goes
+        straight to a temp file next to its destination while the SHA-256 is
+        computed, so the whole file is never held in memory or spooled
+        twice. Small text parts are collected as form fields. The returned
+        temp file is complete and synced; the caller places or discards it.
+
+        Raises UploadTooLargeError past max_bytes, ValueError for a
+        malformed body or a missing file part.
+        """
+        media_type, options = parse_options_header(content_type)
+        if media_type != b"multipart/form-data" or b"boundary" not in options:
+            raise ValueError("Expected a multipart/form-data body")
+
+        # Parser callbacks only record events; the awaits happen between chunks
+        events: list[tuple[str, bytes]] = []
+        header_field = bytearray()
+        header_value = bytearray()
+
+        def on_header_field(data: bytes, start: int, end: int) -> None:
+            header_field.extend(data[start:end])
+
+        def on_header_value(data: bytes, start: int, end: int) -> None:
+            header_value.extend(data[start:end])
+
+        def on_header_end() -> None:
+            events.append(("header", bytes(header_field).lower() + b":" + bytes(header_value)))
+            header_field.clear()
+            header_value.clear()
+
+        parser = MultipartParser(
+            options[b"boundary"],
+            {
+                "on_part_begin": lambda: events.append(("begin", b"")),
+                "on_header_field": on_header_field,
+                "on_header_value": on_header_value,
+                "on_header_end": on_header_end,
+                "on_headers_finished": lambda: events.append(("headers_finished", b"")),
+                "on_part_data": lambda data, start, end: events.append(("data", data[start:end])),
+                "on_part_end": lambda: events.append(("end", b"")),
+            },
+        )
+
+        root = DocumentStorageService.storage_root()
+        sink: Optional[_UploadSink] = None
+        upload: Optional[StoredUpload] = None
+        fields: dict[str, str] = {}
+        headers: dict[bytes, bytes] = {}
+        part_name = ""
+        field_value = bytearray()
+        in_file = False
+
+        try:
+            async for chunk in body:
+                parser.write(chunk)
+                pending: list[bytes] = []
+                for kind, data in events:
+                    if kind == "begin":
+                        headers = {}
+                        field_value.clear()
+                    elif kind == "header":
+                        name, _, value = data.partition(b":")
+                        headers[name.strip()] = value.strip()
+                    elif kind == "headers_finished":
+                        part_name, in_file, filename = _describe_part(headers)
+                        if in_file:
+                            if sink is not None:
+                                raise ValueError("Only one file can be uploaded at a time")
+                            sink = await run_in_threadpool(_UploadSink, root)
+                            upload = StoredUpload(
+                                document_id="",
+                                storage_key="",
+                                temp_path=sink.path,
+                                filename=filename,
+                                content_type=headers.get(
+                                    b"content-type", b"application/octet-stream"
+                                ).decode("latin-1"),
+                                size=0,
+                                checksum="",
+                            )
+                    elif kind == "data":
+                        if in_file:
+                            pending.append(data)
+                        else:
+                            field_value.extend(data)
+                            if len(field_value) > MAX_FIELD_SIZE:
+                                raise ValueError(f"Form field {part_name} is too large")
+                    elif kind == "end" and not in_file:
+                        fields[part_name] = field_value.decode("utf-8", "replace")
+                events.clear()
+
+                if pending:
+                    await run_in_threadpool(sink.write, pending)
+                    if sink.size > max_bytes:
+                        raise UploadTooLargeError(
+                            f"File exceeds the {max_bytes // (1024 * 1024)} MB upload limit"
+                        )
+            parser.finalize()
+
+            if sink is None:
+                raise ValueError(f"Missing file part '{FILE_FIELD}'")
+
+            await run_in_threadpool(sink.finish)
+            upload.document_id = str(uuid4())
+            upload.checksum = sink.sha256.hexdigest()
+            upload.storage_key = DocumentStorageService.storage_key_for(upload.checksum)
+            upload.temp_path = sink.path
+            upload.size = sink.size
+            upload.fields = fields
+            return upload
+        except BaseException:
+            if sink is not None:
+                await run_in_threadpool(sink.discard)
+            raise
+
+    @staticmethod
+    async def discard_upload(upload: StoredUpload) -> None:
+        """Remove a received file that will not be stored."""
+        await run_in_threadpool(upload.temp_path.unlink, missing_ok=True)
+
+    @staticmethod
+    async def collect_garbage(db: AsyncSession, batch_size: int = GC_BATCH_SIZE) -> tuple[int, int]:
+        """
+        Delete unreferenced blobs and their files in batches.
+
+        Each batch deletes the rows that are still unreferenced, removes
+        their files and only then commits, so an upload re-referencing one
+        of them waits on the row lock and stores the file afresh. Returns
+        (blobs removed, bytes freed).
+        """
+        removed = freed = 0
+        while True:
+            candidates = await BlobRepository.get_unreferenced(db, batch_size)
+            if not candidates:
+                break
+            deleted = await BlobRepository.delete_unreferenced(db, candidates)
+            keys = [DocumentStorageService.storage_key_for(h) for h in deleted]
+            freed += await run_in_threadpool(
+                _unlink_files,
+                keys + [key + suffix for key in keys for suffix in PREVIEW_SUFFIXES.values()],
+            )
+            await db.commit()
+            removed += len(deleted)
+            if len(candidates) < batch_size:
+                break
+        return removed, freed
+
+    @staticmethod
+    async def sweep_orphans(
+        db: AsyncSession,
+        min_age_seconds: float = 3600,
+        batch_size: int = GC_BATCH_SIZE,
+    ) -> tuple[int, int]:
+        """
+        Remove files with no blob row, and abandoned upload temp files.
+
+        These only appear when a process dies between writing a file and
+        committing its row. Files younger than min_age_seconds are skipped,
+        as they may belong to an upload in progress. Walks the whole shard
+        tree, so it is slower than collect_garbage. Returns (files removed,
+        bytes freed).
+        """
+        root = Path(settings.STORAGE_PATH)
+        cutoff = time.time() - min_age_seconds
+        removed = freed = 0
+
+        stale_temps = await run_in_threadpool(
+            lambda: [
+                path.name for path in root.glob(f"{TEMP_PREFIX}*") if _older_than(path, cutoff)
+            ]
+        )
+        freed += await run_in_threadpool(_unlink_files, stale_temps)
+        removed += len(stale_temps)
+
+        batches = _iter_blob_files(root, cutoff, batch_size)
+        while batch := await run_in_threadpool(next, batches, None):
+            # Previews are named after their blob; half-written ones end in .tmp
+            hashes = [path.name.split(".")[0] for path in batch]
+            known = await BlobRepository.existing(db, hashes)
+            await db.rollback()
+            orphans = [
+                str(path.relative_to(root))
+                for path, sha256 in zip(batch, hashes)
+                if sha256 not in known or path.suffix == ".tmp"
+            ]
+            freed += await run_in_threadpool(_unlink_files, orphans)
+            removed += len(orphans)
+        return removed, freed
+
+
+def _older_than(path: Path, cutoff: float) -> bool:
+    """Whether a file was last modified before cutoff (False once it is gone)."""
+    try:
+        return path.stat().st_mtime < cutoff
+    except FileNotFoundError:
+        return False
+
+
+def _iter_blob_files(root: Path, cutoff: float, batch_size: int) -> Iterator[list[Path]]:
+    """Yield files in the ab/cd/ shard tree last modified before cutoff, in batches."""
+    batch = []
+    for path in root.glob("??/??/*"):
+        if not _older_than(path, cutoff):
+            continue
+        batch.append(path)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _unlink_files(storage_keys: list[str]) -> int:
+    """Delete stored files, returning the bytes freed."""
+    freed = 0
+    for key in storage_keys:
+        path = DocumentStorageService.path_for(key)
+        try:
+            freed += path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            pass
+    return freed
+
+
+def _describe_part(headers: dict[bytes, bytes]) -> tuple[str, bool, str]:
+    """Return (field name, is the file part, filename) from part headers."""
+    disposition = headers.get(b"content-disposition")
+    if disposition is None:
+        raise ValueError("Multipart part without Content-Disposition")
+    _, params = parse_options_header(disposition)
+    name = params.get(b"name", b"").decode("utf-8", "replace")
+    filename = params.get(b"filename")
+    if name == FILE_FIELD and filename is not None:
+        return name, True, Path(filename.decode("utf-8", "replace")).name or "upload"
+    return name, False, ""
@@ -0,0 +1,65 @@
+"""Periodic recompute of stored years of experience for current roles."""
+
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.db.session import AsyncSessionLocal
+from app.repositories.candidate import CandidateRepository
+from app.services.matching import matching_service
+
+logger = logging.getLogger(__name__)
+
+
+class ExperienceRefresher:
+    """
+    Keep candidates.years_of_experience current for roles without an end date.
+
+    The list and detail endpoints compute years live, while matching and the
+    stored position scores rank on the column; this recomputes it once when
+    the app starts and then every interval_seconds, so the two agree to
+    within a day by default.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, interval_seconds: float):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start refreshing in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def refresh(self) -> int:
+        """Recompute now; returns the number of candidates updated."""
+        async with self.session_factory() as session:
+            updated = await CandidateRepository.refresh_current_experience(session)
+        if updated:
+            # The matrix only tracks updated_at, which this does not bump
+            matching_service.invalidate()
+        logger.info("Years of experience refreshed for %d candidates", updated)
+        return updated
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Years of experience refresh failed")
+            await asyncio.sleep(self.interval_seconds)
+
+
+experience_refresher = ExperienceRefresher(
+    AsyncSessionLocal, settings.EXPERIENCE_REFRESH_HOURS * 3600
+)
@@ -0,0 +1,185 @@
+"""In-process background job runner."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.job import Job, JobStatus
+from app.repositories.job import JobRepository
+
+logger = logging.getLogger(__name__)
+
+# report(processed, total=None) records progress from inside a handler
+ProgressReporter = Callable[..., Awaitable[None]]
+JobHandler = Callable[
+    [AsyncSession, dict[str, Any], ProgressReporter], Awaitable[Optional[dict[str, Any]]]
+]
+
+# Job type -> handler, filled by @job_handler
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(job_type: str) -> Callable[[JobHandler], JobHandler]:
+    """
+    Register a coroutine as the handler for a job type.
+
+    The handler is called as handler(session, params, report) and returns
+    a JSON-serializable result dict (or None).
+    """
+    def decorator(func: JobHandler) -> JobHandler:
+        _handlers[job_type] = func
+        return func
+
+    return decorator
+
+
+class JobRunner:
+    """
+    Run jobs on a fixed pool of asyncio workers inside the app process.
+
+    Job state lives in the jobs table; the in-memory queue only carries ids,
+    so at most `workers` jobs run at a time and everything else waits as
+    queued. Each job gets its own session, separate from any request.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        workers: int,
+        progress_interval: float = 0.5,
+    ):
+        self.session_factory = session_factory
+        self.workers = workers
+        self.progress_interval = progress_interval
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """
+        Start the workers and recover jobs left over from a previous process.
+
+        Queued jobs are re-enqueued; jobs that were running when the process
+        stopped are marked failed, since their handlers may not be idempotent.
+        """
+        if self._tasks:
+            return
+
+        async with self.session_factory() as session:
+            queued, running = await JobRepository.get_unfinished_job_ids(session)
+            for job_id in running:
+                await JobRepository.finish_job(
+                    session, job_id, JobStatus.FAILED, error="Interrupted by restart"
+                )
+        for job_id in queued:
+            self._queue.put_nowait(job_id)
+
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Cancel the workers; unfinished jobs are recovered on next start."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(
+        self,
+        db: AsyncSession,
+        job_type: str,
+        params: dict[str, Any],
+        created_by: Optional[str] = None,
+    ) -> Job:
+        """
+        Persist a queued job and hand it to the workers.
+
+        Raises ValueError for job types without a registered handler.
+        """
+        if job_type not in _handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        job = await JobRepository.create_job(db, job_type, params, created_by)
+        self._queue.put_nowait(job.id)
+        return job
+
+    async def wait_idle(self) -> None:
+        """Wait until every enqueued job has finished."""
+        await self._queue.join()
+
+    async def _worker(self) -> None:
+        """Take job ids off the queue and run them one at a time."""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception:
+                logger.exception("Job %s could not be recorded", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        """Run one job and record its outcome."""
+        async with self.session_factory() as session:
+            if not await JobRepository.mark_running(session, job_id):
+                return
+            job = await JobRepository.get_job_by_id(session, job_id)
+            handler = _handlers.get(job.type)
+            if handler is None:
+                await JobRepository.finish_job(
+                    session, job_id, JobStatus.FAILED, error=f"Unknown job type: {job.type}"
+                )
+                return
+
+            report = _ProgressReporter(self.session_factory, job_id, self.progress_interval)
+            try:
+                result = await handler(session, job.params, report)
+            except Exception as e:
+                logger.exception("Job %s (%s) failed", job_id, job.type)
+                await session.rollback()
+                await report.flush()
+                await JobRepository.finish_job(session, job_id, JobStatus.FAILED, error=str(e))
+                return
+
+            await report.flush()
+            await JobRepository.finish_job(session, job_id, JobStatus.SUCCEEDED, result=result)
+
+
+class _ProgressReporter:
+    """
+    The report(processed, total=None) callback handed to job handlers.
+
+    Writes go through a separate session so they never commit the handler's
+    own transaction, and are throttled to one per interval; flush() writes
+    whatever was reported last.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, job_id: str, interval: float):
+        self.session_factory = session_factory
+        self.job_id = job_id
+        self.interval = interval
+        self._last_write = 0.0
+        self._pending: Optional[tuple[int, Optional[int]]] = None
+
+    async def __call__(self, processed: int, total: Optional[int] = None) -> None:
+        self._pending = (processed, total)
+        now = time.monotonic()
+        if now - self._last_write >= self.interval:
+            self._last_write = now
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the latest reported progress, if not written yet."""
+        if self._pending is None:
+            return
+        processed, total = self._pending
+        self._pending = None
+        async with self.session_factory() as session:
+            await JobRepository.update_progress(session, self.job_id, processed, total)
+
+
+job_runner = JobRunner(AsyncSessionLocal, workers=settings.JOB_WORKERS)
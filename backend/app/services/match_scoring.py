@@ -0,0 +1,48 @@
+"""Candidate-position match scores, shared by live matching and the materialized ranking."""
+
+from collections.abc import Iterable
+from typing import Optional
+
+from app.models.skill import SkillLevel
+
+# A required skill held at this level counts this much toward the skill score
+LEVEL_WEIGHTS = {
+    SkillLevel.BEGINNER: 0.25,
+    SkillLevel.INTERMEDIATE: 0.5,
+    SkillLevel.ADVANCED: 0.75,
+    SkillLevel.EXPERT: 1.0,
+}
+SKILL_WEIGHT = 0.8
+EXPERIENCE_WEIGHT = 0.2
+
+
+def skill_weights(skills: Iterable[tuple[int, SkillLevel]]) -> dict[int, float]:
+    """
+    Catalog skill id -> level weight for one candidate; SkillMatrix uses it too.
+
+    Aliases of one skill ("JS", "JavaScript") count once, at the higher level.
+    """
+    weights: dict[int, float] = {}
+    for skill_id, level in skills:
+        weights[skill_id] = max(weights.get(skill_id, 0.0), LEVEL_WEIGHTS[level])
+    return weights
+
+
+def score_candidate(
+    weights: dict[int, float],
+    required: list[Optional[int]],
+    years: int,
+    min_experience_years: int,
+) -> tuple[float, float, float]:
+    """
+    (score, skill score, experience score) of one candidate, as SkillMatrix computes them.
+
+    weights maps the candidate's catalog skill ids to level weights;
+    required holds the position's skill ids (None for unresolved names).
+    """
+    unique = {skill_id for skill_id in required if skill_id is not None}
+    count = len(unique) + sum(1 for skill_id in required if skill_id is None)
+    skill_score = sum(weights.get(skill_id, 0.0) for skill_id in unique) / count if count else 1.0
+    experience_score = min(years / min_experience_years, 1.0) if min_experience_years > 0 else 1.0
+    score = SKILL_WEIGHT * skill_score + EXPERIENCE_WEIGHT * experience_score
+    return round(score, 4), round(skill_score, 4), round(experience_score, 4)
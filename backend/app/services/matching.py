@@ -0,0 +1,216 @@
+"""Vectorized candidate-position matching over a sparse skill matrix."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.models.candidate import CandidateStatus
+from app.repositories.candidate import CandidateRepository
+from app.services.match_scoring import EXPERIENCE_WEIGHT, SKILL_WEIGHT, skill_weights
+
+# Rebuild at least this often, in case a write landed within the same
+# updated_at second as the last build
+MAX_MATRIX_AGE_SECONDS = 300
+LOAD_BATCH_SIZE = 5000
+
+
+@dataclass
+class CandidateMatch:
+    """One candidate's score against a position."""
+
+    candidate_id: str
+    name: str
+    score: float
+    skill_score: float
+    experience_score: float
+    years_of_experience: int
+    matched_skills: list[str]
+    missing_skills: list[str]
+
+
+@dataclass
+class SkillMatrix:
+    """
+    Active candidates' skills as a sparse skill x candidate matrix.
+
+    weights[vocabulary[skill_id], j] is the level weight at which candidate
+    j holds a catalog skill (0 if they lack it). CSR, so selecting a
+    position's required skills is a cheap row slice.
+    """
+
+    vocabulary: dict[int, int]
+    candidate_ids: list[str]
+    names: list[str]
+    years: np.ndarray
+    weights: sparse.csr_matrix
+
+    @classmethod
+    def build(cls, candidates: list[dict]) -> "SkillMatrix":
+        """Build from rows shaped like CandidateRepository.stream_candidates output."""
+        vocabulary: dict[int, int] = {}
+        rows, columns, values = [], [], []
+        for column, candidate in enumerate(candidates):
+            # One entry per catalog skill; COO would sum aliases' duplicates
+            for skill_id, weight in skill_weights(candidate["skill_ids"]).items():
+                rows.append(vocabulary.setdefault(skill_id, len(vocabulary)))
+                columns.append(column)
+                values.append(weight)
+
+        weights = sparse.coo_matrix(
+            (np.array(values, dtype=np.float32), (rows, columns)),
+            shape=(len(vocabulary), len(candidates)),
+        ).tocsr()
+        return cls(
+            vocabulary=vocabulary,
+            candidate_ids=[c["id"] for c in candidates],
+            names=[c["name"] for c in candidates],
+            years=np.array([c["years_of_experience"] for c in candidates], dtype=np.float32),
+            weights=weights,
+        )
+
+    def top_matches(
+        self,
+        required_skills: list[tuple[str, Optional[int]]],
+        min_experience_years: int,
+        limit: int,
+    ) -> list[CandidateMatch]:
+        """
+        Score every candidate and return the best `limit`, best first.
+
+        required_skills are the position's (name, catalog id) pairs; names
+        resolving to the same skill count once and unresolved ones are held
+        by nobody. The skill score is the mean level weight over the
+        required skills (a missing skill counts 0); the experience score is
+        years over the minimum, capped at 1. Both are computed for all
+        candidates in one pass, and only the top k are picked out with
+        argpartition and then sorted, rather than sorting every score.
+        """
+        total = len(self.candidate_ids)
+        if total == 0 or limit <= 0:
+            return []
+
+        # Name -> matrix row (None if no candidate has the skill)
+        required: dict[str, Optional[int]] = {}
+        seen: set[int] = set()
+        for name, skill_id in required_skills:
+            if skill_id is None or skill_id not in seen:
+                seen.add(skill_id)
+                required.setdefault(name, self.vocabulary.get(skill_id))
+        rows = [row for row in required.values() if row is not None]
+        if required:
+            skill_scores = (
+                np.asarray(self.weights[rows].sum(axis=0)).ravel() / len(required)
+                if rows
+                else np.zeros(total, dtype=np.float32)
+            )
+        else:
+            skill_scores = np.ones(total, dtype=np.float32)
+        if min_experience_years > 0:
+            experience_scores = np.minimum(self.years / min_experience_years, 1.0)
+        else:
+            experience_scores = np.ones(total, dtype=np.float32)
+        scores = SKILL_WEIGHT * skill_scores + EXPERIENCE_WEIGHT * experience_scores
+
+        k = min(limit, total)
+        top = np.argpartition(-scores, k - 1)[:k] if k < total else np.arange(total)
+        # Best first; ties keep a stable order by candidate position
+        top = top[np.lexsort((top, -scores[top]))]
+
+        held = self.weights[rows][:, top].toarray() if rows else np.zeros((0, len(top)))
+        matches = []
+        for position, column in enumerate(top):
+            holds, index = set(), 0
+            for name, row in required.items():
+                if row is not None:
+                    if held[index, position] > 0:
+                        holds.add(name)
+                    index += 1
+            matches.append(
+                CandidateMatch(
+                    candidate_id=self.candidate_ids[column],
+                    name=self.names[column],
+                    score=round(float(scores[column]), 4),
+                    skill_score=round(float(skill_scores[column]), 4),
+                    experience_score=round(float(experience_scores[column]), 4),
+                    years_of_experience=int(self.years[column]),
+                    matched_skills=[s for s in required if s in holds],
+                    missing_skills=[s for s in required if s not in holds],
+                )
+            )
+        return matches
+
+
+class MatchingService:
+    """
+    Keep the skill matrix of active candidates and score positions against it.
+
+    The matrix is built on first use and rebuilt when the candidates table
+    has changed (by row count and latest updated_at) or is older than
+    MAX_MATRIX_AGE_SECONDS; each check costs one aggregate query.
+    """
+
+    def __init__(self):
+        self._matrix: Optional[SkillMatrix] = None
+        self._version: Optional[tuple[int, Optional[datetime]]] = None
+        self._built_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get_matrix(self, db: AsyncSession) -> SkillMatrix:
+        """The current matrix, rebuilt first if candidates changed."""
+        version = await CandidateRepository.get_data_version(db)
+        if self._is_current(version):
+            return self._matrix
+        async with self._lock:
+            if not self._is_current(version):
+                candidates = await _collect(
+                    CandidateRepository.stream_candidates(
+                        db, CandidateStatus.ACTIVE, batch_size=LOAD_BATCH_SIZE
+                    )
+                )
+                self._matrix = await run_in_threadpool(SkillMatrix.build, candidates)
+                self._version = version
+                self._built_at = time.monotonic()
+        return self._matrix
+
+    async def top_matches(
+        self,
+        db: AsyncSession,
+        required_skills: list[tuple[str, Optional[int]]],
+        min_experience_years: int,
+        limit: int,
+    ) -> tuple[list[CandidateMatch], int]:
+        """Top matches for the requirements, and the number of candidates scored."""
+        matrix = await self.get_matrix(db)
+        matches = await run_in_threadpool(
+            matrix.top_matches, required_skills, min_experience_years, limit
+        )
+        return matches, len(matrix.candidate_ids)
+
+    def invalidate(self) -> None:
+        """Force a rebuild on next use."""
+        self._version = None
+
+    def _is_current(self, version: tuple[int, Optional[datetime]]) -> bool:
+        return (
+            self._matrix is not None
+            and self._version == version
+            and time.monotonic() - self._built_at < MAX_MATRIX_AGE_SECONDS
+        )
+
+
+async def _collect(batches: AsyncIterator[list[dict]]) -> list[dict]:
+    candidates = []
+    async for batch in batches:
+        candidates.extend(batch)
+    return candidates
+
+
+matching_service = MatchingService()
@@ -0,0 +1,37 @@
+"""Canonical skill names and the spellings that resolve to them."""
+
+# Canonical name -> other common spellings of the same skill. Seeded into
+# skill_aliases by migration 009; any other name becomes its own catalog
+# entry the first time it is written.
+DEFAULT_ALIASES: dict[str, list[str]] = {
+    "JavaScript": ["JS", "JavaScript ES6", "ES6", "ECMAScript"],
+    "TypeScript": ["TS"],
+    "Node.js": ["Node", "NodeJS", "Node JS"],
+    "React": ["ReactJS", "React.js"],
+    "Vue.js": ["Vue", "VueJS"],
+    "Python": ["Python 3", "Python3"],
+    "Go": ["Golang"],
+    "C#": ["CSharp", "C Sharp"],
+    "C++": ["CPP"],
+    "PostgreSQL": ["Postgres", "psql"],
+    "Kubernetes": ["k8s"],
+    "AWS": ["Amazon Web Services"],
+    "GCP": ["Google Cloud", "Google Cloud Platform"],
+    "Azure": ["Microsoft Azure"],
+    "Machine Learning": ["ML"],
+    "CI/CD": ["CICD"],
+}
+
+
+def normalize_skill(name: str) -> str:
+    """Skill names compare case- and whitespace-insensitively."""
+    return " ".join(name.split()).lower()
+
+
+def default_alias_map() -> dict[str, str]:
+    """Normalized spelling -> canonical name, for every DEFAULT_ALIASES entry."""
+    aliases = {}
+    for canonical, spellings in DEFAULT_ALIASES.items():
+        for spelling in [canonical, *spellings]:
+            aliases[normalize_skill(spelling)] = canonical
+    return aliases
@@ -0,0 +1,449 @@
+"""In-memory inverted index from canonical skill to candidate bitmaps."""
+
+import asyncio
+import logging
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from sqlalchemy import ColumnElement, and_, false, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.candidate import Candidate
+from app.models.skill import Skill, SkillLevel
+from app.repositories.candidate import CandidateRepository
+from app.repositories.skill_catalog import SkillCatalogRepository
+from app.services.skill_catalog import normalize_skill
+
+logger = logging.getLogger(__name__)
+
+# Bits per bitmap chunk; chunks with no bits set are not stored
+CHUNK_BITS = 4096
+LEVELS = list(SkillLevel)
+LOAD_BATCH_SIZE = 5000
+MAX_EXPRESSION_TERMS = 50
+# Larger matches are filtered in SQL against the skills table rather than
+# sent to the database as a list of IDs
+MAX_INLINE_IDS = 500
+
+
+class Bitmap:
+    """
+    Compressed set of small integers.
+
+    Integers are split into CHUNK_BITS-wide chunks, each stored as an int
+    bitset under its chunk number, so a skill held by a few candidates
+    costs a few small ints however large the slot numbers get, and AND/OR
+    work a chunk (thousands of candidates) at a time.
+    """
+
+    __slots__ = ("chunks",)
+
+    def __init__(self, chunks: Optional[dict[int, int]] = None):
+        self.chunks = chunks if chunks is not None else {}
+
+    def add(self, value: int) -> None:
+        chunk, bit = divmod(value, CHUNK_BITS)
+        self.chunks[chunk] = self.chunks.get(chunk, 0) | (1 << bit)
+
+    def discard(self, value: int) -> None:
+        chunk, bit = divmod(value, CHUNK_BITS)
+        bits = self.chunks.get(chunk, 0) & ~(1 << bit)
+        if bits:
+            self.chunks[chunk] = bits
+        else:
+            self.chunks.pop(chunk, None)
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        small, large = sorted((self.chunks, other.chunks), key=len)
+        chunks = {}
+        for chunk, bits in small.items():
+            if both := bits & large.get(chunk, 0):
+                chunks[chunk] = both
+        return Bitmap(chunks)
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        chunks = dict(self.chunks)
+        for chunk, bits in other.chunks.items():
+            chunks[chunk] = chunks.get(chunk, 0) | bits
+        return Bitmap(chunks)
+
+    def __bool__(self) -> bool:
+        return bool(self.chunks)
+
+    def __len__(self) -> int:
+        return sum(bits.bit_count() for bits in self.chunks.values())
+
+    def __iter__(self) -> Iterator[int]:
+        for chunk in sorted(self.chunks):
+            bits, base = self.chunks[chunk], chunk * CHUNK_BITS
+            while bits:
+                lowest = bits & -bits
+                yield base + lowest.bit_length() - 1
+                bits ^= lowest
+
+
+class SkillExpressionError(ValueError):
+    """A skills filter expression that cannot be parsed."""
+
+
+@dataclass(frozen=True)
+class SkillTerm:
+    """A skill, optionally held at a minimum level."""
+
+    name: str
+    min_level: Optional[SkillLevel] = None
+
+
+@dataclass(frozen=True)
+class SkillOperation:
+    """AND or OR over sub-expressions."""
+
+    operator: str
+    operands: tuple["SkillExpression", ...]
+
+
+SkillExpression = Union[SkillTerm, SkillOperation]
+
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+_LEVEL_NAMES = {level.value.lower(): level for level in LEVELS}
+
+
+def parse_skill_expression(text: str) -> SkillExpression:
+    """
+    Parse a skills filter such as `python AND kubernetes AND (aws OR gcp)`.
+
+    AND binds tighter than OR and parentheses group. Consecutive words form
+    one skill name ("machine learning"); double quotes keep a name that
+    contains AND, OR or parentheses together. A `:level` suffix such as
+    `python:advanced` requires at least that level. Names are normalized
+    like catalog aliases, so "JS" and "javascript" are the same skill.
+
+    Raises SkillExpressionError on malformed input.
+    """
+    tokens = _tokenize(text)
+    if not tokens:
+        raise SkillExpressionError("Empty skills expression")
+    if sum(1 for kind, _ in tokens if kind == "term") > MAX_EXPRESSION_TERMS:
+        raise SkillExpressionError(f"At most {MAX_EXPRESSION_TERMS} skills per expression")
+    parser = _Parser(tokens)
+    expression = parser.expression()
+    if parser.position < len(tokens):
+        raise SkillExpressionError(f"Unexpected {tokens[parser.position][1]!r}")
+    return expression
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    """Split into ("(" / ")" / "and" / "or" / "term", text) pairs."""
+    tokens: list[tuple[str, str]] = []
+    words: list[str] = []
+
+    def end_term():
+        if words:
+            tokens.append(("term", " ".join(words)))
+            words.clear()
+
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise SkillExpressionError("Unbalanced quotes in skills expression")
+        position = match.end()
+        opening, closing, quoted, word = match.groups()
+        if opening or closing:
+            end_term()
+            tokens.append((opening or closing, opening or closing))
+        elif quoted is not None:
+            end_term()
+            tokens.append(("quoted", quoted))
+        elif word.lower() in ("and", "or"):
+            end_term()
+            tokens.append((word.lower(), word))
+        else:
+            words.append(word)
+    end_term()
+    return [("term", text) if kind == "quoted" else (kind, text) for kind, text in tokens]
+
+
+class _Parser:
+    """Recursive descent over the tokens: or := and (OR and)*; and := atom (AND atom)*."""
+
+    def __init__(self, tokens: list[tuple[str, str]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def expression(self) -> SkillExpression:
+        return self._operation("or", self._conjunction)
+
+    def _conjunction(self) -> SkillExpression:
+        return self._operation("and", self._atom)
+
+    def _operation(self, operator: str, operand) -> SkillExpression:
+        operands = [operand()]
+        while self._peek() == operator:
+            self.position += 1
+            operands.append(operand())
+        return operands[0] if len(operands) == 1 else SkillOperation(operator, tuple(operands))
+
+    def _atom(self) -> SkillExpression:
+        kind = self._peek()
+        if kind is None:
+            raise SkillExpressionError("Skills expression ends unexpectedly")
+        text = self.tokens[self.position][1]
+        self.position += 1
+        if kind == "(":
+            expression = self.expression()
+            if self._peek() != ")":
+                raise SkillExpressionError("Missing ')' in skills expression")
+            self.position += 1
+            return expression
+        if kind != "term":
+            raise SkillExpressionError(f"Unexpected {text!r}")
+        return _term(text)
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+
+def _term(text: str) -> SkillTerm:
+    name, _, suffix = text.rpartition(":")
+    if name and suffix.lower() in _LEVEL_NAMES:
+        return SkillTerm(normalize_skill(name), _LEVEL_NAMES[suffix.lower()])
+    if not normalize_skill(text):
+        raise SkillExpressionError("Empty skill name")
+    return SkillTerm(normalize_skill(text))
+
+
+def expression_condition(
+    expression: SkillExpression, skill_ids: dict[str, int]
+) -> ColumnElement[bool]:
+    """
+    The expression as a WHERE condition on candidates, over the skills table.
+
+    Matches what SkillIndex.evaluate computes, read from the database.
+    """
+    if isinstance(expression, SkillTerm):
+        skill_id = skill_ids.get(expression.name)
+        if skill_id is None:
+            return false()
+        minimum = LEVELS.index(expression.min_level) if expression.min_level else 0
+        # Uncorrelated: the export query already joins skills
+        return Candidate.id.in_(
+            select(Skill.candidate_id)
+            .where(Skill.skill_id == skill_id, Skill.level.in_(LEVELS[minimum:]))
+            .correlate(None)
+        )
+    combine = and_ if expression.operator == "and" else or_
+    return combine(*(expression_condition(operand, skill_ids) for operand in expression.operands))
+
+
+def expression_terms(expression: SkillExpression) -> set[str]:
+    """The skill names an expression mentions."""
+    if isinstance(expression, SkillTerm):
+        return {expression.name}
+    return set().union(*(expression_terms(operand) for operand in expression.operands))
+
+
+class SkillIndex:
+    """
+    Catalog skill id -> level -> bitmap of candidate slots.
+
+    Candidates get small integer slots (reused after removal) so bitmaps
+    stay dense.
+    """
+
+    def __init__(self):
+        self._slots: dict[str, int] = {}
+        self._ids: list[Optional[str]] = []
+        self._free: list[int] = []
+        self._skills: dict[int, list[tuple[int, SkillLevel]]] = {}
+        self._postings: dict[int, dict[SkillLevel, Bitmap]] = {}
+
+    def __len__(self) -> int:
+        """Number of candidates with at least one skill."""
+        return len(self._skills)
+
+    def add(self, candidate_id: str, skill_id: int, level: SkillLevel) -> None:
+        """Record one skill of a candidate."""
+        slot = self._slots.get(candidate_id)
+        if slot is None:
+            slot = self._free.pop() if self._free else len(self._ids)
+            if slot == len(self._ids):
+                self._ids.append(candidate_id)
+            else:
+                self._ids[slot] = candidate_id
+            self._slots[candidate_id] = slot
+            self._skills[slot] = []
+        self._skills[slot].append((skill_id, level))
+        self._postings.setdefault(skill_id, {}).setdefault(level, Bitmap()).add(slot)
+
+    def remove(self, candidate_id: str) -> None:
+        """Forget a candidate's skills."""
+        slot = self._slots.pop(candidate_id, None)
+        if slot is None:
+            return
+        for skill_id, level in self._skills.pop(slot):
+            levels = self._postings[skill_id]
+            levels[level].discard(slot)
+            if not levels[level]:
+                del levels[level]
+                if not levels:
+                    del self._postings[skill_id]
+        self._ids[slot] = None
+        self._free.append(slot)
+
+    def set_candidate(self, candidate_id: str, skills: Iterable[tuple[int, SkillLevel]]) -> None:
+        """Replace a candidate's skills, given as (catalog id, level) pairs."""
+        self.remove(candidate_id)
+        for skill_id, level in skills:
+            self.add(candidate_id, skill_id, level)
+
+    def evaluate(self, expression: SkillExpression, skill_ids: dict[str, int]) -> Bitmap:
+        """
+        Bitmap of the candidate slots matching an expression.
+
+        skill_ids maps the expression's skill names to catalog ids; names
+        missing from it match nobody.
+        """
+        if isinstance(expression, SkillTerm):
+            levels = self._postings.get(skill_ids.get(expression.name), {})
+            minimum = LEVELS.index(expression.min_level) if expression.min_level else 0
+            result = Bitmap()
+            for level in LEVELS[minimum:]:
+                if level in levels:
+                    result = result | levels[level]
+            return result
+
+        operands = iter(expression.operands)
+        result = self.evaluate(next(operands), skill_ids)
+        for operand in operands:
+            if expression.operator == "and":
+                if not result:
+                    break
+                result = result & self.evaluate(operand, skill_ids)
+            else:
+                result = result | self.evaluate(operand, skill_ids)
+        return result
+
+    def candidate_ids(self, bitmap: Bitmap) -> list[str]:
+        """The candidate IDs of a bitmap's slots."""
+        return [self._ids[slot] for slot in bitmap]
+
+
+@dataclass(frozen=True)
+class SkillMatch:
+    """
+    The candidates matching a skills expression.
+
+    count is the size of the matched bitmap. condition restricts a query
+    over candidates to them: their IDs when there are at most
+    MAX_INLINE_IDS, else the expression evaluated against the skills table,
+    so large matches are neither inlined nor sent as thousands of
+    parameters.
+    """
+
+    count: int
+    condition: ColumnElement[bool]
+
+
+class SkillIndexService:
+    """
+    Keep a SkillIndex of every candidate's skills for the skills filter.
+
+    Built when the app starts (or on first use), updated in place when the
+    API writes a candidate, and rebuilt every refresh_seconds to pick up
+    writes made elsewhere: scripts, imports, other API processes.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, refresh_seconds: float):
+        self.session_factory = session_factory
+        self.refresh_seconds = refresh_seconds
+        self.index: Optional[SkillIndex] = None
+        self._lock = asyncio.Lock()
+        # Candidate writes seen while a rebuild reads the table
+        self._pending: Optional[dict[str, list[tuple[int, SkillLevel]]]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Build the index and start refreshing it periodically."""
+        if self._task is not None:
+            return
+        async with self.session_factory() as session:
+            await self.rebuild(session)
+        self._task = asyncio.create_task(self._refresh())
+
+    async def stop(self) -> None:
+        """Stop the periodic refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def rebuild(self, db: AsyncSession) -> SkillIndex:
+        """Build a fresh index from the skills table and swap it in."""
+        async with self._lock:
+            self._pending = {}
+            try:
+                index = SkillIndex()
+                async for batch in CandidateRepository.stream_skills(db, LOAD_BATCH_SIZE):
+                    for candidate_id, skill_id, level in batch:
+                        index.add(candidate_id, skill_id, level)
+                for candidate_id, skills in self._pending.items():
+                    index.set_candidate(candidate_id, skills)
+                self.index = index
+            finally:
+                self._pending = None
+        logger.info("Skill index built with %d candidates", len(index))
+        return index
+
+    async def match(self, db: AsyncSession, expression: str) -> SkillMatch:
+        """
+        The candidates whose skills satisfy an expression.
+
+        The expression's names are resolved through the catalog aliases in
+        one query. Raises SkillExpressionError for a malformed expression.
+        """
+        parsed = parse_skill_expression(expression)
+        skill_ids = await SkillCatalogRepository.lookup(db, expression_terms(parsed))
+        index = self.index or await self.rebuild(db)
+        bitmap = index.evaluate(parsed, skill_ids)
+        count = len(bitmap)
+        if count <= MAX_INLINE_IDS:
+            condition = Candidate.id.in_(index.candidate_ids(bitmap))
+        else:
+            condition = expression_condition(parsed, skill_ids)
+        return SkillMatch(count, condition)
+
+    def update_candidate(
+        self, candidate_id: str, skills: Iterable[tuple[Optional[int], SkillLevel]]
+    ) -> None:
+        """
+        Apply a committed candidate write; a no-op until the index is built.
+
+        skills are (catalog id, level) pairs; unresolved skills are ignored.
+        """
+        skills = [(skill_id, level) for skill_id, level in skills if skill_id is not None]
+        if self._pending is not None:
+            self._pending[candidate_id] = skills
+        if self.index is not None:
+            self.index.set_candidate(candidate_id, skills)
+
+    def invalidate(self) -> None:
+        """Drop the index; it is rebuilt on next use."""
+        self.index = None
+
+    async def _refresh(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                async with self.session_factory() as session:
+                    await self.rebuild(session)
+            except Exception:
+                logger.exception("Skill index refresh failed")
+
+
+skill_index = SkillIndexService(AsyncSessionLocal, settings.SKILL_INDEX_REFRESH_SECONDS)
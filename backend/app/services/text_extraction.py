@@ -0,0 +1,163 @@
+"""Plain-text extraction from uploaded documents on a process pool."""
+
+import asyncio
+import zipfile
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Optional
+from xml.etree import ElementTree
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.document_text import ExtractionStatus
+from app.repositories.document import DocumentRepository
+from app.services.document_storage import DocumentStorageService
+from app.services.worker_pool import DocumentWorkerPool
+
+MAX_TEXT_CHARS = 1_000_000
+
+CONTENT_TYPES = {
+    "application/pdf": ".pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
+    "text/plain": ".txt",
+}
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class UnsupportedDocumentError(ValueError):
+    """The document's format has no text extractor."""
+
+
+def document_format(name: str, content_type: Optional[str]) -> str:
+    """Pick the format to parse as from the content type, else the file name."""
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    return CONTENT_TYPES.get(media_type) or Path(name).suffix.lower()
+
+
+def extract_text(path: str, file_format: str, limit: int = MAX_TEXT_CHARS) -> str:
+    """
+    Return the plain text of a PDF, DOCX or text file.
+
+    Runs inside a worker process, so it only takes picklable arguments and
+    touches no database or event loop state. Output is capped at limit
+    characters, and parsing stops once that much text has been read.
+
+    Raises UnsupportedDocumentError for other formats.
+    """
+    if file_format == ".pdf":
+        from pypdf import PdfReader
+
+        parts, length = [], 0
+        for page in PdfReader(path).pages:
+            text = page.extract_text() or ""
+            parts.append(text)
+            length += len(text)
+            if length >= limit:
+                break
+        text = "\n".join(parts)
+    elif file_format == ".docx":
+        text = _docx_text(path, limit)
+    elif file_format == ".txt":
+        with open(path, encoding="utf-8", errors="replace") as f:
+            text = f.read(limit)
+    else:
+        raise UnsupportedDocumentError(f"No text extractor for {file_format or 'unknown'} files")
+
+    return text[:limit].replace("\x00", "")
+
+
+def _docx_text(path: str, limit: int) -> str:
+    """Collect the text runs of a DOCX body, one line per paragraph."""
+    paragraphs, current, length = [], [], 0
+    with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as xml:
+        for event, element in ElementTree.iterparse(xml, events=("end",)):
+            if element.tag == f"{_WORD_NS}t" and element.text:
+                current.append(element.text)
+            elif element.tag == f"{_WORD_NS}tab":
+                current.append("\t")
+            elif element.tag == f"{_WORD_NS}p":
+                paragraph = "".join(current)
+                paragraphs.append(paragraph)
+                length += len(paragraph) + 1
+                current = []
+                element.clear()
+                if length >= limit:
+                    break
+    return "\n".join(paragraphs)
+
+
+class TextExtractor(DocumentWorkerPool):
+    """
+    Extract document text on a process pool fed from a bounded queue.
+
+    Files caught in a pool restart (after another file's timeout, or a
+    worker crash) are retried once. Results are stored in document_texts,
+    where candidate search picks them up.
+    """
+
+    name = "Text extraction"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        workers: int,
+        queue_size: int,
+        timeout: float,
+        extract: Callable[[str, str], str] = extract_text,
+    ):
+        super().__init__(workers, queue_size, timeout)
+        self.session_factory = session_factory
+        self.extract = extract
+
+    async def backfill(self, only_missing: bool = True) -> int:
+        """
+        Queue every stored document (or only unextracted ones) and wait.
+
+        Blocks on the bounded queue rather than loading everything into it.
+        Returns the number of documents queued.
+        """
+        async with self.session_factory() as session:
+            document_ids = await DocumentRepository.get_document_ids_for_extraction(
+                session, only_missing
+            )
+        for document_id in document_ids:
+            await self._queue.put((document_id, 1))
+        await self.wait_idle()
+        return len(document_ids)
+
+    async def _process(self, document_id: str, attempt: int) -> None:
+        """Extract one document and store the outcome."""
+        async with self.session_factory() as session:
+            document = await DocumentRepository.get_document_by_id(session, document_id)
+        if document is None or not document.storage_key:
+            return
+
+        path = str(DocumentStorageService.path_for(document.storage_key))
+        file_format = document_format(document.name, document.content_type)
+        status, content, error = ExtractionStatus.EXTRACTED, "", None
+        try:
+            content = await self.run(self.extract, path, file_format)
+        except asyncio.TimeoutError:
+            status, error = ExtractionStatus.FAILED, f"Timed out after {self.timeout:g}s"
+        except BrokenProcessPool:
+            if self.retry(document_id, attempt):
+                return
+            status, error = ExtractionStatus.FAILED, "Extraction process died"
+        except UnsupportedDocumentError as e:
+            status, error = ExtractionStatus.UNSUPPORTED, str(e)
+        except Exception as e:
+            status, error = ExtractionStatus.FAILED, f"{type(e).__name__}: {e}"
+
+        async with self.session_factory() as session:
+            await DocumentRepository.save_text(session, document, status, content, error)
+
+
+text_extractor = TextExtractor(
+    AsyncSessionLocal,
+    workers=settings.EXTRACTION_WORKERS,
+    queue_size=settings.EXTRACTION_QUEUE_SIZE,
+    timeout=settings.EXTRACTION_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,138 @@
+"""Bounded queue of documents processed on a process pool."""
+
+import abc
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 2
+
+
+class DocumentWorkerPool(abc.ABC):
+    """
+    Process documents on a process pool fed from a bounded queue.
+
+    Parsing files is CPU-bound and some files are pathological, so the work
+    runs in separate processes rather than on the event loop or its threads.
+    Each call gets `timeout` seconds; on a timeout the pool's processes are
+    killed and replaced. Subclasses implement _process() for one queued
+    document and call run() for the part that belongs in a worker process.
+    """
+
+    # Used in log messages
+    name = "Processing"
+
+    def __init__(self, workers: int, queue_size: int, timeout: float):
+        self.workers = workers
+        self.timeout = timeout
+        self._queue: asyncio.Queue[tuple[str, int]] = asyncio.Queue(maxsize=queue_size)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Start the process pool and one feeder task per process."""
+        if self._tasks:
+            return
+        self._pool = self._new_pool()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Stop feeding the pool and kill any work still running."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._pool is not None:
+            self._kill_pool(self._pool)
+            self._pool = None
+
+    def enqueue(self, document_id: str) -> bool:
+        """
+        Queue a document without waiting, as uploads do.
+
+        Returns False if the pool is not running or the queue is full; a
+        backfill or a later request has to pick the document up then.
+        """
+        if not self._tasks:
+            return False
+        try:
+            self._queue.put_nowait((document_id, 1))
+        except asyncio.QueueFull:
+            logger.warning("%s queue full, skipping document %s", self.name, document_id)
+            return False
+        return True
+
+    async def wait_idle(self) -> None:
+        """Wait until every queued document has been processed."""
+        await self._queue.join()
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call func(*args) in a worker process, within the timeout.
+
+        Raises asyncio.TimeoutError after replacing the pool, and
+        BrokenProcessPool (after replacing the pool) if a worker died.
+        """
+        pool = self._pool
+        try:
+            return await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(pool, func, *args), self.timeout
+            )
+        except asyncio.TimeoutError:
+            if self._pool is pool:
+                self._pool = self._new_pool()
+                self._kill_pool(pool)
+            raise
+        except BrokenProcessPool:
+            # A worker died: killed after another call's timeout, or crashed
+            if self._pool is pool:
+                self._pool = self._new_pool()
+            raise
+
+    def retry(self, document_id: str, attempt: int) -> bool:
+        """Requeue a document caught in a pool restart, once; False if not requeued."""
+        if attempt >= MAX_ATTEMPTS:
+            return False
+        try:
+            self._queue.put_nowait((document_id, attempt + 1))
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    @abc.abstractmethod
+    async def _process(self, document_id: str, attempt: int) -> None:
+        """Process one queued document; attempt counts from 1."""
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        return ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    @staticmethod
+    def _kill_pool(pool: ProcessPoolExecutor) -> None:
+        """Terminate a pool's processes; running tasks cannot be cancelled otherwise."""
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+
+    async def _worker(self) -> None:
+        """Take documents off the queue and process them one at a time."""
+        while True:
+            document_id, attempt = await self._queue.get()
+            try:
+                await self._process(document_id, attempt)
+            except Exception:
+                logger.exception("%s for document %s could not be recorded", self.name, document_id)
+            finally:
+                self._queue.task_done()
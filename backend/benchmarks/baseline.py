@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Store API benchmark baselines and report regressions against them.
+
+Baselines are results files from bench_api.py saved under
+benchmarks/baselines/ with a format version and a label (by default the
+git commit). A comparison matches scenarios by name and, for each, bootstraps
+a 95% confidence interval for the ratio of new to baseline latency from the
+raw samples. A scenario counts as a regression only if the whole interval
+lies above 1 + --max-slowdown and the absolute difference exceeds
+--min-delta-ms, so ordinary run-to-run noise does not fail the check.
+
+Usage:
+    python benchmarks/baseline.py save benchmarks/results/api-....json [--label v1.2]
+    python benchmarks/baseline.py compare benchmarks/results/api-....json \\
+        [--baseline LABEL_OR_PATH] [--metric p95] [--max-slowdown 0.10]
+
+compare exits 1 when any scenario regressed (or started failing requests).
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.common import percentile
+
+BASELINES_DIR = Path(__file__).parent / "baselines"
+FORMAT_VERSION = 1
+
+METRICS = {
+    "p50": lambda samples: percentile(samples, 50),
+    "p95": lambda samples: percentile(samples, 95),
+    "p99": lambda samples: percentile(samples, 99),
+    "mean": statistics.fmean,
+}
+
+
+def load_results(path: Path) -> dict:
+    """Read a results or baseline file."""
+    data = json.loads(path.read_text())
+    if data.get("format_version", FORMAT_VERSION) > FORMAT_VERSION:
+        raise SystemExit(f"{path} uses a newer baseline format than this script supports")
+    return data
+
+
+def save_baseline(results_path: Path, label: str | None) -> Path:
+    """Copy a results file into the baselines directory with version metadata."""
+    data = load_results(results_path)
+    label = label or data["environment"].get("git_commit") or datetime.utcnow().strftime("%Y%m%d")
+    data["format_version"] = FORMAT_VERSION
+    data["label"] = label
+    data["saved_at"] = datetime.utcnow().isoformat()
+
+    BASELINES_DIR.mkdir(parents=True, exist_ok=True)
+    path = BASELINES_DIR / f"{label}.json"
+    path.write_text(json.dumps(data, indent=2))
+    return path
+
+
+def find_baseline(name: str | None) -> Path:
+    """Resolve a baseline label or path; default to the most recently saved one."""
+    if name:
+        path = Path(name)
+        if path.exists():
+            return path
+        path = BASELINES_DIR / f"{name}.json"
+        if path.exists():
+            return path
+        raise SystemExit(f"No baseline named {name}")
+
+    baselines = sorted(
+        BASELINES_DIR.glob("*.json"),
+        key=lambda p: load_results(p).get("saved_at", ""),
+    )
+    if not baselines:
+        raise SystemExit(f"No baselines in {BASELINES_DIR}; save one first")
+    return baselines[-1]
+
+
+def bootstrap_ratio(
+    baseline: list[float],
+    current: list[float],
+    metric: str,
+    iterations: int = 1000,
+    seed: int = 0,
+) -> tuple[float, float, float]:
+    """
+    Return (ratio, low, high): current/baseline for the metric and its 95% CI.
+
+    Both sample sets are resampled with replacement; the interval is the
+    2.5th-97.5th percentile range of the resampled ratios.
+    """
+    statistic = METRICS[metric]
+    rng = random.Random(seed)
+    ratios = []
+    for _ in range(iterations):
+        base = statistic(rng.choices(baseline, k=len(baseline)))
+        new = statistic(rng.choices(current, k=len(current)))
+        ratios.append(new / base if base else float("inf"))
+    ratio = statistic(current) / statistic(baseline) if statistic(baseline) else float("inf")
+    return ratio, percentile(ratios, 2.5), percentile(ratios, 97.5)
+
+
+def classify(
+    baseline: dict,
+    current: dict,
+    metric: str,
+    max_slowdown: float,
+    min_delta_ms: float,
+) -> dict:
+    """Compare one scenario and decide whether it regressed, improved or held."""
+    base_samples, new_samples = baseline["samples_ms"], current["samples_ms"]
+    base_value = METRICS[metric](base_samples)
+    new_value = METRICS[metric](new_samples)
+    ratio, low, high = bootstrap_ratio(base_samples, new_samples, metric)
+    delta = new_value - base_value
+
+    if current["errors"] > baseline["errors"]:
+        verdict = "errors"
+    elif low > 1 + max_slowdown and delta > min_delta_ms:
+        verdict = "regression"
+    elif high < 1 - max_slowdown and -delta > min_delta_ms:
+        verdict = "improvement"
+    else:
+        verdict = "ok"
+
+    return {
+        "baseline_ms": base_value,
+        "current_ms": new_value,
+        "ratio": ratio,
+        "ci_low": low,
+        "ci_high": high,
+        "verdict": verdict,
+    }
+
+
+def compare(
+    baseline_data: dict,
+    current_data: dict,
+    metric: str,
+    max_slowdown: float,
+    min_delta_ms: float,
+) -> dict[str, dict]:
+    """Classify every scenario present in both runs."""
+    report = {}
+    for name, current in current_data["results"].items():
+        baseline = baseline_data["results"].get(name)
+        if baseline is None:
+            continue
+        report[name] = classify(baseline, current, metric, max_slowdown, min_delta_ms)
+    return report
+
+
+def print_report(report: dict[str, dict], metric: str, baseline_data: dict, current_data: dict) -> None:
+    """Print one line per scenario plus any configuration mismatches."""
+    for key in ("database", "size", "requests", "concurrency"):
+        before, after = baseline_data["config"].get(key), current_data["config"].get(key)
+        if before != after:
+            print(f"warning: {key} differs (baseline {before}, current {after})")
+
+    before = baseline_data["environment"].get("packages", {})
+    after = current_data["environment"].get("packages", {})
+    for package in sorted(set(before) | set(after)):
+        if before.get(package) != after.get(package):
+            print(f"note: {package} {before.get(package)} -> {after.get(package)}")
+
+    print(
+        f"{'scenario':<18} {'base ' + metric:>11} {'now ' + metric:>11} "
+        f"{'ratio':>7} {'95% CI':>15}  verdict"
+    )
+    for name, row in report.items():
+        print(
+            f"{name:<18} {row['baseline_ms']:>9.2f}ms {row['current_ms']:>9.2f}ms "
+            f"{row['ratio']:>7.2f} {row['ci_low']:>7.2f}-{row['ci_high']:<7.2f}  "
+            f"{row['verdict'].upper() if row['verdict'] != 'ok' else 'ok'}"
+        )
+
+
+def main() -> int:
+    """Dispatch the save and compare subcommands."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    save = subcommands.add_parser("save", help="store a results file as a baseline")
+    save.add_argument("results", type=Path)
+    save.add_argument("--label", help="baseline name (default: git commit of the run)")
+
+    check = subcommands.add_parser("compare", help="compare a results file to a baseline")
+    check.add_argument("results", type=Path)
+    check.add_argument("--baseline", help="label or path (default: latest saved)")
+    check.add_argument("--metric", choices=sorted(METRICS), default="p95")
+    check.add_argument(
+        "--max-slowdown", type=float, default=0.10,
+        help="tolerated relative slowdown, e.g. 0.10 for 10%% (default: 0.10)",
+    )
+    check.add_argument(
+        "--min-delta-ms", type=float, default=1.0,
+        help="ignore absolute changes smaller than this (default: 1.0)",
+    )
+
+    args = parser.parse_args()
+    if args.command == "compare" and args.max_slowdown < 0:
+        parser.error("--max-slowdown must not be negative")
+
+    if args.command == "save":
+        print(f"baseline saved to {save_baseline(args.results, args.label)}")
+        return 0
+
+    baseline_path = find_baseline(args.baseline)
+    baseline_data = load_results(baseline_path)
+    current_data = load_results(args.results)
+    print(f"baseline: {baseline_data.get('label', baseline_path.stem)} ({baseline_path})")
+
+    report = compare(
+        baseline_data, current_data, args.metric, args.max_slowdown, args.min_delta_ms
+    )
+    print_report(report, args.metric, baseline_data, current_data)
+
+    failed = [name for name, row in report.items() if row["verdict"] in ("regression", "errors")]
+    if failed:
+        print(f"\n{len(failed)} scenario(s) regressed: {', '.join(failed)}")
+        return 1
+    print("\nno regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""End-to-end API benchmark suite.
+
+Drives the real ASGI app in-process through httpx's ASGITransport (as the
+test suite does) against a seeded synthetic dataset, and measures each
+scenario:
+
+- login:               POST /auth/login
+- candidates_list:     GET /candidates
+- candidates_search:   GET /candidates?search=<skill>
+- candidate_detail:    GET /candidates/{id}
+- positions_list:      GET /positions
+- position_detail:     GET /positions/{id}
+- position_update:     PUT /positions/{id}
+- candidate_link:      POST /candidates/{id}/positions/{id}
+- candidate_unlink:    DELETE /candidates/{id}/positions/{id}
+
+For each it reports throughput and p50/p95/p99 latency, and writes all
+results (with raw samples and environment metadata) to a JSON file so runs
+can be compared.
+
+The dataset comes from scripts/generate_dataset.py and is removed again
+afterwards; with --no-seed the data already in the database is used and
+left alone. Writes only touch rows the benchmark creates and deletes: the
+updates go to copies of real open positions and the links to a fresh
+position.
+
+Usage:
+    python benchmarks/bench_api.py [--size 10k] [--requests 200] [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from app.config import settings
+from app.core.security import hash_password
+from app.db.base import Base
+from app.db.session import create_engine, get_db
+from app.main import app
+from app.models import (
+    Candidate,
+    CandidateStatus,
+    Position,
+    PositionSkill,
+    PositionStatus,
+    User,
+    UserRole,
+)
+from app.repositories.pipeline import PipelineRepository
+from benchmarks.common import summarize
+from scripts.generate_dataset import SKILLS, clean, generate, parse_size
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+BENCH_EMAIL = "bench-api@bench.example.com"
+BENCH_PASSWORD = "bench-password"
+BENCH_POSITION_TITLE = "Benchmark Link Target"
+BENCH_DEPARTMENT = "Benchmark"
+# Copies of real positions that position_update rewrites
+UPDATE_TARGETS = 10
+
+SCENARIOS = [
+    "login",
+    "candidates_list",
+    "candidates_search",
+    "candidate_detail",
+    "positions_list",
+    "position_detail",
+    "position_update",
+    "candidate_link",
+    "candidate_unlink",
+]
+
+
+class BenchContext:
+    """Ids and credentials the scenarios draw from."""
+
+    def __init__(self, candidate_ids, position_ids, link_position_id, update_position_ids):
+        self.candidate_ids = candidate_ids
+        self.position_ids = position_ids
+        self.link_position_id = link_position_id
+        self.update_position_ids = update_position_ids
+        self.position_bodies = {}
+        self.headers = {}
+
+
+async def create_bench_user(session_factory) -> None:
+    """Create the editor account the benchmark logs in with."""
+    async with session_factory() as session:
+        await session.execute(delete(User).where(User.email == BENCH_EMAIL))
+        session.add(
+            User(
+                email=BENCH_EMAIL,
+                hashed_password=hash_password(BENCH_PASSWORD),
+                full_name="Benchmark User",
+                role=UserRole.EDITOR,
+                is_active=True,
+            )
+        )
+        await session.commit()
+
+
+async def load_context(session_factory, requests: int) -> BenchContext:
+    """Pick the ids the scenarios use and create the positions the writes go to."""
+    async with session_factory() as session:
+        candidate_ids = list(
+            (
+                await session.execute(
+                    select(Candidate.id)
+                    .where(Candidate.status == CandidateStatus.ACTIVE)
+                    .order_by(Candidate.sort_order)
+                    .limit(requests)
+                )
+            ).scalars()
+        )
+        positions = list(
+            (
+                await session.execute(
+                    select(Position)
+                    .where(Position.status == PositionStatus.OPEN)
+                    .options(selectinload(Position.required_skills))
+                    .order_by(Position.sort_order)
+                    .limit(100)
+                )
+            ).scalars()
+        )
+        position_ids = [position.id for position in positions]
+
+        # Copies of real positions (same skills, so updates rescore as many
+        # candidates), so the update scenario never edits existing data
+        update_positions = []
+        for position in positions[:UPDATE_TARGETS]:
+            copy = Position(
+                title=f"Benchmark Update Target {len(update_positions)}",
+                department=BENCH_DEPARTMENT,
+                location=position.location,
+                description=position.description,
+                requirements=position.requirements,
+                min_experience_years=position.min_experience_years,
+                status=PositionStatus.OPEN,
+                posted_date=datetime.utcnow().date(),
+                sort_order=0,
+                required_skills=[
+                    PositionSkill(name=skill.name, skill_id=skill.skill_id)
+                    for skill in position.required_skills
+                ],
+            )
+            session.add(copy)
+            update_positions.append(copy)
+
+        # A fresh position nobody has applied to, so every link is new
+        link_position = Position(
+            title=BENCH_POSITION_TITLE,
+            department=BENCH_DEPARTMENT,
+            location="Remote",
+            description="Benchmark link target",
+            requirements="None",
+            min_experience_years=0,
+            status=PositionStatus.OPEN,
+            posted_date=datetime.utcnow().date(),
+            sort_order=0,
+        )
+        session.add(link_position)
+        await session.commit()
+
+    if not candidate_ids or not position_ids:
+        raise SystemExit("No active candidates or open positions to benchmark against")
+    return BenchContext(
+        candidate_ids,
+        position_ids,
+        link_position.id,
+        [position.id for position in update_positions],
+    )
+
+
+async def cleanup(session_factory, context: BenchContext) -> None:
+    """Remove the benchmark user and positions, and the rollup rows they left."""
+    async with session_factory() as session:
+        await session.execute(delete(User).where(User.email == BENCH_EMAIL))
+        if context is not None:
+            await session.execute(
+                delete(Position).where(
+                    Position.id.in_([context.link_position_id, *context.update_position_ids])
+                )
+            )
+            await PipelineRepository.refresh_departments(session, [BENCH_DEPARTMENT])
+            await PipelineRepository.refresh_openings(session, [datetime.utcnow().date()])
+        await session.commit()
+
+
+def scenario_request(name: str, client: AsyncClient, context: BenchContext, i: int):
+    """Return (request coroutine, expected status) for the i-th call of a scenario."""
+    headers = context.headers
+    candidate_id = context.candidate_ids[i % len(context.candidate_ids)]
+    position_id = context.position_ids[i % len(context.position_ids)]
+
+    if name == "login":
+        return client.post(
+            "/api/v1/auth/login",
+            data={"username": BENCH_EMAIL, "password": BENCH_PASSWORD},
+        ), 200
+    if name == "candidates_list":
+        return client.get("/api/v1/candidates", params={"limit": 100}, headers=headers), 200
+    if name == "candidates_search":
+        return client.get(
+            "/api/v1/candidates",
+            params={"search": SKILLS[i % len(SKILLS)], "limit": 100},
+            headers=headers,
+        ), 200
+    if name == "candidate_detail":
+        return client.get(f"/api/v1/candidates/{candidate_id}", headers=headers), 200
+    if name == "positions_list":
+        return client.get("/api/v1/positions", headers=headers), 200
+    if name == "position_detail":
+        return client.get(f"/api/v1/positions/{position_id}", headers=headers), 200
+    if name == "position_update":
+        position_id = context.update_position_ids[i % len(context.update_position_ids)]
+        body = dict(context.position_bodies[position_id])
+        # Alternate the skill list so every other update changes skills
+        if i % 2:
+            body["requiredSkills"] = body["requiredSkills"][:-1] + [SKILLS[i % len(SKILLS)]]
+        return client.put(f"/api/v1/positions/{position_id}", json=body, headers=headers), 200
+    if name == "candidate_link":
+        return client.post(
+            f"/api/v1/candidates/{candidate_id}/positions/{context.link_position_id}",
+            headers=headers,
+        ), 201
+    if name == "candidate_unlink":
+        return client.delete(
+            f"/api/v1/candidates/{candidate_id}/positions/{context.link_position_id}",
+            headers=headers,
+        ), 200
+    raise ValueError(f"Unknown scenario: {name}")
+
+
+async def run_scenario(
+    name: str,
+    client: AsyncClient,
+    context: BenchContext,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> dict:
+    """Run one scenario with bounded concurrency and summarize it."""
+    # Link/unlink must touch each candidate exactly once
+    if name in ("candidate_link", "candidate_unlink"):
+        requests = min(requests, len(context.candidate_ids))
+        warmup = 0
+
+    for i in range(warmup):
+        request, _ = scenario_request(name, client, context, i)
+        await request
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one(i: int):
+        nonlocal errors
+        async with semaphore:
+            request, expected_status = scenario_request(name, client, context, i)
+            start = time.perf_counter()
+            response = await request
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code != expected_status:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    result = summarize(latencies, elapsed, errors)
+    result["samples_ms"] = [round(sample, 3) for sample in latencies]
+    return result
+
+
+def environment() -> dict:
+    """Versions and host details stored alongside the results."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    packages = ["fastapi", "sqlalchemy", "pydantic", "starlette", "httpx"]
+    return {
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "packages": {name: metadata.version(name) for name in packages},
+    }
+
+
+def print_table(results: dict) -> None:
+    """Print one line per scenario."""
+    print(
+        f"{'scenario':<18} {'reqs':>5} {'req/s':>9} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'errors':>7}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<18} {result['requests']:>5} {result['throughput_rps']:>9.1f} "
+            f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+            f"{result['p99_ms']:>8.2f} {result['errors']:>7}"
+        )
+
+
+async def main(args) -> Path:
+    """Seed, benchmark every scenario, write the results and clean up."""
+    engine = create_engine(args.database_url)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(f"database: {engine.dialect.name}")
+    if args.seed_data:
+        await generate(engine, args.size, args.seed, batch_size=5000)
+
+    context = None
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        await create_bench_user(session_factory)
+        context = await load_context(session_factory, args.requests)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench"
+        ) as client:
+            response = await client.post(
+                "/api/v1/auth/login",
+                data={"username": BENCH_EMAIL, "password": BENCH_PASSWORD},
+            )
+            context.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+            for position_id in context.update_position_ids:
+                detail = (
+                    await client.get(f"/api/v1/positions/{position_id}", headers=context.headers)
+                ).json()
+                context.position_bodies[position_id] = {
+                    key: detail[key]
+                    for key in (
+                        "title", "department", "location", "description", "requirements",
+                        "requiredSkills", "minExperienceYears", "status", "postedDate",
+                    )
+                }
+
+            results = {}
+            for name in args.scenarios:
+                results[name] = await run_scenario(
+                    name, client, context, args.requests, args.concurrency, args.warmup
+                )
+    finally:
+        app.dependency_overrides.clear()
+        await cleanup(session_factory, context)
+        if args.seed_data:
+            await clean(engine)
+        await engine.dispose()
+
+    print_table(results)
+
+    output = args.output or RESULTS_DIR / f"api-{datetime.utcnow():%Y%m%dT%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "created_at": datetime.utcnow().isoformat(),
+                "config": {
+                    "database": engine.dialect.name,
+                    "size": args.size if args.seed_data else None,
+                    "seed": args.seed,
+                    "requests": args.requests,
+                    "concurrency": args.concurrency,
+                    "warmup": args.warmup,
+                },
+                "environment": environment(),
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    print(f"\nresults written to {output}")
+    return output
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line options (shared with the baseline comparison)."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument(
+        "--size", type=parse_size, default="10k",
+        help="candidates to generate: 10k, 100k, 1m or a number",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="dataset random seed")
+    parser.add_argument(
+        "--no-seed", dest="seed_data", action="store_false",
+        help="benchmark the data already in the database",
+    )
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10, help="requests in flight")
+    parser.add_argument("--warmup", type=int, default=10, help="unmeasured requests per scenario")
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS,
+        help="scenarios to run (default: all)",
+    )
+    parser.add_argument("--output", type=Path, help="results file (default: benchmarks/results/)")
+    return parser
+
+
+if __name__ == "__main__":
+    asyncio.run(main(build_parser().parse_args()))
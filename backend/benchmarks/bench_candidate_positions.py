@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Benchmark candidate-position link/unlink under concurrent load.
+
+Seeds a throwaway set of candidates and positions, then drives
+CandidatePositionRepository from many concurrent sessions:
+
+- link:      add_position_to_candidate for fresh pairs
+- duplicate: add_position_to_candidate for pairs that already exist (409 path)
+- unlink:    remove_position_from_candidate for every linked pair
+
+For each phase it prints throughput, latency percentiles and the number of
+database round trips (statements + commits) per operation. Seeded rows are
+removed afterwards.
+
+Usage:
+    python benchmarks/bench_candidate_positions.py [--pairs 2000] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import date, datetime
+from pathlib import Path
+from uuid import uuid4
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.base import Base
+from app.db.session import create_engine
+from app.models import Candidate, CandidateStatus, Position, PositionStatus
+from app.repositories.candidate_position import CandidatePositionRepository
+from benchmarks.common import RoundTripCounter, percentile
+
+BENCH_EMAIL_DOMAIN = "bench-links.invalid"
+
+
+async def seed(session_factory, candidates: int, positions: int):
+    """Insert benchmark candidates and positions; return their ids."""
+    now = datetime.utcnow()
+    candidate_rows = [
+        {
+            "id": str(uuid4()),
+            "name": f"Bench Candidate {i}",
+            "email": f"candidate{i}-{uuid4().hex[:8]}@{BENCH_EMAIL_DOMAIN}",
+            "phone": "+1-555-0000",
+            "location": "Remote",
+            "summary": "Benchmark candidate",
+            "status": CandidateStatus.ACTIVE,
+            "sort_order": 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(candidates)
+    ]
+    position_rows = [
+        {
+            "id": str(uuid4()),
+            "title": f"Bench Position {i}",
+            "department": "Benchmark",
+            "location": "Remote",
+            "description": "Benchmark position",
+            "requirements": "None",
+            "min_experience_years": 0,
+            "status": PositionStatus.OPEN,
+            "posted_date": date.today(),
+            "sort_order": 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(positions)
+    ]
+    async with session_factory() as session:
+        await session.execute(insert(Candidate), candidate_rows)
+        await session.execute(insert(Position), position_rows)
+        await session.commit()
+    return [row["id"] for row in candidate_rows], [row["id"] for row in position_rows]
+
+
+async def cleanup(session_factory, candidate_ids: list[str], position_ids: list[str]):
+    """Remove seeded rows (links cascade)."""
+    async with session_factory() as session:
+        await session.execute(delete(Candidate).where(Candidate.id.in_(candidate_ids)))
+        await session.execute(delete(Position).where(Position.id.in_(position_ids)))
+        await session.commit()
+
+
+async def run_phase(name, session_factory, counter, pairs, concurrency, operation):
+    """Run operation for every pair with bounded concurrency and report stats."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker(candidate_id, position_id):
+        nonlocal errors
+        async with semaphore:
+            async with session_factory() as session:
+                start = time.perf_counter()
+                try:
+                    await operation(session, candidate_id, position_id)
+                except ValueError:
+                    errors += 1
+                latencies.append((time.perf_counter() - start) * 1000)
+
+    counter.count = 0
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(c, p) for c, p in pairs))
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{name:<10} {len(pairs):>6} {len(pairs) / elapsed:>10.1f} "
+        f"{statistics.median(latencies):>8.2f} {percentile(latencies, 95):>8.2f} "
+        f"{percentile(latencies, 99):>8.2f} {counter.count / len(pairs):>10.2f} {errors:>7}"
+    )
+
+
+async def main(args) -> None:
+    """Seed, benchmark every phase and clean up."""
+    engine = create_engine(args.database_url)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    positions = max(1, args.pairs // args.candidates_per_position)
+    candidate_ids, position_ids = await seed(session_factory, args.pairs, positions)
+    pairs = [
+        (candidate_id, position_ids[i % positions])
+        for i, candidate_id in enumerate(candidate_ids)
+    ]
+    counter = RoundTripCounter(engine)
+
+    print(f"database: {engine.dialect.name}, pairs: {len(pairs)}, concurrency: {args.concurrency}")
+    print(
+        f"{'phase':<10} {'ops':>6} {'ops/s':>10} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'trips/op':>10} {'errors':>7}"
+    )
+    try:
+        await run_phase(
+            "link", session_factory, counter, pairs, args.concurrency,
+            CandidatePositionRepository.add_position_to_candidate,
+        )
+        await run_phase(
+            "duplicate", session_factory, counter, pairs, args.concurrency,
+            CandidatePositionRepository.add_position_to_candidate,
+        )
+        await run_phase(
+            "unlink", session_factory, counter, pairs, args.concurrency,
+            CandidatePositionRepository.remove_position_from_candidate,
+        )
+    finally:
+        await cleanup(session_factory, candidate_ids, position_ids)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--pairs", type=int, default=2000, help="links to create")
+    parser.add_argument("--concurrency", type=int, default=20, help="concurrent sessions")
+    parser.add_argument(
+        "--candidates-per-position", type=int, default=50,
+        help="how many pairs share a position",
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Benchmark streamed document ZIP downloads.
+
+Stores --files distinct files (500 by default) for one candidate linked to
+a position, then downloads GET /positions/{id}/documents.zip through the
+ASGI app in-process. The response body is consumed as it is sent (httpx's
+ASGI transport would buffer it), so the growth of the process's peak RSS
+reflects the server side alone; it stays flat however many files the
+archive holds. Prints time to first byte, total time, MB/s and RSS growth.
+
+Files are written to a temporary STORAGE_PATH (or --storage-path) and the
+benchmark rows are removed afterwards.
+
+Usage:
+    python benchmarks/bench_document_archive.py [--files 500] [--size-kb 512] [--runs 3]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.security import create_access_token, hash_password
+from app.db.base import Base
+from app.db.session import create_engine, get_db
+from app.main import app
+from app.models import (
+    Blob,
+    Candidate,
+    CandidatePosition,
+    CandidateStatus,
+    Document,
+    DocumentType,
+    Position,
+    PositionStatus,
+    User,
+    UserRole,
+)
+from app.services.document_storage import DocumentStorageService
+
+BENCH_EMAIL = "bench-archive@bench.example.com"
+BENCH_CANDIDATE_EMAIL = "bench-archive-candidate@bench.example.com"
+BENCH_POSITION_TITLE = "Archive Benchmark"
+MB = 1024 * 1024
+
+
+async def seed(session_factory, files: int, size_kb: int) -> tuple[str, str]:
+    """Store the files and their rows; return (user id, position id)."""
+    await cleanup(session_factory)
+    async with session_factory() as session:
+        user = User(
+            email=BENCH_EMAIL,
+            hashed_password=hash_password("bench-password"),
+            full_name="Benchmark User",
+            role=UserRole.READ_ONLY,
+            is_active=True,
+        )
+        candidate = Candidate(
+            name="Archive Benchmark",
+            email=BENCH_CANDIDATE_EMAIL,
+            phone="+1-555-0000",
+            location="Remote",
+            summary="Benchmark candidate",
+            status=CandidateStatus.ACTIVE,
+            sort_order=0,
+        )
+        position = Position(
+            title=BENCH_POSITION_TITLE,
+            department="Benchmarks",
+            location="Remote",
+            description="Benchmark position",
+            requirements="None",
+            min_experience_years=0,
+            status=PositionStatus.OPEN,
+            posted_date=date.today(),
+        )
+        session.add_all([user, candidate, position])
+        await session.flush()
+        session.add(CandidatePosition(candidate_id=candidate.id, position_id=position.id))
+
+        for number in range(files):
+            content = os.urandom(size_kb * 1024)
+            checksum = hashlib.sha256(content).hexdigest()
+            storage_key = DocumentStorageService.storage_key_for(checksum)
+            path = DocumentStorageService.path_for(storage_key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+            session.add(Blob(sha256=checksum, size=len(content), ref_count=1))
+            session.add(
+                Document(
+                    candidate_id=candidate.id,
+                    type=DocumentType.CV,
+                    name=f"document-{number}.pdf",
+                    url="",
+                    storage_key=storage_key,
+                    content_type="application/pdf",
+                    size=len(content),
+                    checksum=checksum,
+                )
+            )
+        await session.commit()
+        return user.id, position.id
+
+
+async def cleanup(session_factory) -> None:
+    """Remove the benchmark rows (documents cascade with the candidate)."""
+    bench_checksums = (
+        select(Document.checksum)
+        .join(Candidate, Candidate.id == Document.candidate_id)
+        .where(Candidate.email == BENCH_CANDIDATE_EMAIL)
+    )
+    async with session_factory() as session:
+        await session.execute(delete(Blob).where(Blob.sha256.in_(bench_checksums)))
+        await session.execute(delete(User).where(User.email == BENCH_EMAIL))
+        await session.execute(delete(Candidate).where(Candidate.email == BENCH_CANDIDATE_EMAIL))
+        await session.execute(delete(Position).where(Position.title == BENCH_POSITION_TITLE))
+        await session.commit()
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far (Linux reports KiB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def download(path: str, token: str) -> tuple[int, int, float]:
+    """
+    Call the app directly and count the body without keeping it.
+
+    Returns (status, bytes received, seconds to first body byte).
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    started = time.perf_counter()
+    state = {"status": 0, "bytes": 0, "first_byte": 0.0}
+    disconnect = asyncio.Event()
+
+    async def receive():
+        if not state.get("requested"):
+            state["requested"] = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            state["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            if message.get("body") and not state["first_byte"]:
+                state["first_byte"] = time.perf_counter() - started
+            state["bytes"] += len(message.get("body", b""))
+            if not message.get("more_body"):
+                disconnect.set()
+
+    await app(scope, receive, send)
+    return state["status"], state["bytes"], state["first_byte"]
+
+
+async def main(args) -> None:
+    """Seed, download the archive repeatedly, print results and clean up."""
+    engine = create_engine(args.database_url)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-archive-"))
+    settings.STORAGE_PATH = str(args.storage_path or work_dir / "storage")
+    print(f"database: {engine.dialect.name}, storage: {settings.STORAGE_PATH}")
+
+    app.dependency_overrides[get_db] = override_get_db
+    rows = []
+    try:
+        user_id, position_id = await seed(session_factory, args.files, args.size_kb)
+        token = create_access_token(user_id)
+        for _ in range(args.runs):
+            rss_before = peak_rss_mb()
+            started = time.perf_counter()
+            status, received, first_byte = await download(
+                f"/api/v1/positions/{position_id}/documents.zip", token
+            )
+            elapsed = time.perf_counter() - started
+            rows.append((status, received, first_byte, elapsed, peak_rss_mb() - rss_before))
+    finally:
+        app.dependency_overrides.clear()
+        await cleanup(session_factory)
+        await engine.dispose()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"{args.files} files of {args.size_kb} KB")
+    print(
+        f"{'status':>6} {'archive MB':>11} {'TTFB ms':>8} {'total ms':>9} "
+        f"{'MB/s':>7} {'RSS +MB':>8}"
+    )
+    for status, received, first_byte, elapsed, rss_growth in rows:
+        print(
+            f"{status:>6} {received / MB:>11.1f} {first_byte * 1000:>8.1f} "
+            f"{elapsed * 1000:>9.1f} {received / MB / elapsed:>7.1f} {rss_growth:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--files", type=int, default=500, help="documents in the archive")
+    parser.add_argument("--size-kb", type=int, default=512, help="size of each document")
+    parser.add_argument("--runs", type=int, default=3, help="downloads to time")
+    parser.add_argument(
+        "--storage-path", type=Path,
+        help="where files are written (default: a temporary directory)",
+    )
+    asyncio.run(main(parser.parse_args()))
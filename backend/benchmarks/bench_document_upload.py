@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Benchmark document upload throughput.
+
+Uploads files of 10-50 MB (by default) to POST /candidates/{id}/documents
+through the real ASGI app in-process, with httpx streaming each file from
+disk. For every file size it prints latency percentiles, throughput in MB/s
+and the growth of the process's peak RSS, which stays flat when uploads are
+streamed rather than buffered.
+
+Files are written to a temporary STORAGE_PATH (or --storage-path) and the
+benchmark user, candidate and documents are removed afterwards.
+
+Usage:
+    python benchmarks/bench_document_upload.py [--sizes 10 25 50] [--uploads 5] [--concurrency 2]
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.security import hash_password
+from app.db.base import Base
+from app.db.session import create_engine, get_db
+from app.main import app
+from app.models import Candidate, CandidateStatus, User, UserRole
+from benchmarks.common import summarize
+
+BENCH_EMAIL = "bench-upload@bench.example.com"
+BENCH_PASSWORD = "bench-password"
+BENCH_CANDIDATE_EMAIL = "bench-upload-candidate@bench.example.com"
+MB = 1024 * 1024
+
+
+async def seed(session_factory) -> str:
+    """Create the uploading editor and the candidate; return the candidate id."""
+    async with session_factory() as session:
+        await session.execute(delete(User).where(User.email == BENCH_EMAIL))
+        await session.execute(delete(Candidate).where(Candidate.email == BENCH_CANDIDATE_EMAIL))
+        session.add(
+            User(
+                email=BENCH_EMAIL,
+                hashed_password=hash_password(BENCH_PASSWORD),
+                full_name="Benchmark User",
+                role=UserRole.EDITOR,
+                is_active=True,
+            )
+        )
+        candidate = Candidate(
+            name="Upload Benchmark",
+            email=BENCH_CANDIDATE_EMAIL,
+            phone="+1-555-0000",
+            location="Remote",
+            summary="Benchmark candidate",
+            status=CandidateStatus.ACTIVE,
+            sort_order=0,
+        )
+        session.add(candidate)
+        await session.commit()
+        return candidate.id
+
+
+async def cleanup(session_factory) -> None:
+    """Remove the benchmark user and candidate (documents cascade)."""
+    async with session_factory() as session:
+        await session.execute(delete(User).where(User.email == BENCH_EMAIL))
+        await session.execute(delete(Candidate).where(Candidate.email == BENCH_CANDIDATE_EMAIL))
+        await session.commit()
+
+
+def make_file(directory: Path, size_mb: int) -> Path:
+    """Write a file of random bytes of the given size."""
+    path = directory / f"upload-{size_mb}mb.pdf"
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            f.write(os.urandom(MB))
+    return path
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far (Linux reports KiB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def run_size(
+    client: AsyncClient,
+    candidate_id: str,
+    path: Path,
+    uploads: int,
+    concurrency: int,
+    headers: dict,
+) -> dict:
+    """Upload one file repeatedly and summarize."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one():
+        nonlocal errors
+        async with semaphore:
+            with open(path, "rb") as f:
+                start = time.perf_counter()
+                response = await client.post(
+                    f"/api/v1/candidates/{candidate_id}/documents",
+                    files={"file": (path.name, f, "application/pdf")},
+                    headers=headers,
+                )
+                latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 201:
+                errors += 1
+
+    rss_before = peak_rss_mb()
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(uploads)))
+    elapsed = time.perf_counter() - started
+
+    result = summarize(latencies, elapsed, errors)
+    result["mb_per_s"] = path.stat().st_size * (uploads - errors) / MB / elapsed
+    result["peak_rss_growth_mb"] = peak_rss_mb() - rss_before
+    return result
+
+
+async def main(args) -> None:
+    """Seed, upload every size, print results and clean up."""
+    engine = create_engine(args.database_url)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-upload-"))
+    settings.STORAGE_PATH = str(args.storage_path or work_dir / "storage")
+    settings.MAX_UPLOAD_SIZE_MB = max(settings.MAX_UPLOAD_SIZE_MB, max(args.sizes) + 1)
+    print(f"database: {engine.dialect.name}, storage: {settings.STORAGE_PATH}")
+
+    app.dependency_overrides[get_db] = override_get_db
+    results = {}
+    try:
+        candidate_id = await seed(session_factory)
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench", timeout=None
+        ) as client:
+            response = await client.post(
+                "/api/v1/auth/login",
+                data={"username": BENCH_EMAIL, "password": BENCH_PASSWORD},
+            )
+            headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+            for size_mb in args.sizes:
+                path = make_file(work_dir, size_mb)
+                results[size_mb] = await run_size(
+                    client, candidate_id, path, args.uploads, args.concurrency, headers
+                )
+                path.unlink()
+    finally:
+        app.dependency_overrides.clear()
+        await cleanup(session_factory)
+        await engine.dispose()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(
+        f"{'size':>7} {'uploads':>8} {'MB/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'RSS +MB':>8} {'errors':>7}"
+    )
+    for size_mb, result in results.items():
+        print(
+            f"{size_mb:>5}MB {result['requests']:>8} {result['mb_per_s']:>8.1f} "
+            f"{result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} "
+            f"{result['peak_rss_growth_mb']:>8.1f} {result['errors']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 25, 50], help="file sizes in MB"
+    )
+    parser.add_argument("--uploads", type=int, default=5, help="uploads per file size")
+    parser.add_argument("--concurrency", type=int, default=2, help="uploads in flight")
+    parser.add_argument(
+        "--storage-path", type=Path,
+        help="where uploads are written (default: a temporary directory)",
+    )
+    asyncio.run(main(parser.parse_args()))
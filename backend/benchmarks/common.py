@@ -0,0 +1,42 @@
+"""Shared helpers for the benchmark scripts."""
+
+import math
+import statistics
+
+from sqlalchemy import event
+
+
+class RoundTripCounter:
+    """Count statements and commits sent over an engine."""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine.sync_engine, "commit", self._on_commit)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def _on_commit(self, conn):
+        self.count += 1
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the pct-th percentile (nearest rank) of samples."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(latencies_ms: list[float], elapsed_s: float, errors: int = 0) -> dict:
+    """Summarize one scenario's latencies (milliseconds) and wall time."""
+    return {
+        "requests": len(latencies_ms),
+        "errors": errors,
+        "throughput_rps": len(latencies_ms) / elapsed_s if elapsed_s else 0.0,
+        "mean_ms": statistics.fmean(latencies_ms),
+        "stdev_ms": statistics.stdev(latencies_ms) if len(latencies_ms) > 1 else 0.0,
+        "p50_ms": percentile(latencies_ms, 50),
+        "p95_ms": percentile(latencies_ms, 95),
+        "p99_ms": percentile(latencies_ms, 99),
+    }
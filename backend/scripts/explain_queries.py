@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Run EXPLAIN on every query issued by the repositories and flag bad plans.
+
+Each repository method is executed against the configured database while the
+emitted SELECT statements are captured. Every captured statement is then run
+through EXPLAIN and the plan is checked for full table scans and filesorts.
+Both MySQL (EXPLAIN) and SQLite (EXPLAIN QUERY PLAN) are supported.
+
+Usage:
+    python scripts/explain_queries.py [--strict]
+
+With --strict the script exits non-zero when any plan is flagged.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import event, select
+
+from app.db.session import AsyncSessionLocal, engine
+from app.models.candidate import Candidate
+from app.models.position import Position
+from app.repositories.candidate import CandidateRepository
+from app.repositories.candidate_position import CandidatePositionRepository
+from app.repositories.position import PositionRepository
+
+MISSING_ID = "00000000-0000-0000-0000-000000000000"
+
+# Substring searches with a leading wildcard cannot use a B-tree index; their
+# scans are reported but not counted as failures.
+EXPECTED_SCAN_CASES = {"candidates: search", "positions: search"}
+
+
+def repository_calls(candidate_id: str, position_id: str):
+    """Return (label, coroutine factory) pairs covering every repository query."""
+    return [
+        ("candidates: list", lambda db: CandidateRepository.get_candidates(db)),
+        (
+            "candidates: list all statuses",
+            lambda db: CandidateRepository.get_candidates(db, status=None),
+        ),
+        (
+            "candidates: search",
+            lambda db: CandidateRepository.get_candidates(db, search="python"),
+        ),
+        (
+            "candidates: by position",
+            lambda db: CandidateRepository.get_candidates(db, position_id=position_id),
+        ),
+        (
+            "candidates: detail",
+            lambda db: CandidateRepository.get_candidate_by_id(db, candidate_id),
+        ),
+        ("positions: list", lambda db: PositionRepository.get_positions(db)),
+        (
+            "positions: search",
+            lambda db: PositionRepository.get_positions(db, search="engineer"),
+        ),
+        (
+            "positions: detail",
+            lambda db: PositionRepository.get_position_by_id(db, position_id),
+        ),
+        (
+            "candidate_positions: relationship",
+            lambda db: CandidatePositionRepository.get_relationship(
+                db, candidate_id, position_id
+            ),
+        ),
+    ]
+
+
+def check_mysql_plan(rows: list[dict]) -> list[str]:
+    """Return human-readable problems found in a MySQL EXPLAIN result."""
+    problems = []
+    for row in rows:
+        table = row.get("table")
+        extra = row.get("Extra") or ""
+        if row.get("type") == "ALL":
+            problems.append(f"full scan on {table} (~{row.get('rows')} rows)")
+        if "Using filesort" in extra:
+            problems.append(f"filesort on {table}")
+        if "Using temporary" in extra:
+            problems.append(f"temporary table for {table}")
+    return problems
+
+
+def check_sqlite_plan(rows: list[dict]) -> list[str]:
+    """Return human-readable problems found in a SQLite EXPLAIN QUERY PLAN result."""
+    problems = []
+    for row in rows:
+        detail = row.get("detail") or ""
+        if detail.startswith("SCAN") and "USING" not in detail:
+            problems.append(f"full scan: {detail}")
+        if "USE TEMP B-TREE" in detail:
+            problems.append(f"sort without index: {detail}")
+    return problems
+
+
+async def explain(conn, statement: str, parameters) -> list[str]:
+    """Run EXPLAIN for a captured statement and return the flagged problems."""
+    if conn.dialect.name == "sqlite":
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return check_sqlite_plan([dict(row._mapping) for row in result])
+
+    result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return check_mysql_plan([dict(row._mapping) for row in result])
+
+
+async def pick_ids(session) -> tuple[str, str]:
+    """Use real ids when the database has data so lookups hit rows."""
+    candidate_id = await session.scalar(select(Candidate.id).limit(1))
+    position_id = await session.scalar(select(Position.id).limit(1))
+    return candidate_id or MISSING_ID, position_id or MISSING_ID
+
+
+async def main(strict: bool) -> int:
+    """Capture, explain and report every repository query."""
+    captured: list[tuple[str, object]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    async with AsyncSessionLocal() as session:
+        candidate_id, position_id = await pick_ids(session)
+
+    flagged = 0
+    for label, call in repository_calls(candidate_id, position_id):
+        captured.clear()
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            async with AsyncSessionLocal() as session:
+                await call(session)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+        print(f"\n== {label} ({len(captured)} queries)")
+        async with engine.connect() as conn:
+            for statement, parameters in captured:
+                problems = await explain(conn, statement, parameters)
+                first_line = " ".join(statement.split())[:100]
+                if not problems:
+                    print(f"  ok    {first_line}")
+                    continue
+                expected = label in EXPECTED_SCAN_CASES
+                print(f"  {'note' if expected else 'FLAG'}  {first_line}")
+                for problem in problems:
+                    print(f"          - {problem}")
+                if not expected:
+                    flagged += 1
+
+    print(f"\n{flagged} flagged plan(s)")
+    await engine.dispose()
+    return 1 if strict and flagged else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--strict", action="store_true", help="exit non-zero when any plan is flagged"
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.strict)))
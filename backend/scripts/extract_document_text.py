@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Extract searchable text from uploaded documents.
+
+Runs the same process-pool extractor the API uses for new uploads. By
+default only documents without extracted text are processed (uploads that
+arrived while the queue was full, or before extraction existed); --all
+re-extracts everything, e.g. after an extractor upgrade.
+
+Usage:
+    python scripts/extract_document_text.py [--all] [--workers 4] [--timeout 30]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.db.session import AsyncSessionLocal, engine
+from app.repositories.document import DocumentRepository
+from app.services.text_extraction import TextExtractor
+
+
+async def main(only_missing: bool, workers: int, timeout: float) -> int:
+    """Run the backfill and print a status summary."""
+    extractor = TextExtractor(
+        AsyncSessionLocal,
+        workers=workers,
+        queue_size=settings.EXTRACTION_QUEUE_SIZE,
+        timeout=timeout,
+    )
+    started = time.perf_counter()
+    await extractor.start()
+    try:
+        queued = await extractor.backfill(only_missing=only_missing)
+    finally:
+        await extractor.stop()
+
+    async with AsyncSessionLocal() as session:
+        counts = await DocumentRepository.count_texts_by_status(session)
+    await engine.dispose()
+
+    print(f"Processed {queued} documents in {time.perf_counter() - started:.1f}s")
+    for status, count in counts.items():
+        print(f"  {status.value}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--all", dest="only_missing", action="store_false",
+        help="re-extract documents that already have text",
+    )
+    parser.add_argument("--workers", type=int, default=settings.EXTRACTION_WORKERS)
+    parser.add_argument(
+        "--timeout", type=float, default=settings.EXTRACTION_TIMEOUT_SECONDS,
+        help="seconds allowed per file",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.only_missing, args.workers, args.timeout)))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Remove stored document files that no document references any more.
+
+Uploads are stored once per content under STORAGE_PATH/ab/cd/<sha256> and
+reference-counted in the blobs table. This deletes unreferenced blobs in
+batches. --recount first recomputes every count from the documents table
+(needed if documents were deleted outside the API, e.g. by a cascading
+candidate delete); --orphans also sweeps files left without a blob row by
+interrupted uploads.
+
+Usage:
+    python scripts/gc_blobs.py [--recount] [--orphans] [--batch-size 500]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.session import AsyncSessionLocal, engine
+from app.repositories.blob import BlobRepository
+from app.services.document_storage import GC_BATCH_SIZE, DocumentStorageService
+
+
+async def main(recount: bool, orphans: bool, batch_size: int) -> int:
+    """Run the collection and print what was freed."""
+    try:
+        async with AsyncSessionLocal() as session:
+            if recount:
+                changed = await BlobRepository.recount_references(session)
+                print(f"Reference counts corrected: {changed}")
+            removed, freed = await DocumentStorageService.collect_garbage(session, batch_size)
+            print(f"Blobs removed: {removed} ({freed / 1024 / 1024:.1f} MB)")
+            if orphans:
+                removed, freed = await DocumentStorageService.sweep_orphans(
+                    session, batch_size=batch_size
+                )
+                print(f"Orphaned files removed: {removed} ({freed / 1024 / 1024:.1f} MB)")
+    finally:
+        await engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--recount", action="store_true", help="recompute reference counts first"
+    )
+    parser.add_argument(
+        "--orphans", action="store_true", help="also remove files without a blob row"
+    )
+    parser.add_argument("--batch-size", type=int, default=GC_BATCH_SIZE)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.recount, args.orphans, args.batch_size)))
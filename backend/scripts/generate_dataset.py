@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""Generate a reproducible synthetic dataset for load testing and profiling.
+
+Creates candidates with experiences, education, skills, documents and
+position applications, plus positions with required skills. Everything is
+derived from --seed, so the same arguments always produce the same rows.
+Rows are written with bulk Core inserts (executemany) in batches, one
+transaction per batch, so memory stays flat at any size; skill names are
+resolved to the skill catalog afterwards.
+
+Generated candidates use the @synthetic.example.com email domain and generated
+positions the "Synthetic" department; --clean removes them.
+
+Usage:
+    python scripts/generate_dataset.py --size 100k [--seed 42] [--batch-size 5000]
+    python scripts/generate_dataset.py --clean
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.session import create_engine
+from app.models import (
+    Candidate,
+    CandidatePosition,
+    CandidateStatus,
+    Document,
+    DocumentType,
+    Education,
+    Experience,
+    Position,
+    PositionSkill,
+    PositionStatus,
+    Skill,
+    SkillLevel,
+)
+from app.repositories.pipeline import PipelineRepository
+from app.repositories.position_score import PositionScoreRepository
+from app.repositories.skill_catalog import SkillCatalogRepository
+from app.services.candidate import CandidateService
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+EMAIL_DOMAIN = "synthetic.example.com"
+DEPARTMENT = "Synthetic"
+
+# Dates are relative to a fixed day so output does not change over time
+REFERENCE_DATE = date(2026, 1, 1)
+CREATED_AT = datetime(2026, 1, 1)
+
+CANDIDATES_PER_POSITION = 100
+
+FIRST_NAMES = [
+    "Ada", "Alan", "Amara", "Ana", "Arjun", "Ben", "Carlos", "Chen", "Chloe",
+    "Daniel", "Elena", "Emily", "Fatima", "Felix", "Grace", "Hana", "Ivan",
+    "Jamal", "Julia", "Kenji", "Lars", "Layla", "Lucas", "Maria", "Mei",
+    "Michael", "Nadia", "Noah", "Olga", "Omar", "Priya", "Rafael", "Sara",
+    "Sofia", "Tariq", "Tom", "Valentina", "Wei", "Yusuf", "Zoe",
+]
+LAST_NAMES = [
+    "Adeyemi", "Andersson", "Bauer", "Chen", "Costa", "Dubois", "Fernandez",
+    "Garcia", "Hansen", "Ibrahim", "Ivanova", "Jensen", "Kim", "Kowalski",
+    "Lee", "Lopez", "Martin", "Meyer", "Nakamura", "Nguyen", "Novak", "Okafor",
+    "Patel", "Rossi", "Rodriguez", "Sato", "Schmidt", "Silva", "Singh",
+    "Smith", "Tanaka", "Watson", "Williams", "Wong", "Yilmaz", "Zhang",
+]
+CITIES = [
+    "Amsterdam, NL", "Austin, TX", "Berlin, DE", "Boston, MA", "Chicago, IL",
+    "Denver, CO", "Lisbon, PT", "London, UK", "Madrid, ES", "New York, NY",
+    "Paris, FR", "Remote", "San Francisco, CA", "Seattle, WA", "Tel Aviv, IL",
+    "Toronto, CA", "Warsaw, PL",
+]
+SKILLS = [
+    "Python", "Java", "Go", "Rust", "TypeScript", "JavaScript", "C#", "C++",
+    "Kotlin", "Swift", "Ruby", "PHP", "Scala", "React", "Vue", "Angular",
+    "Node.js", "Django", "FastAPI", "Flask", "Spring", "Rails", ".NET",
+    "PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch", "Kafka",
+    "RabbitMQ", "AWS", "GCP", "Azure", "Docker", "Kubernetes", "Terraform",
+    "Ansible", "Linux", "Git", "CI/CD", "GraphQL", "REST", "gRPC",
+    "Machine Learning", "Data Analysis", "SQL", "Pandas", "Spark", "Airflow",
+    "Tableau", "Figma", "Product Management", "Agile/Scrum", "User Research",
+    "Security", "Networking", "Testing", "Selenium", "Microservices",
+]
+TITLES = [
+    "Software Engineer", "Senior Software Engineer", "Backend Developer",
+    "Frontend Developer", "Full-Stack Developer", "DevOps Engineer",
+    "Site Reliability Engineer", "Data Engineer", "Data Scientist",
+    "QA Engineer", "Product Manager", "Engineering Manager", "Tech Lead",
+    "Mobile Developer", "Security Engineer",
+]
+COMPANIES = [
+    "Acme Corp", "Blue Harbor", "Brightline", "CloudFirst", "DataCorp",
+    "Evergreen Labs", "Finwise", "Globex", "Hooli", "Initech", "Lumen Health",
+    "Northwind", "Orbital", "Pied Piper", "Quantum Retail", "StartupXYZ",
+    "TechCorp", "Umbrella", "Vandelay", "WebSolutions",
+]
+INSTITUTIONS = [
+    "State University", "Institute of Technology", "City College",
+    "Polytechnic University", "Open University", "National University",
+]
+DEGREES = ["Bachelor of Science", "Bachelor of Arts", "Master of Science", "PhD"]
+FIELDS = [
+    "Computer Science", "Software Engineering", "Mathematics", "Physics",
+    "Information Technology", "Economics", "Business Administration",
+]
+CANDIDATE_STATUSES = [
+    CandidateStatus.ACTIVE, CandidateStatus.HIRED, CandidateStatus.REJECTED,
+    CandidateStatus.WITHDRAWN,
+]
+CANDIDATE_STATUS_WEIGHTS = [70, 10, 15, 5]
+POSITION_STATUSES = [PositionStatus.OPEN, PositionStatus.CLOSED, PositionStatus.ON_HOLD]
+POSITION_STATUS_WEIGHTS = [70, 20, 10]
+SKILL_LEVELS = list(SkillLevel)
+
+ExperienceSpan = namedtuple("ExperienceSpan", ["start_date", "end_date"])
+
+
+def make_id(rng: random.Random) -> str:
+    """A UUID4 drawn from the seeded generator."""
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+def random_date(rng: random.Random, earliest: date, latest: date) -> date:
+    """A date in [earliest, latest]."""
+    return earliest + timedelta(days=rng.randint(0, (latest - earliest).days))
+
+
+def generate_positions(rng: random.Random, count: int) -> tuple[list[dict], list[dict]]:
+    """Build position rows and their required skill rows."""
+    positions, position_skills = [], []
+    for i in range(count):
+        position_id = make_id(rng)
+        title = rng.choice(TITLES)
+        positions.append({
+            "id": position_id,
+            "title": f"{title} #{i + 1}",
+            "department": DEPARTMENT,
+            "location": rng.choice(CITIES),
+            "description": f"{title} working on {rng.choice(COMPANIES)} products.",
+            "requirements": f"{rng.randint(1, 8)}+ years of relevant experience.",
+            "min_experience_years": rng.randint(0, 8),
+            "status": rng.choices(POSITION_STATUSES, POSITION_STATUS_WEIGHTS)[0],
+            "posted_date": random_date(rng, date(2024, 1, 1), REFERENCE_DATE),
+            "sort_order": i,
+            "created_at": CREATED_AT,
+            "updated_at": CREATED_AT,
+        })
+        for name in rng.sample(SKILLS, rng.randint(3, 6)):
+            position_skills.append(
+                {"id": make_id(rng), "position_id": position_id, "name": name}
+            )
+    return positions, position_skills
+
+
+def generate_candidate_batch(
+    rng: random.Random,
+    start: int,
+    count: int,
+    position_ids: list[str],
+) -> dict:
+    """Build rows for candidates start..start+count and everything they own."""
+    rows = {
+        Candidate: [], Experience: [], Education: [], Skill: [], Document: [],
+        CandidatePosition: [],
+    }
+    for i in range(start, start + count):
+        candidate_id = make_id(rng)
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        name = f"{first} {last}"
+        email = f"{first.lower()}.{last.lower()}.{i}@{EMAIL_DOMAIN}"
+
+        # Consecutive jobs going back from today (or a recent end date)
+        spans = []
+        end = None if rng.random() < 0.7 else random_date(rng, date(2023, 1, 1), REFERENCE_DATE)
+        cursor = end or REFERENCE_DATE
+        for _ in range(rng.randint(1, 5)):
+            start_date = cursor - timedelta(days=rng.randint(180, 1800))
+            spans.append(ExperienceSpan(start_date, end))
+            rows[Experience].append({
+                "id": make_id(rng),
+                "candidate_id": candidate_id,
+                "company": rng.choice(COMPANIES),
+                "title": rng.choice(TITLES),
+                "start_date": start_date,
+                "end_date": end,
+                "description": "Delivered features and maintained production services.",
+            })
+            end = start_date - timedelta(days=rng.randint(1, 90))
+            cursor = end
+
+        for _ in range(rng.randint(0, 2)):
+            edu_start = random_date(rng, date(2000, 1, 1), date(2018, 1, 1))
+            rows[Education].append({
+                "id": make_id(rng),
+                "candidate_id": candidate_id,
+                "institution": f"{rng.choice(LAST_NAMES)} {rng.choice(INSTITUTIONS)}",
+                "degree": rng.choice(DEGREES),
+                "field": rng.choice(FIELDS),
+                "start_date": edu_start,
+                "end_date": edu_start + timedelta(days=365 * rng.randint(1, 5)),
+            })
+
+        skill_names = rng.sample(SKILLS, rng.randint(3, 10))
+        for skill_name in skill_names:
+            rows[Skill].append({
+                "id": make_id(rng),
+                "candidate_id": candidate_id,
+                "name": skill_name,
+                "level": rng.choice(SKILL_LEVELS),
+            })
+
+        rows[Document].append({
+            "id": make_id(rng),
+            "candidate_id": candidate_id,
+            "type": DocumentType.CV,
+            "name": f"{first}_{last}_Resume.pdf",
+            "url": f"/storage/documents/synthetic/{candidate_id}.pdf",
+            "uploaded_at": CREATED_AT,
+        })
+
+        for position_id in rng.sample(position_ids, min(len(position_ids), rng.randint(0, 3))):
+            rows[CandidatePosition].append({
+                "id": make_id(rng),
+                "candidate_id": candidate_id,
+                "position_id": position_id,
+                "applied_at": CREATED_AT - timedelta(days=rng.randint(0, 365)),
+            })
+
+        rows[Candidate].append({
+            "id": candidate_id,
+            "name": name,
+            "email": email,
+            "phone": f"+1-555-{rng.randint(0, 9999):04d}",
+            "location": rng.choice(CITIES),
+            "summary": f"{rng.choice(TITLES)} with a background in {', '.join(skill_names[:3])}.",
+            "status": rng.choices(CANDIDATE_STATUSES, CANDIDATE_STATUS_WEIGHTS)[0],
+            "sort_order": i,
+            "years_of_experience": CandidateService.calculate_years_of_experience(spans),
+            "search_text": CandidateService.build_search_text(name, email, skill_names),
+            "created_at": CREATED_AT,
+            "updated_at": CREATED_AT,
+        })
+    return rows
+
+
+async def insert_rows(engine, rows: dict) -> int:
+    """Insert one batch in a single transaction; parents before children."""
+    async with engine.begin() as conn:
+        for model, table_rows in rows.items():
+            if table_rows:
+                await conn.execute(insert(model), table_rows)
+    return sum(len(table_rows) for table_rows in rows.values())
+
+
+async def generate(engine, candidates: int, seed: int, batch_size: int) -> None:
+    """Generate and insert the whole dataset."""
+    # Separate streams, so candidate rows do not shift with the position count
+    position_rng = random.Random(f"{seed}:positions")
+    rng = random.Random(f"{seed}:candidates")
+    started = time.perf_counter()
+
+    positions, position_skills = generate_positions(
+        position_rng, max(1, candidates // CANDIDATES_PER_POSITION)
+    )
+    total_rows = await insert_rows(engine, {Position: positions, PositionSkill: position_skills})
+    position_ids = [row["id"] for row in positions]
+    print(f"  positions: {len(positions)}")
+
+    for start in range(0, candidates, batch_size):
+        count = min(batch_size, candidates - start)
+        total_rows += await insert_rows(
+            engine, generate_candidate_batch(rng, start, count, position_ids)
+        )
+        elapsed = time.perf_counter() - started
+        print(
+            f"  candidates: {start + count}/{candidates} "
+            f"({total_rows} rows, {total_rows / elapsed:,.0f} rows/s)"
+        )
+
+    async with AsyncSession(engine) as session:
+        names = await SkillCatalogRepository.canonicalize_skills(session)
+    print(f"  skill catalog: {names} names resolved")
+    async with AsyncSession(engine) as session:
+        scores = await PositionScoreRepository.rebuild(session)
+    print(f"  position scores: {scores} rows")
+    async with AsyncSession(engine) as session:
+        rollups = await PipelineRepository.rebuild(session)
+    print(f"  pipeline rollups: {sum(rollups.values())} rows")
+
+    print(f"Done: {total_rows} rows in {time.perf_counter() - started:.1f}s")
+
+
+async def clean(engine) -> None:
+    """Delete generated candidates and positions (children cascade)."""
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            delete(Candidate).where(Candidate.email.like(f"%@{EMAIL_DOMAIN}"))
+        )
+        print(f"  deleted {result.rowcount} candidates")
+        result = await conn.execute(delete(Position).where(Position.department == DEPARTMENT))
+        print(f"  deleted {result.rowcount} positions")
+    async with AsyncSession(engine) as session:
+        await PipelineRepository.rebuild(session)
+
+
+def parse_size(value: str) -> int:
+    """Accept a preset (10k, 100k, 1m) or a plain number."""
+    return SIZES.get(value.lower()) or int(value)
+
+
+async def main(args) -> None:
+    """Generate or clean the synthetic dataset."""
+    engine = create_engine(args.database_url)
+    print(f"database: {engine.dialect.name}")
+    try:
+        if args.clean:
+            await clean(engine)
+        else:
+            await generate(engine, args.size, args.seed, args.batch_size)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument(
+        "--size", type=parse_size, default="10k",
+        help="number of candidates: 10k, 100k, 1m or a number",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    parser.add_argument("--batch-size", type=int, default=5000, help="candidates per transaction")
+    parser.add_argument("--clean", action="store_true", help="delete generated data instead")
+    asyncio.run(main(parser.parse_args()))
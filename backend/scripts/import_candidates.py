@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Import candidates from a CSV or xlsx file, upserting on email.
+
+The file is streamed in batches, so memory use does not depend on its size.
+
+Usage:
+    python scripts/import_candidates.py candidates.xlsx [--batch-size 1000]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.session import AsyncSessionLocal, engine
+from app.services.candidate_import import DEFAULT_BATCH_SIZE, CandidateImportService
+
+
+async def main(path: Path, batch_size: int) -> int:
+    """Run the import and print a summary."""
+    try:
+        with path.open("rb") as file:
+            async with AsyncSessionLocal() as session:
+                result = await CandidateImportService.import_candidates(
+                    session, file, path.name, batch_size
+                )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        await engine.dispose()
+
+    print(f"Rows read: {result.rows_read}")
+    print(f"Imported:  {result.imported}")
+    print(f"Invalid:   {result.invalid}")
+    for error in result.errors:
+        print(f"  row {error.row}: {error.message}")
+    if result.invalid > len(result.errors):
+        print(f"  ... and {result.invalid - len(result.errors)} more")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help="CSV or xlsx file")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.path, args.batch_size)))
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Recompute the pipeline analytics rollups from the base tables.
+
+Writes through the API keep the rollups current; run this after loading
+data outside the API or fixing rows by hand.
+
+Usage:
+    python scripts/rebuild_pipeline_stats.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.session import AsyncSessionLocal, engine
+from app.repositories.pipeline import PipelineRepository
+
+
+async def main() -> int:
+    """Rebuild the rollups and print the rows written per table."""
+    try:
+        async with AsyncSessionLocal() as session:
+            written = await PipelineRepository.rebuild(session)
+    finally:
+        await engine.dispose()
+    for table, rows in written.items():
+        print(f"{table}: {rows} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Recompute the materialized candidate scores of every open position.
+
+Writes through the API keep position_candidate_scores current; run this
+after migrating, after loading data outside the API, or after changing
+the scoring weights.
+
+Usage:
+    python scripts/rebuild_position_scores.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.session import AsyncSessionLocal, engine
+from app.repositories.position_score import PositionScoreRepository
+
+
+async def main() -> int:
+    """Rebuild the table and print how many rows were written."""
+    started = time.perf_counter()
+    try:
+        async with AsyncSessionLocal() as session:
+            written = await PositionScoreRepository.rebuild(session)
+    finally:
+        await engine.dispose()
+    print(f"Position scores written: {written} in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -24,6 +24,10 @@ from app.models.position import Position, PositionStatus
 from app.models.position_skill import PositionSkill
 from app.models.skill import Skill, SkillLevel
 from app.models.user import User, UserRole
+from app.repositories.candidate import CandidateRepository
+from app.repositories.pipeline import PipelineRepository
+from app.repositories.position_score import PositionScoreRepository
+from app.repositories.skill_catalog import SkillCatalogRepository
 
 
 async def create_users(session):
@@ -305,6 +309,10 @@ async def seed_candidates(session):
 
     print("  - Created candidate: Emily Watson")
 
+    await session.flush()
+    await CandidateRepository.refresh_derived_fields(
+        session, [sarah.id, michael.id, emily.id]
+    )
     await session.commit()
     return sarah, michael, emily
 
@@ -447,6 +455,15 @@ async def main():
             # Create relationships
             await create_relationships(session, candidates, positions)
 
+            # Resolve skill names to the canonical skill catalog
+            await SkillCatalogRepository.canonicalize_skills(session)
+
+            # Rank candidates for the open positions
+            await PositionScoreRepository.rebuild(session)
+
+            # Roll up the pipeline analytics
+            await PipelineRepository.rebuild(session)
+
             print("\n" + "=" * 60)
             print("Database seeded successfully!")
             print("=" * 60)
@@ -0,0 +1,144 @@
+"""API tests for analytics endpoints."""
+
+import pytest
+from datetime import date
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import hash_password
+from app.models.candidate import CandidateStatus
+from app.models.position import PositionStatus
+from app.models.user import User, UserRole
+from app.repositories.pipeline import PipelineRepository
+from tests.fixtures.factories import create_candidate, create_position
+
+
+@pytest.fixture
+async def editor_token(client: AsyncClient, db_session: AsyncSession) -> str:
+    """Create an editor user and return auth token."""
+    user = User(
+        email="editor@example.com",
+        hashed_password=hash_password("password123"),
+        full_name="Editor User",
+        role=UserRole.EDITOR,
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "editor@example.com", "password": "password123"},
+    )
+    return response.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_requires_authentication(client: AsyncClient):
+    """Test that the pipeline overview requires a logged-in user."""
+    response = await client.get("/api/v1/analytics/pipeline")
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_pipeline_follows_applications_and_position_changes(
+    client: AsyncClient, db_session: AsyncSession, editor_token: str
+):
+    """Rollups follow links and position edits, and match a full rebuild."""
+    backend = create_position(
+        title="Backend", department="Engineering", posted_date=date(2024, 1, 5)
+    )
+    data = create_position(title="Data", department="Engineering", posted_date=date(2024, 1, 20))
+    sales = create_position(
+        title="Sales Lead",
+        department="Sales",
+        status=PositionStatus.ON_HOLD,
+        posted_date=date(2024, 2, 10),
+    )
+    ann = create_candidate(name="Ann")
+    bob = create_candidate(name="Bob", status=CandidateStatus.HIRED)
+    db_session.add_all([backend, data, sales, ann, bob])
+    await db_session.commit()
+    await PipelineRepository.rebuild(db_session)
+    headers = {"Authorization": f"Bearer {editor_token}"}
+
+    response = await client.post(
+        f"/api/v1/candidates/{ann.id}/positions/{backend.id}", headers=headers
+    )
+    assert response.status_code == 201
+    response = await client.post(
+        f"/api/v1/positions/{data.id}/candidates",
+        headers=headers,
+        json={"candidateIds": [ann.id, bob.id]},
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/analytics/pipeline", headers=headers)
+    assert response.status_code == 200
+    pipeline = response.json()
+    assert [(p["title"], p["applications"]) for p in pipeline["positions"]] == [
+        ("Data", 2),
+        ("Backend", 1),
+    ]
+    engineering, sales_department = pipeline["departments"]
+    assert engineering == {
+        "department": "Engineering",
+        "positions": {"Open": 2},
+        "applications": {"Active": 2, "Hired": 1},
+        "totalPositions": 2,
+        "totalApplications": 3,
+    }
+    assert sales_department["positions"] == {"On Hold": 1}
+    assert sales_department["applications"] == {}
+    assert pipeline["openings"] == [
+        {"period": "2024-01-01", "positions": 2},
+        {"period": "2024-02-01", "positions": 1},
+    ]
+
+    # Move Data to Sales and repost it; drop Ann from Backend
+    response = await client.get(f"/api/v1/positions/{data.id}", headers=headers)
+    response = await client.patch(
+        f"/api/v1/positions/{data.id}",
+        headers={**headers, "If-Match": response.headers["ETag"]},
+        json={"department": "Sales", "postedDate": "2024-02-15"},
+    )
+    assert response.status_code == 200
+    response = await client.delete(
+        f"/api/v1/candidates/{ann.id}/positions/{backend.id}", headers=headers
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/analytics/pipeline?interval=day", headers=headers)
+    pipeline = response.json()
+    assert [(p["title"], p["applications"]) for p in pipeline["positions"]] == [("Data", 2)]
+    engineering, sales_department = pipeline["departments"]
+    assert engineering["positions"] == {"Open": 1}
+    assert engineering["applications"] == {}
+    assert sales_department["positions"] == {"Open": 1, "On Hold": 1}
+    assert sales_department["applications"] == {"Active": 1, "Hired": 1}
+    assert pipeline["openings"] == [
+        {"period": "2024-01-05", "positions": 1},
+        {"period": "2024-02-10", "positions": 1},
+        {"period": "2024-02-15", "positions": 1},
+    ]
+
+    await PipelineRepository.rebuild(db_session)
+    response = await client.get("/api/v1/analytics/pipeline?interval=day", headers=headers)
+    assert response.json() == pipeline
+
+    # A bulk unlink empties Data; its groups go away rather than stay at zero
+    response = await client.request(
+        "DELETE",
+        f"/api/v1/positions/{data.id}/candidates",
+        headers=headers,
+        json={"candidateIds": [ann.id, bob.id]},
+    )
+    assert response.status_code == 200
+    response = await client.get("/api/v1/analytics/pipeline?interval=day", headers=headers)
+    pipeline = response.json()
+    assert pipeline["positions"] == []
+    assert [d["applications"] for d in pipeline["departments"]] == [{}, {}]
+
+    await PipelineRepository.rebuild(db_session)
+    response = await client.get("/api/v1/analytics/pipeline?interval=day", headers=headers)
+    assert response.json() == pipeline
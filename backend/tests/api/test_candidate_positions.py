@@ -3,11 +3,14 @@
 import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import hash_password
 from app.models.candidate_position import CandidatePosition
 from app.models.user import User, UserRole
+from app.repositories.candidate_position import CandidatePositionRepository
+from app.repositories.pipeline import PipelineRepository
 from tests.fixtures.factories import create_candidate, create_position
 
 
@@ -297,3 +300,134 @@ async def test_position_response_includes_candidates(
     assert len(data["candidates"]) == 2
     assert candidate1.id in data["candidates"]
     assert candidate2.id in data["candidates"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_candidates_to_position(
+    client: AsyncClient, db_session: AsyncSession, editor_token: str
+):
+    """Test bulk assignment reports a per-candidate outcome in request order."""
+    linked = create_candidate(name="Already Linked")
+    fresh = create_candidate(name="Fresh")
+    position = create_position()
+    db_session.add_all([linked, fresh, position])
+    await db_session.flush()
+    db_session.add(CandidatePosition(candidate_id=linked.id, position_id=position.id))
+    await db_session.commit()
+
+    missing_id = "00000000-0000-0000-0000-000000000000"
+    response = await client.post(
+        f"/api/v1/positions/{position.id}/candidates",
+        json={"candidateIds": [fresh.id, linked.id, missing_id, fresh.id]},
+        headers={"Authorization": f"Bearer {editor_token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["positionId"] == position.id
+    assert data["results"] == [
+        {"candidateId": fresh.id, "status": "added"},
+        {"candidateId": linked.id, "status": "already_assigned"},
+        {"candidateId": missing_id, "status": "not_found"},
+    ]
+
+    result = await db_session.execute(
+        select(CandidatePosition.candidate_id).where(
+            CandidatePosition.position_id == position.id
+        )
+    )
+    assert set(result.scalars().all()) == {linked.id, fresh.id}
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_candidates_position_not_found(
+    client: AsyncClient, db_session: AsyncSession, editor_token: str
+):
+    """Test bulk assignment to a non-existent position returns 404."""
+    candidate = create_candidate()
+    db_session.add(candidate)
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/positions/00000000-0000-0000-0000-000000000000/candidates",
+        json={"candidateIds": [candidate.id]},
+        headers={"Authorization": f"Bearer {editor_token}"},
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_candidates_requires_editor(
+    client: AsyncClient, db_session: AsyncSession, read_only_token: str
+):
+    """Test that read-only users cannot bulk assign candidates."""
+    position = create_position()
+    db_session.add(position)
+    await db_session.commit()
+
+    response = await client.post(
+        f"/api/v1/positions/{position.id}/candidates",
+        json={"candidateIds": ["some-id"]},
+        headers={"Authorization": f"Bearer {read_only_token}"},
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_bulk_remove_candidates_from_position(
+    client: AsyncClient, db_session: AsyncSession, editor_token: str
+):
+    """Test bulk unassignment removes links and reports missing ones."""
+    linked = create_candidate(name="Linked")
+    unlinked = create_candidate(name="Unlinked")
+    position = create_position()
+    db_session.add_all([linked, unlinked, position])
+    await db_session.flush()
+    db_session.add(CandidatePosition(candidate_id=linked.id, position_id=position.id))
+    await db_session.commit()
+
+    response = await client.request(
+        "DELETE",
+        f"/api/v1/positions/{position.id}/candidates",
+        json={"candidateIds": [linked.id, unlinked.id]},
+        headers={"Authorization": f"Bearer {editor_token}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"candidateId": linked.id, "status": "removed"},
+        {"candidateId": unlinked.id, "status": "not_assigned"},
+    ]
+
+    result = await db_session.execute(
+        select(CandidatePosition).where(CandidatePosition.position_id == position.id)
+    )
+    assert result.scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_rollup_failure_is_not_reported_as_a_duplicate_link(
+    db_session: AsyncSession, monkeypatch
+):
+    """Only the link INSERT's integrity errors become the 'already applied' error."""
+    candidate = create_candidate()
+    position = create_position()
+    db_session.add_all([candidate, position])
+    await db_session.commit()
+    candidate_id, position_id = candidate.id, position.id
+
+    async def conflict(*args):
+        raise IntegrityError("INSERT INTO pipeline_position_stats", {}, Exception("conflict"))
+
+    monkeypatch.setattr(PipelineRepository, "add_applications", conflict)
+    with pytest.raises(IntegrityError):
+        await CandidatePositionRepository.add_position_to_candidate(
+            db_session, candidate_id, position_id
+        )
+    await db_session.rollback()
+    with pytest.raises(IntegrityError):
+        await CandidatePositionRepository.add_candidates_to_position(
+            db_session, position_id, [candidate_id]
+        )
@@ -1,15 +1,24 @@
 """API tests for candidates endpoints."""
 
+import csv
+import json
 import pytest
 from datetime import date
+from io import BytesIO
+
 from httpx import AsyncClient
+from openpyxl import Workbook, load_workbook
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import hash_password
-from app.models.candidate import CandidateStatus
+from app.models.candidate import Candidate, CandidateStatus
 from app.models.candidate_position import CandidatePosition
-from app.models.skill import SkillLevel
+from app.models.skill import Skill, SkillLevel
+from app.models.skill_catalog import SkillAlias, SkillCatalog
 from app.models.user import User, UserRole
+from app.repositories.skill_catalog import SkillCatalogRepository
+from app.services.skill_index import skill_index
 from tests.fixtures.factories import (
     create_candidate,
     create_document,
@@ -109,6 +118,23 @@ async def test_get_candidates_filter_by_status(
     assert data["candidates"][0]["name"] == "Hired"
 
 
+@pytest.mark.asyncio
+async def test_list_and_detail_read_stored_years_of_experience(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str
+):
+    """Test the list and detail endpoints return the stored years, not a recomputation."""
+    candidate = create_candidate(name="Stored", years_of_experience=7)
+    db_session.add(candidate)
+    await db_session.commit()
+
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    response = await client.get("/api/v1/candidates", headers=headers)
+    assert response.json()["candidates"][0]["yearsOfExperience"] == 7
+
+    response = await client.get(f"/api/v1/candidates/{candidate.id}", headers=headers)
+    assert response.json()["yearsOfExperience"] == 7
+
+
 @pytest.mark.asyncio
 async def test_search_candidates_by_name(
     client: AsyncClient, db_session: AsyncSession, auth_token: str
@@ -189,6 +215,79 @@ async def test_search_candidates_by_skill(
     assert data["candidates"][0]["name"] == "Python Dev"
 
 
+@pytest.mark.asyncio
+async def test_filter_candidates_by_skill_expression(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, monkeypatch
+):
+    """Test the skills filter expression, including after a candidate write."""
+    kubernetes = SkillCatalog(name="Kubernetes", normalized_name="kubernetes")
+    cloud = create_candidate(name="Cloud Dev")
+    backend = create_candidate(name="Backend Dev")
+    hired = create_candidate(name="Hired Dev", status=CandidateStatus.HIRED)
+    db_session.add_all([kubernetes, cloud, backend, hired])
+    await db_session.flush()
+    db_session.add_all([
+        SkillAlias(alias="kubernetes", skill_id=kubernetes.id),
+        SkillAlias(alias="k8s", skill_id=kubernetes.id),
+    ])
+    db_session.add_all([
+        create_skill(cloud.id, name="Python", level=SkillLevel.EXPERT),
+        create_skill(cloud.id, name="Kubernetes", level=SkillLevel.ADVANCED),
+        create_skill(cloud.id, name="GCP", level=SkillLevel.BEGINNER),
+        create_skill(backend.id, name="python", level=SkillLevel.BEGINNER),
+        create_skill(backend.id, name="Kubernetes", level=SkillLevel.ADVANCED),
+        create_skill(hired.id, name="Python", level=SkillLevel.EXPERT),
+        create_skill(hired.id, name="Kubernetes", level=SkillLevel.EXPERT),
+        create_skill(hired.id, name="AWS", level=SkillLevel.EXPERT),
+    ])
+    await db_session.commit()
+    await SkillCatalogRepository.canonicalize_skills(db_session)
+    skill_index.invalidate()
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    async def names(expression: str, status: str = "Active") -> list[str]:
+        response = await client.get(
+            "/api/v1/candidates",
+            params={"skills": expression, "status": status},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        return [c["name"] for c in response.json()["candidates"]]
+
+    assert await names("python AND kubernetes AND (aws OR gcp)") == ["Cloud Dev"]
+    assert await names("Python AND Kubernetes AND (AWS OR GCP)", "Hired") == ["Hired Dev"]
+    assert sorted(await names("kubernetes")) == ["Backend Dev", "Cloud Dev"]
+    assert sorted(await names("K8s")) == ["Backend Dev", "Cloud Dev"]
+    assert await names("python:advanced") == ["Cloud Dev"]
+    assert await names("cobol") == []
+
+    # Writes through the API update the index in place
+    response = await client.put(
+        f"/api/v1/candidates/{backend.id}",
+        headers=headers,
+        json=_candidate_payload(
+            name="Backend Dev",
+            email=backend.email,
+            skills=[{"name": "COBOL", "level": "Expert"}],
+        ),
+    )
+    assert response.status_code == 200
+    assert await names("cobol:expert") == ["Backend Dev"]
+    assert await names("kubernetes") == ["Cloud Dev"]
+
+    # Large matches are filtered against the skills table instead of by ID
+    monkeypatch.setattr("app.services.skill_index.MAX_INLINE_IDS", 0)
+    assert await names("python AND kubernetes AND (aws OR gcp)") == ["Cloud Dev"]
+    assert sorted(await names("K8s OR cobol:expert")) == ["Backend Dev", "Cloud Dev"]
+    assert await names("python:advanced") == ["Cloud Dev"]
+    assert await names("python AND unknown") == []
+
+    response = await client.get(
+        "/api/v1/candidates?skills=python AND (aws", headers=headers
+    )
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_filter_candidates_by_position(
     client: AsyncClient, db_session: AsyncSession, auth_token: str
@@ -310,6 +409,70 @@ async def test_get_candidate_by_id_not_found(client: AsyncClient, auth_token: st
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_get_candidates_batch(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str
+):
+    """Test batch get: request order, missing ids, and a query count independent of ids."""
+    candidates = [create_candidate(name=name) for name in ("Ann", "Bob", "Cat")]
+    db_session.add_all(candidates)
+    await db_session.flush()
+    position = create_position()
+    db_session.add(position)
+    await db_session.flush()
+    for candidate in candidates:
+        db_session.add_all(
+            [
+                create_experience(candidate.id),
+                create_education(candidate.id),
+                create_skill(candidate.id, name="Python"),
+                create_document(candidate.id),
+                CandidatePosition(candidate_id=candidate.id, position_id=position.id),
+            ]
+        )
+    await db_session.commit()
+    ann, bob, cat = (candidate.id for candidate in candidates)
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    statements = []
+
+    def count(*args):
+        statements.append(args[2])
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        response = await client.get(f"/api/v1/candidates/batch?ids={cat}", headers=headers)
+        single = len(statements)
+        statements.clear()
+        response = await client.get(
+            f"/api/v1/candidates/batch?ids={cat},missing, {ann},{cat},{bob}", headers=headers
+        )
+        assert len(statements) == single
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [c["id"] for c in data["candidates"]] == [cat, ann, bob]
+    assert data["missing"] == ["missing"]
+    first = data["candidates"][0]
+    assert first["name"] == "Cat"
+    assert len(first["experience"]) == 1
+    assert len(first["education"]) == 1
+    assert first["skills"][0]["name"] == "Python"
+    assert len(first["documents"]) == 1
+    assert first["appliedPositions"] == [position.id]
+
+    response = await client.get(
+        "/api/v1/candidates/batch?ids=" + ",".join(f"id-{i}" for i in range(101)),
+        headers=headers,
+    )
+    assert response.status_code == 400
+    response = await client.get("/api/v1/candidates/batch?ids=,", headers=headers)
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_candidate_response_matches_contract(
     client: AsyncClient, db_session: AsyncSession, auth_token: str
@@ -350,3 +513,372 @@ async def test_candidate_response_matches_contract(
     # Check skill structure
     assert data["skills"][0]["name"] == "Python"
     assert data["skills"][0]["level"] == "Expert"
+
+
+def _candidate_payload(**overrides) -> dict:
+    """Build a candidate write payload with one of each nested record."""
+    payload = {
+        "name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "phone": "+1-555-0100",
+        "location": "London, UK",
+        "summary": "Analytical engine programmer",
+        "status": "Active",
+        "sortOrder": 3,
+        "experience": [
+            {
+                "company": "Analytical Engines Ltd",
+                "title": "Programmer",
+                "startDate": "2015-01-01",
+                "endDate": "2020-01-01",
+                "description": "Wrote the first published algorithm",
+            }
+        ],
+        "education": [
+            {
+                "institution": "Home Tutoring",
+                "degree": "Private",
+                "field": "Mathematics",
+                "startDate": "2010-01-01",
+                "endDate": "2014-01-01",
+            }
+        ],
+        "skills": [
+            {"name": "Python", "level": "Expert"},
+            {"name": "Mathematics", "level": "Advanced"},
+        ],
+        "documents": [
+            {"type": "CV", "name": "ada.pdf", "url": "/storage/documents/ada.pdf"}
+        ],
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.mark.asyncio
+async def test_create_candidate_with_nested_data(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str
+):
+    """Test creating a candidate writes nested records and derived fields."""
+    response = await client.post(
+        "/api/v1/candidates",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        json=_candidate_payload(),
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["yearsOfExperience"] == 5
+    assert data["sortOrder"] == 3
+    assert [s["name"] for s in data["skills"]] == ["Python", "Mathematics"]
+    assert data["experience"][0]["company"] == "Analytical Engines Ltd"
+    assert data["education"][0]["field"] == "Mathematics"
+    assert data["documents"][0]["name"] == "ada.pdf"
+    assert data["appliedPositions"] == []
+
+    candidate = await db_session.get(Candidate, data["id"])
+    assert candidate.years_of_experience == 5
+    assert candidate.search_text == "ada lovelace ada@example.com python mathematics"
+
+    response = await client.get(
+        f"/api/v1/candidates/{data['id']}",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.json() == data
+
+
+@pytest.mark.asyncio
+async def test_create_candidate_duplicate_email(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str
+):
+    """Test creating a candidate with a taken email returns 409."""
+    db_session.add(create_candidate(email="ada@example.com"))
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/candidates",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        json=_candidate_payload(),
+    )
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_update_candidate_replaces_nested_data(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str
+):
+    """Test updating a candidate replaces nested records and derived fields."""
+    candidate = create_candidate(email="ada@example.com")
+    db_session.add(candidate)
+    await db_session.flush()
+    db_session.add_all([
+        create_skill(candidate.id, name="Cobol"),
+        create_experience(candidate.id),
+        create_document(candidate.id),
+    ])
+    await db_session.commit()
+
+    payload = _candidate_payload(
+        name="Ada King",
+        skills=[{"name": "Rust", "level": "Beginner"}],
+        documents=[],
+    )
+    response = await client.put(
+        f"/api/v1/candidates/{candidate.id}",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        json=payload,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Ada King"
+    assert data["skills"] == [{"name": "Rust", "level": "Beginner"}]
+    assert data["documents"] == []
+    assert len(data["experience"]) == 1
+    assert data["yearsOfExperience"] == 5
+
+    skills = await db_session.execute(
+        select(Skill.name).where(Skill.candidate_id == candidate.id)
+    )
+    assert skills.scalars().all() == ["Rust"]
+    search_text = await db_session.scalar(
+        select(Candidate.search_text).where(Candidate.id == candidate.id)
+    )
+    assert search_text == "ada king ada@example.com rust"
+
+
+@pytest.mark.asyncio
+async def test_update_candidate_not_found(client: AsyncClient, auth_token: str):
+    """Test updating a non-existent candidate returns 404."""
+    response = await client.put(
+        "/api/v1/candidates/00000000-0000-0000-0000-000000000000",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        json=_candidate_payload(),
+    )
+    assert response.status_code == 404
+
+
+@pytest.fixture
+async def admin_token(client: AsyncClient, db_session: AsyncSession) -> str:
+    """Create an admin user and return auth token."""
+    user = User(
+        email="admin@example.com",
+        hashed_password=hash_password("password123"),
+        full_name="Admin User",
+        role=UserRole.ADMIN,
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "admin@example.com", "password": "password123"},
+    )
+    return response.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_import_candidates_csv_upserts_on_email(
+    client: AsyncClient, db_session: AsyncSession, admin_token: str
+):
+    """Test that a CSV import inserts new rows, updates existing ones and reports bad rows."""
+    existing = create_candidate(email="ada@example.com", name="Old Name")
+    db_session.add(existing)
+    await db_session.flush()
+    db_session.add(create_skill(existing.id, name="Python"))
+    await db_session.commit()
+    existing_id = existing.id
+
+    csv_content = (
+        "name,email,phone,location,summary,status,sortOrder\n"
+        "Ada Lovelace,ada@example.com,555-0100,London,Programmer,Active,1\n"
+        "Grace Hopper,grace@example.com,555-0101,Arlington,Compilers,Hired,2\n"
+        "No Email,,555-0102,Nowhere,Missing email,Active,3\n"
+    )
+    response = await client.post(
+        "/api/v1/candidates/import",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        files={"file": ("candidates.csv", csv_content, "text/csv")},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["rowsRead"] == 3
+    assert data["imported"] == 2
+    assert data["invalid"] == 1
+    assert data["errors"][0]["row"] == 4
+    assert "email" in data["errors"][0]["message"]
+
+    result = await db_session.execute(
+        select(Candidate.id, Candidate.name, Candidate.search_text)
+        .where(Candidate.email == "ada@example.com")
+        .execution_options(populate_existing=True)
+    )
+    candidate_id, name, search_text = result.one()
+    assert candidate_id == existing_id
+    assert name == "Ada Lovelace"
+    assert search_text == "ada lovelace ada@example.com python"
+
+    grace = await db_session.scalar(
+        select(Candidate).where(Candidate.email == "grace@example.com")
+    )
+    assert grace.status == CandidateStatus.HIRED
+
+
+@pytest.mark.asyncio
+async def test_import_candidates_keeps_columns_missing_from_the_file(
+    client: AsyncClient, db_session: AsyncSession, admin_token: str
+):
+    """Test that an import only overwrites the columns a row fills in."""
+    hired = create_candidate(email="ada@example.com", status=CandidateStatus.HIRED, sort_order=7)
+    rejected = create_candidate(email="grace@example.com", status=CandidateStatus.REJECTED)
+    db_session.add_all([hired, rejected])
+    await db_session.commit()
+
+    csv_content = (
+        "name,email,phone,location,summary,status\n"
+        "Ada Lovelace,ada@example.com,555-0100,London,Programmer,\n"
+        "Grace Hopper,grace@example.com,555-0101,Arlington,Compilers,Active\n"
+        "Alan Turing,alan@example.com,555-0102,Bletchley,Codebreaker,\n"
+    )
+    response = await client.post(
+        "/api/v1/candidates/import",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        files={"file": ("candidates.csv", csv_content, "text/csv")},
+    )
+    assert response.status_code == 200
+    assert response.json()["imported"] == 3
+
+    result = await db_session.execute(
+        select(Candidate.email, Candidate.name, Candidate.status, Candidate.sort_order)
+        .execution_options(populate_existing=True)
+    )
+    rows = {email: (name, status, sort_order) for email, name, status, sort_order in result}
+    assert rows["ada@example.com"] == ("Ada Lovelace", CandidateStatus.HIRED, 7)
+    assert rows["grace@example.com"][1] == CandidateStatus.ACTIVE
+    assert rows["alan@example.com"] == ("Alan Turing", CandidateStatus.ACTIVE, 0)
+
+
+@pytest.mark.asyncio
+async def test_import_candidates_xlsx(
+    client: AsyncClient, db_session: AsyncSession, admin_token: str
+):
+    """Test importing candidates from an Excel workbook."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["name", "email", "phone", "location", "summary", "sortOrder"])
+    sheet.append(["Alan Turing", "alan@example.com", 5550103, "Bletchley", "Codebreaker", 4])
+    buffer = BytesIO()
+    workbook.save(buffer)
+
+    response = await client.post(
+        "/api/v1/candidates/import",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        files={"file": ("candidates.xlsx", buffer.getvalue())},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["imported"] == 1
+    alan = await db_session.scalar(
+        select(Candidate).where(Candidate.email == "alan@example.com")
+    )
+    assert alan.phone == "5550103"
+    assert alan.sort_order == 4
+
+
+@pytest.mark.asyncio
+async def test_import_candidates_rejects_unknown_format(
+    client: AsyncClient, admin_token: str
+):
+    """Test that unsupported file types return 400."""
+    response = await client.post(
+        "/api/v1/candidates/import",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        files={"file": ("candidates.txt", b"name,email\n")},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_candidates_requires_admin(client: AsyncClient, auth_token: str):
+    """Test that editors cannot run imports."""
+    response = await client.post(
+        "/api/v1/candidates/import",
+        headers={"Authorization": f"Bearer {auth_token}"},
+        files={"file": ("candidates.csv", b"name,email\n")},
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_candidates_csv(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str
+):
+    """Test CSV export applies the list filters and folds skills per candidate."""
+    ada = create_candidate(name="Ada", sort_order=1)
+    grace = create_candidate(name="Grace", sort_order=2)
+    hired = create_candidate(name="Hired", status=CandidateStatus.HIRED)
+    db_session.add_all([ada, grace, hired])
+    await db_session.flush()
+    db_session.add_all([
+        create_skill(ada.id, name="Python", level=SkillLevel.EXPERT),
+        create_skill(ada.id, name="Go", level=SkillLevel.BEGINNER),
+    ])
+    await db_session.commit()
+
+    response = await client.get(
+        "/api/v1/candidates/export?format=csv",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(response.text.splitlines()))
+    assert [row["name"] for row in rows] == ["Ada", "Grace"]
+    assert sorted(rows[0]["skills"].split("; ")) == ["Go (Beginner)", "Python (Expert)"]
+    assert rows[1]["skills"] == ""
+    assert rows[0]["status"] == "Active"
+
+    await SkillCatalogRepository.canonicalize_skills(db_session)
+    skill_index.invalidate()
+    response = await client.get(
+        "/api/v1/candidates/export?format=csv&skills=python AND go",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert [row["name"] for row in csv.DictReader(response.text.splitlines())] == ["Ada"]
+
+    response = await client.get(
+        "/api/v1/candidates/export?skills=(python",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_export_candidates_ndjson_and_xlsx(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str
+):
+    """Test NDJSON and XLSX exports contain every matching candidate."""
+    candidate = create_candidate(name="Ada", years_of_experience=7)
+    db_session.add(candidate)
+    await db_session.flush()
+    db_session.add(create_skill(candidate.id, name="Python", level=SkillLevel.EXPERT))
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    response = await client.get("/api/v1/candidates/export?format=ndjson", headers=headers)
+    assert response.status_code == 200
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert len(records) == 1
+    assert records[0]["id"] == candidate.id
+    assert records[0]["yearsOfExperience"] == 7
+    assert records[0]["skills"] == [{"name": "Python", "level": "Expert"}]
+
+    response = await client.get("/api/v1/candidates/export?format=xlsx", headers=headers)
+    assert response.status_code == 200
+    sheet = load_workbook(BytesIO(response.content), read_only=True).active
+    rows = list(sheet.iter_rows(values_only=True))
+    assert rows[0][:3] == ("id", "name", "email")
+    assert rows[1][1] == "Ada"
+    assert rows[1][-1] == "Python (Expert)"
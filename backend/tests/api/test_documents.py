@@ -0,0 +1,556 @@
+"""API tests for candidate documents."""
+
+import hashlib
+import io
+import zipfile
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.security import hash_password
+from app.models.blob import Blob
+from app.models.candidate_position import CandidatePosition
+from app.models.document import Document, DocumentType
+from app.models.document_text import DocumentText, ExtractionStatus
+from app.models.preview import Preview, PreviewKind
+from app.models.user import User, UserRole
+from app.services.document_storage import DocumentStorageService
+from tests.fixtures.factories import create_candidate, create_document, create_position
+from tests.fixtures.files import minimal_pdf
+
+
+@pytest.fixture
+async def auth_token(client: AsyncClient, db_session: AsyncSession) -> str:
+    """Create an editor and return auth token."""
+    user = User(
+        email="editor@example.com",
+        hashed_password=hash_password("password123"),
+        full_name="Editor",
+        role=UserRole.EDITOR,
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "editor@example.com", "password": "password123"},
+    )
+    return response.json()["access_token"]
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """Point STORAGE_PATH at a temporary directory."""
+    monkeypatch.setattr(settings, "STORAGE_PATH", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+async def candidate(db_session: AsyncSession):
+    """A candidate to attach documents to."""
+    candidate = create_candidate(email="docs@example.com")
+    db_session.add(candidate)
+    await db_session.commit()
+    return candidate
+
+
+@pytest.mark.asyncio
+async def test_upload_document_streams_to_storage(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, storage, candidate
+):
+    """The file lands in STORAGE_PATH with its checksum and a document row."""
+    content = b"%PDF-1.4\n" + bytes(range(256)) * 4096
+
+    response = await client.post(
+        f"/api/v1/candidates/{candidate.id}/documents",
+        files={"file": ("Jane Doe CV.pdf", content, "application/pdf")},
+        data={"type": "Cover Letter", "name": "Cover letter"},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["candidateId"] == candidate.id
+    assert data["type"] == "Cover Letter"
+    assert data["name"] == "Cover letter"
+    assert data["contentType"] == "application/pdf"
+    assert data["size"] == len(content)
+    assert data["checksum"] == hashlib.sha256(content).hexdigest()
+    assert data["url"] == f"/api/v1/documents/{data['id']}/content"
+
+    checksum = data["checksum"]
+    files = [f for f in storage.rglob("*") if f.is_file()]
+    assert files == [storage / checksum[:2] / checksum[2:4] / checksum]
+    assert files[0].read_bytes() == content
+
+    document = (
+        await db_session.execute(select(Document).where(Document.id == data["id"]))
+    ).scalar_one()
+    assert document.type == DocumentType.COVER_LETTER
+    assert document.storage_key == f"{checksum[:2]}/{checksum[2:4]}/{checksum}"
+
+
+@pytest.mark.asyncio
+async def test_upload_document_defaults_to_cv_and_file_name(
+    client: AsyncClient, auth_token: str, storage, candidate
+):
+    """Without form fields the document is a CV named after the file."""
+    response = await client.post(
+        f"/api/v1/candidates/{candidate.id}/documents",
+        files={"file": ("resume.docx", b"hello", "application/octet-stream")},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 201
+    assert response.json()["type"] == "CV"
+    assert response.json()["name"] == "resume.docx"
+
+
+@pytest.mark.asyncio
+async def test_upload_document_errors_leave_no_files(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, storage, candidate, monkeypatch
+):
+    """Rejected uploads clean up after themselves."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    response = await client.post(
+        "/api/v1/candidates/nonexistent-id/documents",
+        files={"file": ("cv.pdf", b"x", "application/pdf")},
+        headers=headers,
+    )
+    assert response.status_code == 404
+
+    response = await client.post(
+        f"/api/v1/candidates/{candidate.id}/documents",
+        files={"file": ("cv.pdf", b"x", "application/pdf")},
+        data={"type": "Passport"},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+    response = await client.post(
+        f"/api/v1/candidates/{candidate.id}/documents",
+        data={"type": "CV"},
+        files={"other": ("cv.pdf", b"x", "application/pdf")},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE_MB", 1)
+    response = await client.post(
+        f"/api/v1/candidates/{candidate.id}/documents",
+        files={"file": ("big.pdf", b"x" * (2 * 1024 * 1024), "application/pdf")},
+        headers=headers,
+    )
+    assert response.status_code == 413
+
+    assert list(storage.iterdir()) == []
+    assert (await db_session.execute(select(Document))).scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_upload_document_requires_editor(
+    client: AsyncClient, db_session: AsyncSession, storage, candidate
+):
+    """Read-only users cannot upload."""
+    db_session.add(
+        User(
+            email="reader@example.com",
+            hashed_password=hash_password("password123"),
+            full_name="Reader",
+            role=UserRole.READ_ONLY,
+            is_active=True,
+        )
+    )
+    await db_session.commit()
+    token = (
+        await client.post(
+            "/api/v1/auth/login",
+            data={"username": "reader@example.com", "password": "password123"},
+        )
+    ).json()["access_token"]
+
+    response = await client.post(
+        f"/api/v1/candidates/{candidate.id}/documents",
+        files={"file": ("cv.pdf", b"x", "application/pdf")},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 403
+
+
+async def _upload(client: AsyncClient, candidate_id: str, token: str, content: bytes) -> dict:
+    """Upload a PDF and return the response body."""
+    response = await client.post(
+        f"/api/v1/candidates/{candidate_id}/documents",
+        files={"file": ("cv.pdf", content, "application/pdf")},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+async def _blob(db_session: AsyncSession, checksum: str) -> Blob | None:
+    db_session.expire_all()
+    return (
+        await db_session.execute(select(Blob).where(Blob.sha256 == checksum))
+    ).scalar_one_or_none()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_uploads_share_one_blob(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, storage, candidate
+):
+    """Identical content is stored once and reference-counted."""
+    content = b"%PDF-1.4 same bytes"
+    first = await _upload(client, candidate.id, auth_token, content)
+    second = await _upload(client, candidate.id, auth_token, content)
+
+    assert first["id"] != second["id"]
+    assert first["checksum"] == second["checksum"]
+    files = [f for f in storage.rglob("*") if f.is_file()]
+    assert len(files) == 1
+    assert (await _blob(db_session, first["checksum"])).ref_count == 2
+
+    response = await client.get(second["url"], headers={"Authorization": f"Bearer {auth_token}"})
+    assert response.content == content
+
+
+@pytest.mark.asyncio
+async def test_delete_document_and_collect_garbage(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, storage, candidate
+):
+    """Deleting releases the blob; GC removes it once nothing references it."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    first = await _upload(client, candidate.id, auth_token, b"shared")
+    second = await _upload(client, candidate.id, auth_token, b"shared")
+    path = DocumentStorageService.path_for(
+        DocumentStorageService.storage_key_for(first["checksum"])
+    )
+
+    response = await client.delete(f"/api/v1/documents/{first['id']}", headers=headers)
+    assert response.status_code == 200
+    assert (await _blob(db_session, first["checksum"])).ref_count == 1
+    assert await DocumentStorageService.collect_garbage(db_session) == (0, 0)
+    assert path.exists()
+
+    response = await client.delete(f"/api/v1/documents/{second['id']}", headers=headers)
+    assert response.status_code == 200
+    assert (await _blob(db_session, first["checksum"])).ref_count == 0
+    assert await DocumentStorageService.collect_garbage(db_session, batch_size=1) == (1, 6)
+    assert not path.exists()
+    assert await _blob(db_session, first["checksum"]) is None
+
+    response = await client.delete(f"/api/v1/documents/{second['id']}", headers=headers)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_sweep_orphans_removes_stale_files(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, storage, candidate
+):
+    """Files without a blob row and abandoned temp files are swept once old enough."""
+    kept = await _upload(client, candidate.id, auth_token, b"referenced")
+    orphan = storage / "ab" / "cd" / ("abcd" + "0" * 60)
+    orphan.parent.mkdir(parents=True)
+    orphan.write_bytes(b"orphan")
+    (storage / ".upload-abandoned").write_bytes(b"partial")
+
+    assert await DocumentStorageService.sweep_orphans(db_session) == (0, 0)
+    assert await DocumentStorageService.sweep_orphans(db_session, min_age_seconds=-60) == (2, 13)
+
+    assert not orphan.exists()
+    assert not (storage / ".upload-abandoned").exists()
+    assert DocumentStorageService.path_for(
+        DocumentStorageService.storage_key_for(kept["checksum"])
+    ).exists()
+
+
+@pytest.mark.asyncio
+async def test_update_candidate_keeps_uploaded_documents(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, storage, candidate
+):
+    """Replacing a candidate's documents list leaves uploaded files attached."""
+    uploaded = await _upload(client, candidate.id, auth_token, b"%PDF-1.4 keep")
+
+    response = await client.put(
+        f"/api/v1/candidates/{candidate.id}",
+        json={
+            "name": candidate.name,
+            "email": candidate.email,
+            "phone": candidate.phone,
+            "location": candidate.location,
+            "summary": candidate.summary,
+            "documents": [{"type": "CV", "name": "Linked CV", "url": "https://example.com/cv"}],
+        },
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    names = sorted(d["name"] for d in response.json()["documents"])
+    assert names == ["Linked CV", "cv.pdf"]
+    db_session.expire_all()
+    ids = (await db_session.execute(select(Document.id))).scalars().all()
+    assert uploaded["id"] in ids
+
+
+@pytest.mark.asyncio
+async def test_download_document_content_with_etag(
+    client: AsyncClient, auth_token: str, storage, candidate
+):
+    """The whole file is served with the checksum as ETag; a match is a 304."""
+    content = b"%PDF-1.4 " + b"x" * 100_000
+    document = await _upload(client, candidate.id, auth_token, content)
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    response = await client.get(document["url"], headers=headers)
+
+    assert response.status_code == 200
+    assert response.content == content
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["content-length"] == str(len(content))
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"] == f'"{document["checksum"]}"'
+    assert response.headers["content-disposition"] == 'inline; filename="cv.pdf"'
+
+    response = await client.get(
+        document["url"], headers={**headers, "If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_download_document_content_ranges(
+    client: AsyncClient, auth_token: str, storage, candidate
+):
+    """Single byte ranges are served as 206; out-of-bounds ranges as 416."""
+    content = bytes(range(256)) * 1000
+    document = await _upload(client, candidate.id, auth_token, content)
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    response = await client.get(document["url"], headers={**headers, "Range": "bytes=100-199"})
+    assert response.status_code == 206
+    assert response.content == content[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{len(content)}"
+    assert response.headers["content-length"] == "100"
+
+    response = await client.get(document["url"], headers={**headers, "Range": "bytes=-10"})
+    assert response.status_code == 206
+    assert response.content == content[-10:]
+
+    response = await client.get(document["url"], headers={**headers, "Range": "bytes=250000-"})
+    assert response.status_code == 206
+    assert response.content == content[250000:]
+
+    response = await client.get(
+        document["url"], headers={**headers, "Range": f"bytes={len(content)}-"}
+    )
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(content)}"
+
+    # A stale If-Range gets the whole, current file
+    response = await client.get(
+        document["url"],
+        headers={**headers, "Range": "bytes=0-9", "If-Range": '"stale"'},
+    )
+    assert response.status_code == 200
+    assert response.content == content
+
+
+@pytest.mark.asyncio
+async def test_download_document_content_not_found(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, storage, candidate
+):
+    """Unknown documents and documents without stored files are 404."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    linked = create_document(candidate.id, url="https://example.com/cv.pdf")
+    db_session.add(linked)
+    await db_session.commit()
+
+    response = await client.get("/api/v1/documents/nonexistent-id/content", headers=headers)
+    assert response.status_code == 404
+
+    response = await client.get(f"/api/v1/documents/{linked.id}/content", headers=headers)
+    assert response.status_code == 404
+
+
+async def _upload_named(
+    client: AsyncClient, candidate_id: str, token: str, filename: str, content: bytes
+) -> dict:
+    response = await client.post(
+        f"/api/v1/candidates/{candidate_id}/documents",
+        files={"file": (filename, content, "application/pdf")},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_download_candidate_documents_zip(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, storage, candidate
+):
+    """Every stored file is in the archive, with clashing names numbered."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    large = bytes(range(256)) * 1024
+    await _upload_named(client, candidate.id, auth_token, "cv.pdf", large)
+    await _upload_named(client, candidate.id, auth_token, "cv.pdf", b"second")
+    response = await client.post(
+        f"/api/v1/candidates/{candidate.id}/documents",
+        files={"file": ("letter.pdf", b"letter", "application/pdf")},
+        data={"name": "../letter.pdf"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    db_session.add(create_document(candidate.id, name="linked.pdf"))
+    await db_session.commit()
+
+    response = await client.get(f"/api/v1/candidates/{candidate.id}/documents.zip", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.testzip() is None
+    assert archive.namelist() == ["cv.pdf", "cv (2).pdf", "_letter.pdf"]
+    assert archive.read("cv.pdf") == large
+    assert archive.read("cv (2).pdf") == b"second"
+
+    response = await client.get("/api/v1/candidates/nonexistent-id/documents.zip", headers=headers)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_download_position_documents_zip(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, storage, candidate
+):
+    """Linked candidates get a folder each; unlinked candidates are left out."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    position = create_position()
+    namesake = create_candidate(email="namesake@example.com", name=candidate.name)
+    outsider = create_candidate(email="outsider@example.com", name="Outsider")
+    db_session.add_all([position, namesake, outsider])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            CandidatePosition(candidate_id=candidate.id, position_id=position.id),
+            CandidatePosition(candidate_id=namesake.id, position_id=position.id),
+        ]
+    )
+    await db_session.commit()
+    for owner in (candidate, namesake, outsider):
+        await _upload_named(client, owner.id, auth_token, "cv.pdf", owner.email.encode())
+
+    response = await client.get(f"/api/v1/positions/{position.id}/documents.zip", headers=headers)
+
+    assert response.status_code == 200
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    names = archive.namelist()
+    assert sorted(names) == [f"{candidate.name} (2)/cv.pdf", f"{candidate.name}/cv.pdf"]
+    assert sorted(archive.read(name) for name in names) == [
+        b"docs@example.com",
+        b"namesake@example.com",
+    ]
+
+    response = await client.get("/api/v1/positions/nonexistent-id/documents.zip", headers=headers)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_document_preview_generated_on_first_request(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, storage, candidate
+):
+    """A PDF's first page is rendered once, next to its blob, and cached for long."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    document = await _upload(client, candidate.id, auth_token, minimal_pdf("Preview me"))
+    assert document["previewUrl"] == f"/api/v1/documents/{document['id']}/preview"
+
+    response = await client.get(document["previewUrl"], headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.content.startswith(b"\x89PNG")
+    assert "max-age=31536000" in response.headers["cache-control"]
+    checksum = document["checksum"]
+    assert (storage / checksum[:2] / checksum[2:4] / f"{checksum}.preview.png").exists()
+    preview = await db_session.get(Preview, checksum)
+    assert preview.kind == PreviewKind.IMAGE
+    assert preview.size == len(response.content)
+
+    response = await client.get(
+        document["previewUrl"], headers={**headers, "If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
+
+    detail = (await client.get(f"/api/v1/candidates/{candidate.id}", headers=headers)).json()
+    assert detail["documents"][0]["previewUrl"] == document["previewUrl"]
+
+
+@pytest.mark.asyncio
+async def test_document_preview_text_and_unavailable(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, storage, candidate
+):
+    """Text files get a snippet; other formats and linked documents have no preview."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    response = await client.post(
+        f"/api/v1/candidates/{candidate.id}/documents",
+        files={"file": ("notes.txt", b"Kubernetes, Terraform", "text/plain")},
+        headers=headers,
+    )
+    response = await client.get(response.json()["previewUrl"], headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert response.text == "Kubernetes, Terraform"
+
+    response = await client.post(
+        f"/api/v1/candidates/{candidate.id}/documents",
+        files={"file": ("archive.zip", b"PK\x03\x04", "application/zip")},
+        headers=headers,
+    )
+    response = await client.get(response.json()["previewUrl"], headers=headers)
+    assert response.status_code == 404
+
+    linked = create_document(candidate.id, url="https://example.com/cv.pdf")
+    db_session.add(linked)
+    await db_session.commit()
+    response = await client.get(f"/api/v1/documents/{linked.id}/preview", headers=headers)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_search_candidates_by_document_text(
+    client: AsyncClient, db_session: AsyncSession, auth_token: str, candidate
+):
+    """Extracted document text is matched by the list search only when asked for."""
+    document = create_document(candidate.id, storage_key="cv.pdf")
+    db_session.add(document)
+    await db_session.flush()
+    db_session.add(
+        DocumentText(
+            document_id=document.id,
+            candidate_id=candidate.id,
+            status=ExtractionStatus.EXTRACTED,
+            content="Led the Kubernetes migration",
+        )
+    )
+    await db_session.commit()
+
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    response = await client.get(
+        "/api/v1/candidates", params={"search": "kubernetes"}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json()["candidates"] == []
+
+    response = await client.get(
+        "/api/v1/candidates",
+        params={"search": "kubernetes", "searchDocuments": "true"},
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json()["candidates"]] == [candidate.id]
@@ -0,0 +1,130 @@
+"""API tests for background jobs endpoints."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.security import hash_password
+from app.models.job import Job, JobStatus
+from app.models.user import User, UserRole
+from app.services.jobs import job_runner
+
+
+async def _login(client: AsyncClient, db_session: AsyncSession, email: str, role: UserRole) -> str:
+    """Create a user with the given role and return an auth token."""
+    db_session.add(
+        User(
+            email=email,
+            hashed_password=hash_password("password123"),
+            full_name="Job User",
+            role=role,
+            is_active=True,
+        )
+    )
+    await db_session.commit()
+    response = await client.post(
+        "/api/v1/auth/login", data={"username": email, "password": "password123"}
+    )
+    return response.json()["access_token"]
+
+
+@pytest.fixture
+async def admin_token(client: AsyncClient, db_session: AsyncSession) -> str:
+    """Create an admin user and return auth token."""
+    return await _login(client, db_session, "admin@example.com", UserRole.ADMIN)
+
+
+@pytest.fixture
+async def editor_token(client: AsyncClient, db_session: AsyncSession) -> str:
+    """Create an editor user and return auth token."""
+    return await _login(client, db_session, "editor@example.com", UserRole.EDITOR)
+
+
+@pytest.fixture
+async def workers(db_session: AsyncSession):
+    """Run the app's job runner against the test database."""
+    original = job_runner.session_factory
+    job_runner.session_factory = async_sessionmaker(
+        db_session.bind, class_=AsyncSession, expire_on_commit=False
+    )
+    await job_runner.start()
+    yield job_runner
+    await job_runner.stop()
+    job_runner.session_factory = original
+
+
+@pytest.mark.asyncio
+async def test_background_import_reports_result(
+    client: AsyncClient, admin_token: str, workers
+):
+    """Test that a queued import runs off the request path and is pollable."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    csv_content = (
+        "name,email,phone,location,summary\n"
+        "Ada Lovelace,ada@example.com,555-0100,London,Programmer\n"
+        "Grace Hopper,grace@example.com,555-0101,Arlington,Compilers\n"
+    )
+
+    response = await client.post(
+        "/api/v1/candidates/import/jobs",
+        headers=headers,
+        files={"file": ("candidates.csv", csv_content, "text/csv")},
+    )
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert job["type"] == "candidate_import"
+
+    await workers.wait_idle()
+
+    response = await client.get(f"/api/v1/jobs/{job['id']}", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "succeeded"
+    assert data["processed"] == 2
+    assert data["result"]["imported"] == 2
+    assert data["finishedAt"] is not None
+
+
+@pytest.mark.asyncio
+async def test_background_import_rejects_unknown_format(
+    client: AsyncClient, admin_token: str
+):
+    """Test that unsupported files are rejected before a job is queued."""
+    response = await client.post(
+        "/api/v1/candidates/import/jobs",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        files={"file": ("candidates.txt", b"name,email\n")},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_job_hidden_from_other_users(
+    client: AsyncClient, db_session: AsyncSession, admin_token: str, editor_token: str
+):
+    """Test that jobs are only visible to their creator and admins."""
+    job = Job(type="candidate_import", status=JobStatus.QUEUED, params={})
+    db_session.add(job)
+    await db_session.commit()
+
+    response = await client.get(
+        f"/api/v1/jobs/{job.id}", headers={"Authorization": f"Bearer {editor_token}"}
+    )
+    assert response.status_code == 404
+
+    response = await client.get(
+        f"/api/v1/jobs/{job.id}", headers={"Authorization": f"Bearer {admin_token}"}
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "queued"
+
+
+@pytest.mark.asyncio
+async def test_get_job_not_found(client: AsyncClient, admin_token: str):
+    """Test getting a non-existent job returns 404."""
+    response = await client.get(
+        "/api/v1/jobs/00000000-0000-0000-0000-000000000000",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert response.status_code == 404
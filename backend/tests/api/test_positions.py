@@ -3,16 +3,24 @@
 import pytest
 from datetime import date
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import hash_password
+from app.models.candidate import CandidateStatus
 from app.models.candidate_position import CandidatePosition
 from app.models.position import PositionStatus
+from app.models.position_skill import PositionSkill
+from app.models.skill import SkillLevel
 from app.models.user import User, UserRole
+from app.repositories.position_score import PositionScoreRepository
+from app.repositories.skill_catalog import SkillCatalogRepository
+from app.services.matching import matching_service
 from tests.fixtures.factories import (
     create_candidate,
     create_position,
     create_position_skill,
+    create_skill,
 )
 
 
@@ -267,6 +275,52 @@ async def test_update_position_success(
     assert "JavaScript" in data["requiredSkills"]
 
 
+@pytest.mark.asyncio
+async def test_update_position_reconciles_skills_by_diff(
+    client: AsyncClient, db_session: AsyncSession, editor_token: str
+):
+    """Test that unchanged skills keep their rows and only the diff is written."""
+    position = create_position()
+    db_session.add(position)
+    await db_session.flush()
+
+    kept = create_position_skill(position.id, name="Python")
+    dropped = create_position_skill(position.id, name="React")
+    db_session.add_all([kept, dropped])
+    await db_session.commit()
+    kept_id = kept.id
+
+    update_data = {
+        "title": position.title,
+        "department": position.department,
+        "location": position.location,
+        "description": position.description,
+        "requirements": position.requirements,
+        "minExperienceYears": position.min_experience_years,
+        "status": "Open",
+        "postedDate": "2024-01-01",
+        "requiredSkills": ["Go", "Python", "Go"],
+    }
+
+    response = await client.put(
+        f"/api/v1/positions/{position.id}",
+        headers={"Authorization": f"Bearer {editor_token}"},
+        json=update_data,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["requiredSkills"] == ["Go", "Python"]
+
+    result = await db_session.execute(
+        select(PositionSkill.id, PositionSkill.name).where(
+            PositionSkill.position_id == position.id
+        )
+    )
+    rows = {name: skill_id for skill_id, name in result}
+    assert set(rows) == {"Go", "Python"}
+    assert rows["Python"] == kept_id
+
+
 @pytest.mark.asyncio
 async def test_update_position_not_found(client: AsyncClient, editor_token: str):
     """Test updating non-existent position returns 404."""
@@ -308,6 +362,97 @@ async def test_update_position_validates_data(
     assert response.status_code == 422
 
 
+@pytest.mark.asyncio
+async def test_patch_position_with_matching_etag(
+    client: AsyncClient, db_session: AsyncSession, editor_token: str
+):
+    """Test that PATCH applies only the sent fields when If-Match is current."""
+    position = create_position(title="Backend Engineer")
+    db_session.add(position)
+    await db_session.flush()
+    db_session.add(create_position_skill(position.id, name="Python"))
+    await db_session.commit()
+
+    headers = {"Authorization": f"Bearer {editor_token}"}
+    response = await client.get(f"/api/v1/positions/{position.id}", headers=headers)
+    etag = response.headers["ETag"]
+
+    response = await client.patch(
+        f"/api/v1/positions/{position.id}",
+        headers={**headers, "If-Match": etag},
+        json={"title": "Staff Backend Engineer"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["title"] == "Staff Backend Engineer"
+    assert data["department"] == position.department
+    assert data["requiredSkills"] == ["Python"]
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_patch_position_stale_etag_returns_412(
+    client: AsyncClient, db_session: AsyncSession, editor_token: str
+):
+    """Test that a PATCH based on an outdated read is rejected."""
+    position = create_position()
+    db_session.add(position)
+    await db_session.commit()
+
+    headers = {"Authorization": f"Bearer {editor_token}"}
+    response = await client.get(f"/api/v1/positions/{position.id}", headers=headers)
+    etag = response.headers["ETag"]
+
+    first = await client.patch(
+        f"/api/v1/positions/{position.id}",
+        headers={**headers, "If-Match": etag},
+        json={"requiredSkills": ["Go"]},
+    )
+    assert first.status_code == 200
+
+    second = await client.patch(
+        f"/api/v1/positions/{position.id}",
+        headers={**headers, "If-Match": etag},
+        json={"title": "Lost Update"},
+    )
+    assert second.status_code == 412
+
+
+@pytest.mark.asyncio
+async def test_patch_position_requires_if_match(
+    client: AsyncClient, db_session: AsyncSession, editor_token: str
+):
+    """Test that PATCH without If-Match returns 428."""
+    position = create_position()
+    db_session.add(position)
+    await db_session.commit()
+
+    response = await client.patch(
+        f"/api/v1/positions/{position.id}",
+        headers={"Authorization": f"Bearer {editor_token}"},
+        json={"title": "No Precondition"},
+    )
+    assert response.status_code == 428
+
+
+@pytest.mark.asyncio
+async def test_patch_position_rejects_null(
+    client: AsyncClient, db_session: AsyncSession, editor_token: str
+):
+    """Test that PATCH cannot null out a required field."""
+    position = create_position()
+    db_session.add(position)
+    await db_session.commit()
+
+    response = await client.patch(
+        f"/api/v1/positions/{position.id}",
+        headers={"Authorization": f"Bearer {editor_token}", "If-Match": "*"},
+        json={"title": None},
+    )
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_position_response_matches_contract(
     client: AsyncClient, db_session: AsyncSession, read_only_token: str
@@ -342,3 +487,119 @@ async def test_position_response_matches_contract(
     assert "postedDate" in data
     assert "candidates" in data  # Array of candidate IDs
     assert "sortOrder" in data
+
+
+@pytest.mark.asyncio
+async def test_get_position_matches(
+    client: AsyncClient, db_session: AsyncSession, read_only_token: str
+):
+    """Active candidates are ranked by required skill levels and experience."""
+    position = create_position(min_experience_years=4)
+    db_session.add(position)
+    await db_session.flush()
+    db_session.add_all(
+        [
+            create_position_skill(position.id, name="Python"),
+            create_position_skill(position.id, name="SQL"),
+        ]
+    )
+    strong = create_candidate(name="Strong", years_of_experience=8)
+    partial = create_candidate(name="Partial", years_of_experience=2)
+    hired = create_candidate(name="Hired", status=CandidateStatus.HIRED, years_of_experience=9)
+    db_session.add_all([strong, partial, hired])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            create_skill(strong.id, name="python", level=SkillLevel.EXPERT),
+            create_skill(strong.id, name="SQL", level=SkillLevel.ADVANCED),
+            create_skill(partial.id, name="Python", level=SkillLevel.BEGINNER),
+            create_skill(hired.id, name="Python", level=SkillLevel.EXPERT),
+        ]
+    )
+    await db_session.commit()
+    await SkillCatalogRepository.canonicalize_skills(db_session)
+    matching_service.invalidate()
+
+    response = await client.get(
+        f"/api/v1/positions/{position.id}/matches?limit=5",
+        headers={"Authorization": f"Bearer {read_only_token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["positionId"] == position.id
+    assert data["scored"] == 2
+    assert [m["candidateId"] for m in data["matches"]] == [strong.id, partial.id]
+    assert data["matches"][0]["matchedSkills"] == ["Python", "SQL"]
+    assert data["matches"][1]["missingSkills"] == ["SQL"]
+    assert data["matches"][1]["experienceScore"] == 0.5
+
+    response = await client.get(
+        "/api/v1/positions/missing/matches",
+        headers={"Authorization": f"Bearer {read_only_token}"},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_position_includes_stored_top_candidates(
+    client: AsyncClient, db_session: AsyncSession, editor_token: str
+):
+    """Top candidates come from the stored scores, which position edits keep current."""
+    position = create_position(min_experience_years=4)
+    db_session.add(position)
+    await db_session.flush()
+    db_session.add_all(
+        [
+            create_position_skill(position.id, name="Python"),
+            create_position_skill(position.id, name="SQL"),
+        ]
+    )
+    strong = create_candidate(name="Strong", years_of_experience=8)
+    partial = create_candidate(name="Partial", years_of_experience=2)
+    db_session.add_all([strong, partial])
+    await db_session.flush()
+    db_session.add_all(
+        [
+            create_skill(strong.id, name="Python", level=SkillLevel.EXPERT),
+            create_skill(strong.id, name="SQL", level=SkillLevel.ADVANCED),
+            create_skill(partial.id, name="Python", level=SkillLevel.BEGINNER),
+        ]
+    )
+    await db_session.commit()
+    await SkillCatalogRepository.canonicalize_skills(db_session)
+    await PositionScoreRepository.rebuild(db_session)
+    headers = {"Authorization": f"Bearer {editor_token}"}
+
+    response = await client.get(f"/api/v1/positions/{position.id}", headers=headers)
+    assert response.status_code == 200
+    top = response.json()["topCandidates"]
+    assert [c["candidateId"] for c in top] == [strong.id, partial.id]
+    assert top[0]["score"] == 0.9
+    assert top[1]["experienceScore"] == 0.5
+
+    response = await client.get(f"/api/v1/positions/{position.id}?top=1", headers=headers)
+    assert [c["candidateId"] for c in response.json()["topCandidates"]] == [strong.id]
+
+    # Dropping Python leaves only the SQL holder ranked
+    etag = response.headers["ETag"]
+    response = await client.patch(
+        f"/api/v1/positions/{position.id}",
+        headers={**headers, "If-Match": etag},
+        json={"requiredSkills": ["SQL"]},
+    )
+    assert response.status_code == 200
+    response = await client.get(f"/api/v1/positions/{position.id}", headers=headers)
+    top = response.json()["topCandidates"]
+    assert [c["candidateId"] for c in top] == [strong.id]
+    assert top[0]["skillScore"] == 0.75
+
+    # Closed positions keep no ranking
+    response = await client.patch(
+        f"/api/v1/positions/{position.id}",
+        headers={**headers, "If-Match": response.headers["ETag"]},
+        json={"status": "Closed"},
+    )
+    assert response.status_code == 200
+    response = await client.get(f"/api/v1/positions/{position.id}", headers=headers)
+    assert response.json()["topCandidates"] == []
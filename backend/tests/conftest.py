@@ -1,22 +1,27 @@
 import asyncio
+import os
 from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.config import settings
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import create_engine, get_db
 from app.main import app
 
-# Test database URL (use separate test database)
-TEST_DATABASE_URL = settings.DATABASE_URL.replace("/hellio_hr", "/hellio_hr_test")
+# Test database URL (use separate test database). Set TEST_DATABASE_URL to
+# e.g. sqlite+aiosqlite:///:memory: to run without a MySQL service.
+TEST_DATABASE_URL = os.environ.get(
+    "TEST_DATABASE_URL",
+    settings.DATABASE_URL.replace("/hellio_hr", "/hellio_hr_test"),
+)
 
 # Create async engine for tests
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+test_engine = create_engine(TEST_DATABASE_URL, echo=False)
 
 # Create session factory for tests
 TestAsyncSessionLocal = async_sessionmaker(
@@ -13,6 +13,7 @@ from app.models.position import Position, PositionStatus
 from app.models.position_skill import PositionSkill
 from app.models.skill import Skill, SkillLevel
 from app.models.user import User, UserRole
+from app.services.candidate import CandidateService
 
 fake = Faker()
 
@@ -31,7 +32,13 @@ def create_user(**kwargs):
 
 
 def create_candidate(**kwargs):
-    """Create a test candidate."""
+    """
+    Create a test candidate.
+
+    search_text is filled from name and email, as the repository writes it
+    for a candidate without skills; tests that add skills or experiences
+    directly call CandidateRepository.refresh_derived_fields.
+    """
     defaults = {
         "name": fake.name(),
         "email": fake.email(),
@@ -42,6 +49,9 @@ def create_candidate(**kwargs):
         "sort_order": 0,
     }
     defaults.update(kwargs)
+    defaults.setdefault(
+        "search_text", CandidateService.build_search_text(defaults["name"], defaults["email"], [])
+    )
     return Candidate(**defaults)
 
 
@@ -0,0 +1,58 @@
+"""Unit tests for the benchmark baseline comparison."""
+
+import random
+
+from benchmarks.baseline import classify
+from benchmarks.common import percentile
+
+
+def _scenario(center: float, errors: int = 0, n: int = 200, seed: int = 1) -> dict:
+    """Fake bench_api scenario result with noisy samples around a center."""
+    rng = random.Random(seed)
+    return {
+        "errors": errors,
+        "samples_ms": [center * rng.uniform(0.8, 1.2) for _ in range(n)],
+    }
+
+
+def test_noise_is_not_a_regression():
+    """Two runs from the same distribution compare as ok."""
+    row = classify(_scenario(10.0, seed=1), _scenario(10.0, seed=2), "p50", 0.10, 1.0)
+    assert row["verdict"] == "ok"
+    assert row["ci_low"] < 1 < row["ci_high"]
+
+
+def test_slowdown_beyond_limit_is_a_regression():
+    """A 50% slowdown exceeds a 10% limit."""
+    row = classify(_scenario(10.0, seed=1), _scenario(15.0, seed=2), "p95", 0.10, 1.0)
+    assert row["verdict"] == "regression"
+    assert row["ratio"] > 1.4
+
+
+def test_slowdown_within_limit_passes():
+    """The same slowdown is tolerated under a higher limit."""
+    row = classify(_scenario(10.0, seed=1), _scenario(15.0, seed=2), "p50", 1.0, 1.0)
+    assert row["verdict"] == "ok"
+
+
+def test_small_absolute_change_is_ignored():
+    """Relative slowdowns below --min-delta-ms do not count."""
+    row = classify(_scenario(0.5, seed=1), _scenario(1.0, seed=2), "p50", 0.10, 1.0)
+    assert row["verdict"] == "ok"
+
+
+def test_speedup_and_new_errors():
+    """Faster runs are improvements; new request errors always fail."""
+    improved = classify(_scenario(20.0, seed=1), _scenario(10.0, seed=2), "mean", 0.10, 1.0)
+    assert improved["verdict"] == "improvement"
+    failing = classify(_scenario(10.0), _scenario(10.0, errors=3), "p50", 0.10, 1.0)
+    assert failing["verdict"] == "errors"
+
+
+def test_percentile_uses_nearest_rank():
+    """The p-th percentile is the smallest sample covering p% of them."""
+    samples = [float(n) for n in range(1, 31)]
+    assert percentile(samples, 95) == 29.0
+    assert percentile(samples, 99) == 30.0
+    assert percentile(samples, 50) == 15.0
+    assert percentile([7.0], 99) == 7.0
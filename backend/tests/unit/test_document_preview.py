@@ -0,0 +1,163 @@
+"""Unit tests for document preview generation."""
+
+import hashlib
+import io
+from datetime import datetime, timedelta
+
+import pytest
+from PIL import Image
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.base import Base
+from app.db.session import create_engine
+from app.models.blob import Blob
+from app.models.preview import Preview, PreviewKind
+from app.repositories.preview import PreviewRepository
+from app.services.document_preview import PreviewGenerator, preview_format, render_preview
+from app.services.document_storage import DocumentStorageService
+from app.services.text_extraction import UnsupportedDocumentError
+from tests.fixtures.factories import create_candidate, create_document
+from tests.fixtures.files import minimal_pdf
+
+
+def _png(width: int, height: int) -> bytes:
+    data = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(data, format="PNG")
+    return data.getvalue()
+
+
+def test_render_preview_formats(tmp_path):
+    """PDFs and images become PNGs at the preview width; text files a snippet."""
+    pdf = tmp_path / "cv"
+    pdf.write_bytes(minimal_pdf("Hello"))
+    assert render_preview(str(pdf), str(pdf), ".pdf", 300)[0] == "image"
+    with Image.open(tmp_path / "cv.preview.png") as image:
+        # US Letter is 612 x 792 points
+        assert image.size[0] == 300 and 385 <= image.size[1] <= 390
+
+    photo = tmp_path / "photo"
+    photo.write_bytes(_png(1200, 400))
+    kind, size = render_preview(str(photo), str(photo), ".png", 300)
+    assert (kind, size) == ("image", (tmp_path / "photo.preview.png").stat().st_size)
+    with Image.open(tmp_path / "photo.preview.png") as image:
+        assert image.size == (300, 100)
+
+    notes = tmp_path / "notes"
+    notes.write_text("  Python\n" + "x" * 5000, encoding="utf-8")
+    # Capped at PREVIEW_TEXT_CHARS, then stripped
+    assert render_preview(str(notes), str(notes), ".txt", 300) == ("text", 1998)
+    assert (tmp_path / "notes.preview.txt").read_text().startswith("Python\n")
+
+    with pytest.raises(UnsupportedDocumentError):
+        render_preview(str(notes), str(notes), ".zip", 300)
+    assert sorted(p.name for p in tmp_path.iterdir() if ".preview." in p.name) == [
+        "cv.preview.png",
+        "notes.preview.txt",
+        "photo.preview.png",
+    ]
+
+
+def test_preview_format_accepts_any_image_type():
+    """Images are recognised by content type when the name has no extension."""
+    assert preview_format("scan", "image/jpeg") == ".png"
+    assert preview_format("cv.pdf", None) == ".pdf"
+    assert preview_format("archive.zip", "application/zip") == ".zip"
+
+
+@pytest.fixture
+async def session_factory(tmp_path, monkeypatch):
+    """Sessions on a throwaway SQLite file, with storage next to it."""
+    monkeypatch.setattr(settings, "STORAGE_PATH", str(tmp_path / "storage"))
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'preview.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _store(session, candidate_id: str, name: str, content: bytes):
+    """Write a blob and a document referencing it, like an upload."""
+    checksum = hashlib.sha256(content).hexdigest()
+    storage_key = DocumentStorageService.storage_key_for(checksum)
+    path = DocumentStorageService.path_for(storage_key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    session.add(Blob(sha256=checksum, size=len(content), ref_count=1))
+    document = create_document(
+        candidate_id, name=name, storage_key=storage_key, checksum=checksum, content_type=None
+    )
+    session.add(document)
+    await session.flush()
+    return document
+
+
+@pytest.mark.asyncio
+async def test_generator_processes_uploads_and_evicts(session_factory):
+    """Queued documents get previews; the least recently used go past the budget."""
+    async with session_factory() as session:
+        candidate = create_candidate(email="preview@example.com")
+        session.add(candidate)
+        await session.flush()
+        first = await _store(session, candidate.id, "first.png", _png(800, 800))
+        second = await _store(session, candidate.id, "second.png", _png(900, 900))
+        notes = await _store(session, candidate.id, "notes.bin", b"\x00\x01")
+        await session.commit()
+
+    generator = PreviewGenerator(
+        session_factory, workers=1, queue_size=10, timeout=30, width=200, cache_bytes=10**6
+    )
+    await generator.start()
+    try:
+        for document in (first, second, notes):
+            assert generator.enqueue(document.id)
+        await generator.wait_idle()
+    finally:
+        await generator.stop()
+
+    async with session_factory() as session:
+        previews = {p.sha256: p for p in (await session.execute(select(Preview))).scalars()}
+        assert previews[first.checksum].kind == PreviewKind.IMAGE
+        assert previews[notes.checksum].kind == PreviewKind.UNAVAILABLE
+        first_path = DocumentStorageService.preview_path(
+            DocumentStorageService.path_for(first.storage_key), "image"
+        )
+        assert first_path.exists()
+
+        # Shrink the cache to fit one preview: the least recently used goes
+        await session.execute(
+            update(Preview)
+            .where(Preview.sha256 == first.checksum)
+            .values(accessed_at=datetime.utcnow() - timedelta(days=1))
+        )
+        generator.cache_bytes = previews[second.checksum].size
+        assert await generator.evict(session) == 1
+        remaining = (await session.execute(select(Preview.sha256))).scalars().all()
+        assert first.checksum not in remaining
+        assert not first_path.exists()
+
+        # ...and comes back on the next request
+        generator.cache_bytes = 10**6
+        preview = await generator.get_or_create(session, first)
+        assert preview.kind == PreviewKind.IMAGE
+        assert first_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_save_preview_without_upsert_support(session_factory, monkeypatch):
+    """Dialects without an upsert insert, then replace, and skip collected blobs."""
+    async with session_factory() as session:
+        monkeypatch.setattr(session.get_bind().dialect, "name", "other")
+        session.add(Blob(sha256="a" * 64, size=3, ref_count=1))
+        await session.commit()
+
+        await PreviewRepository.save_preview(session, "a" * 64, PreviewKind.UNAVAILABLE, 0, "x")
+        await PreviewRepository.save_preview(session, "a" * 64, PreviewKind.TEXT, 12)
+        # The blob is gone: the foreign key rejects the insert
+        await PreviewRepository.save_preview(session, "b" * 64, PreviewKind.TEXT, 12)
+
+        previews = (await session.execute(select(Preview))).scalars().all()
+        assert [(p.sha256, p.kind, p.size, p.error) for p in previews] == [
+            ("a" * 64, PreviewKind.TEXT, 12, None)
+        ]
@@ -0,0 +1,126 @@
+"""Unit tests for the background job runner."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.base import Base
+from app.db.session import create_engine
+from app.models.job import Job, JobStatus
+from app.repositories.job import JobRepository
+from app.services.jobs import JobRunner, job_handler
+
+running_now = 0
+max_running = 0
+
+
+@job_handler("test_sleep")
+async def sleep_job(db, params, report):
+    """Track how many jobs run at once."""
+    global running_now, max_running
+    running_now += 1
+    max_running = max(max_running, running_now)
+    await asyncio.sleep(0.01)
+    await report(1, 1)
+    running_now -= 1
+    return {"slept": params["n"]}
+
+
+@job_handler("test_failure")
+async def failing_job(db, params, report):
+    """Always fail."""
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    """
+    Sessions on a throwaway SQLite file.
+
+    Workers need connections of their own; an in-memory test database
+    shares a single connection, so concurrent jobs would interleave
+    transactions.
+    """
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db(session_factory) -> AsyncSession:
+    """A session for submitting and inspecting jobs."""
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def runner(session_factory) -> JobRunner:
+    """A runner with two workers."""
+    return JobRunner(session_factory, workers=2, progress_interval=0)
+
+
+@pytest.mark.asyncio
+async def test_runner_bounds_concurrency(runner: JobRunner, db: AsyncSession):
+    """Test that no more jobs run at once than there are workers."""
+    await runner.start()
+    try:
+        jobs = [await runner.submit(db, "test_sleep", {"n": n}) for n in range(6)]
+        await runner.wait_idle()
+    finally:
+        await runner.stop()
+
+    assert max_running == 2
+    for job in jobs:
+        stored = await JobRepository.get_job_by_id(db, job.id)
+        await db.refresh(stored)
+        assert stored.status == JobStatus.SUCCEEDED
+        assert stored.processed == 1
+        assert stored.total == 1
+        assert stored.result == {"slept": job.params["n"]}
+        assert stored.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_runner_records_failure(runner: JobRunner, db: AsyncSession):
+    """Test that a handler exception marks the job failed with the error."""
+    await runner.start()
+    try:
+        job = await runner.submit(db, "test_failure", {})
+        await runner.wait_idle()
+    finally:
+        await runner.stop()
+
+    await db.refresh(job)
+    assert job.status == JobStatus.FAILED
+    assert job.error == "boom"
+
+
+@pytest.mark.asyncio
+async def test_runner_rejects_unknown_type(runner: JobRunner, db: AsyncSession):
+    """Test that submitting an unregistered job type raises ValueError."""
+    with pytest.raises(ValueError):
+        await runner.submit(db, "no_such_job", {})
+
+
+@pytest.mark.asyncio
+async def test_runner_recovers_unfinished_jobs(runner: JobRunner, db: AsyncSession):
+    """Test that start() requeues queued jobs and fails interrupted ones."""
+    queued = Job(type="test_sleep", status=JobStatus.QUEUED, params={"n": 1})
+    interrupted = Job(type="test_sleep", status=JobStatus.RUNNING, params={"n": 2})
+    db.add_all([queued, interrupted])
+    await db.commit()
+
+    await runner.start()
+    try:
+        await runner.wait_idle()
+    finally:
+        await runner.stop()
+
+    await db.refresh(queued)
+    await db.refresh(interrupted)
+    assert queued.status == JobStatus.SUCCEEDED
+    assert interrupted.status == JobStatus.FAILED
+    assert interrupted.error == "Interrupted by restart"
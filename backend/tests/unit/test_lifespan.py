@@ -0,0 +1,40 @@
+"""Unit tests for the application lifespan."""
+
+import pytest
+
+from app import main
+
+
+@pytest.mark.asyncio
+async def test_lifespan_stops_started_services_when_startup_fails(monkeypatch):
+    """Test a failing start still stops everything, in reverse order."""
+    calls = []
+    services = [
+        main.job_runner,
+        main.text_extractor,
+        main.preview_generator,
+        main.skill_index,
+        main.experience_refresher,
+    ]
+    for service in services:
+        name = type(service).__name__
+
+        async def start(name=name):
+            calls.append(f"start {name}")
+            if name == type(main.skill_index).__name__:
+                raise RuntimeError("boom")
+
+        async def stop(name=name):
+            calls.append(f"stop {name}")
+
+        monkeypatch.setattr(service, "start", start)
+        monkeypatch.setattr(service, "stop", stop)
+
+    with pytest.raises(RuntimeError):
+        async with main.lifespan(main.app):
+            pass
+
+    names = [type(service).__name__ for service in services]
+    assert calls == [f"start {name}" for name in names[:4]] + [
+        f"stop {name}" for name in reversed(names)
+    ]
@@ -0,0 +1,82 @@
+"""Unit tests for vectorized candidate matching."""
+
+import numpy as np
+
+from app.models.skill import SkillLevel
+from app.services.matching import SkillMatrix
+
+
+def _candidate(id: str, years: int, *skills: tuple[int, SkillLevel]) -> dict:
+    return {"id": id, "name": id.title(), "years_of_experience": years, "skill_ids": list(skills)}
+
+
+def test_skill_matrix_scores_by_level_and_experience():
+    python, sql, go, rust = 1, 2, 3, 4
+    matrix = SkillMatrix.build(
+        [
+            _candidate("ann", 6, (python, SkillLevel.EXPERT), (sql, SkillLevel.ADVANCED)),
+            _candidate("bob", 2, (python, SkillLevel.BEGINNER)),
+            _candidate("cat", 10, (go, SkillLevel.EXPERT)),
+            _candidate("dan", 0),
+        ]
+    )
+    assert matrix.weights.shape == (3, 4)
+
+    # "Python 3" resolves to the same catalog skill and counts once
+    required = [("Python", python), ("SQL", sql), ("Python 3", python), ("Rust", rust)]
+    matches = matrix.top_matches(required, min_experience_years=4, limit=3)
+
+    # Experience alone (cat) outweighs one required skill at beginner level (bob)
+    assert [m.candidate_id for m in matches] == ["ann", "cat", "bob"]
+    ann = matches[0]
+    assert ann.skill_score == round((1.0 + 0.75) / 3, 4)
+    assert ann.experience_score == 1.0
+    assert ann.matched_skills == ["Python", "SQL"]
+    assert ann.missing_skills == ["Rust"]
+    assert matches[1].skill_score == 0.0
+    assert matches[2].experience_score == 0.5
+    assert matches[2].matched_skills == ["Python"]
+
+
+def test_skill_matrix_counts_aliases_once_at_the_higher_level():
+    javascript = 1
+    beginner, advanced = SkillLevel.BEGINNER, SkillLevel.ADVANCED
+    matrix = SkillMatrix.build(
+        [
+            # "JS" and "JavaScript" resolve to the same catalog skill
+            _candidate("ann", 0, (javascript, beginner), (javascript, advanced)),
+            _candidate("bob", 0, (javascript, beginner), (javascript, beginner)),
+        ]
+    )
+    matches = matrix.top_matches([("JavaScript", javascript)], min_experience_years=0, limit=2)
+    assert [(m.candidate_id, m.skill_score) for m in matches] == [("ann", 0.75), ("bob", 0.25)]
+
+
+def test_skill_matrix_top_k_matches_full_sort():
+    rng = np.random.default_rng(7)
+    levels = list(SkillLevel)
+    candidates = [
+        _candidate(
+            f"c{i:04d}",
+            int(rng.integers(0, 15)),
+            *[(int(s), levels[rng.integers(0, 4)]) for s in rng.choice(40, 5, replace=False)],
+        )
+        for i in range(2000)
+    ]
+    matrix = SkillMatrix.build(candidates)
+    required = [(f"skill-{i}", i) for i in range(6)]
+
+    top = matrix.top_matches(required, min_experience_years=5, limit=25)
+    everyone = matrix.top_matches(required, min_experience_years=5, limit=len(candidates))
+
+    assert len(top) == 25
+    assert [m.score for m in top] == [m.score for m in everyone[:25]]
+    assert [m.score for m in everyone] == sorted((m.score for m in everyone), reverse=True)
+
+
+def test_skill_matrix_without_requirements_or_candidates():
+    assert SkillMatrix.build([]).top_matches([("Python", 1)], 3, 10) == []
+
+    matrix = SkillMatrix.build([_candidate("ann", 1), _candidate("bob", 3)])
+    matches = matrix.top_matches([], min_experience_years=0, limit=10)
+    assert [m.score for m in matches] == [1.0, 1.0]
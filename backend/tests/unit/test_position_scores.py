@@ -0,0 +1,149 @@
+"""Unit tests for the materialized position-candidate scores."""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models.candidate import Candidate, CandidateStatus
+from app.models.position_candidate_score import PositionCandidateScore
+from app.models.skill import SkillLevel
+from app.models.skill_catalog import SkillAlias, SkillCatalog
+from app.repositories.candidate import CandidateRepository
+from app.repositories.position_score import PositionScoreRepository
+from app.repositories.skill_catalog import SkillCatalogRepository
+from app.services.match_scoring import score_candidate, skill_weights
+from tests.fixtures.factories import (
+    create_candidate,
+    create_experience,
+    create_position,
+    create_position_skill,
+    create_skill,
+)
+
+
+def test_score_candidate_counts_duplicate_and_unresolved_requirements():
+    weights = skill_weights(
+        [(1, SkillLevel.EXPERT), (2, SkillLevel.BEGINNER), (2, SkillLevel.ADVANCED)]
+    )
+    # Aliases at two levels count once, at the higher one
+    assert weights == {1: 1.0, 2: 0.75}
+
+    # Skill 1 listed twice counts once; the unresolved name counts as missing
+    score, skill_score, experience_score = score_candidate(weights, [1, 1, None], 3, 6)
+    assert skill_score == 0.5
+    assert experience_score == 0.5
+    assert score == 0.5
+    assert score_candidate({}, [], 0, 0) == (1.0, 1.0, 1.0)
+
+
+async def _scores(db_session) -> dict[tuple[str, str], float]:
+    result = await db_session.execute(
+        select(
+            PositionCandidateScore.position_id,
+            PositionCandidateScore.candidate_id,
+            PositionCandidateScore.score,
+        )
+    )
+    return {(p, c): score for p, c, score in result}
+
+
+@pytest.mark.asyncio
+async def test_refresh_candidates_rewrites_only_their_rows(db_session):
+    backend = create_position(min_experience_years=2)
+    data = create_position(min_experience_years=2)
+    db_session.add_all([backend, data])
+    await db_session.flush()
+    db_session.add_all([
+        create_position_skill(backend.id, name="Python"),
+        create_position_skill(data.id, name="SQL"),
+    ])
+    ann = create_candidate(name="Ann", years_of_experience=4)
+    bob = create_candidate(name="Bob", years_of_experience=1)
+    db_session.add_all([ann, bob])
+    await db_session.flush()
+    db_session.add_all([
+        create_skill(ann.id, name="Python", level=SkillLevel.EXPERT),
+        create_skill(bob.id, name="Python", level=SkillLevel.BEGINNER),
+    ])
+    await db_session.commit()
+    await SkillCatalogRepository.canonicalize_skills(db_session)
+
+    assert await PositionScoreRepository.rebuild(db_session) == 2
+    assert await _scores(db_session) == {(backend.id, ann.id): 1.0, (backend.id, bob.id): 0.3}
+
+    # Bob learns SQL and gains experience; Ann leaves the active pool
+    db_session.add(create_skill(bob.id, name="SQL", level=SkillLevel.EXPERT))
+    await db_session.flush()
+    await SkillCatalogRepository.canonicalize_skills(db_session)
+    await db_session.execute(
+        update(Candidate).where(Candidate.id == bob.id).values(years_of_experience=2)
+    )
+    await db_session.execute(
+        update(Candidate).where(Candidate.id == ann.id).values(status=CandidateStatus.HIRED)
+    )
+    assert await PositionScoreRepository.refresh_candidates(db_session, [ann.id, bob.id]) == 2
+    await db_session.commit()
+
+    assert await _scores(db_session) == {(backend.id, bob.id): 0.4, (data.id, bob.id): 1.0}
+
+
+@pytest.mark.asyncio
+async def test_rebuild_scores_skill_aliases_at_the_higher_level(db_session):
+    javascript = SkillCatalog(name="JavaScript", normalized_name="javascript")
+    position = create_position(min_experience_years=0)
+    db_session.add_all([javascript, position])
+    await db_session.flush()
+    db_session.add(SkillAlias(alias="js", skill_id=javascript.id))
+    db_session.add(create_position_skill(position.id, name="JavaScript"))
+    ann = create_candidate(name="Ann")
+    bob = create_candidate(name="Bob")
+    db_session.add_all([ann, bob])
+    await db_session.flush()
+    db_session.add_all([
+        create_skill(ann.id, name="JS", level=SkillLevel.BEGINNER),
+        create_skill(ann.id, name="JavaScript", level=SkillLevel.ADVANCED),
+        create_skill(bob.id, name="JS", level=SkillLevel.BEGINNER),
+        create_skill(bob.id, name="JavaScript", level=SkillLevel.BEGINNER),
+    ])
+    await db_session.commit()
+    await SkillCatalogRepository.canonicalize_skills(db_session)
+
+    assert await PositionScoreRepository.rebuild(db_session) == 2
+    # 0.8 * level weight + 0.2 for experience: Advanced, not Expert; Beginner,
+    # not Intermediate
+    assert await _scores(db_session) == {(position.id, ann.id): 0.8, (position.id, bob.id): 0.4}
+
+
+@pytest.mark.asyncio
+async def test_refresh_current_experience_updates_stale_years(db_session):
+    position = create_position(min_experience_years=10)
+    db_session.add(position)
+    await db_session.flush()
+    db_session.add(create_position_skill(position.id, name="Python"))
+    # Stored values as written long ago: a current role keeps counting,
+    # a finished one does not
+    current = create_candidate(name="Current", years_of_experience=1)
+    finished = create_candidate(name="Finished", years_of_experience=7)
+    db_session.add_all([current, finished])
+    await db_session.flush()
+    db_session.add_all([
+        create_experience(
+            current.id, start_date=date.today() - timedelta(days=5 * 366), end_date=None
+        ),
+        create_experience(finished.id),
+        create_skill(current.id, name="Python", level=SkillLevel.EXPERT),
+    ])
+    await db_session.commit()
+    current_id, finished_id = current.id, finished.id
+    await SkillCatalogRepository.canonicalize_skills(db_session)
+    await PositionScoreRepository.rebuild(db_session)
+
+    assert await CandidateRepository.refresh_current_experience(db_session, batch_size=1) == 1
+    assert await CandidateRepository.refresh_current_experience(db_session) == 0
+
+    years = dict(
+        (await db_session.execute(select(Candidate.id, Candidate.years_of_experience))).all()
+    )
+    assert years == {current_id: 5, finished_id: 7}
+    assert await _scores(db_session) == {(position.id, current_id): 0.9}
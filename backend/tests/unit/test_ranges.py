@@ -0,0 +1,32 @@
+"""Unit tests for HTTP Range parsing."""
+
+import pytest
+
+from app.core.ranges import RangeNotSatisfiableError, parse_range
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=-5000", (0, 999)),
+        ("bytes=990-5000", (990, 999)),
+        ("bytes=0-0,10-20", None),
+        ("items=0-10", None),
+        ("bytes=10-5", None),
+        ("bytes=abc", None),
+        ("bytes=-", None),
+    ],
+)
+def test_parse_range(header, expected):
+    """Satisfiable single ranges are clamped; anything else is ignored."""
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0"])
+def test_parse_range_not_satisfiable(header):
+    """Ranges starting past the end cannot be served."""
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_range(header, 1000)
@@ -0,0 +1,72 @@
+"""Unit tests for skill catalog resolution."""
+
+import pytest
+from sqlalchemy import select
+
+from app.models.position_skill import PositionSkill
+from app.models.skill import Skill
+from app.models.skill_catalog import SkillAlias, SkillCatalog
+from app.repositories.skill_catalog import SkillCatalogRepository
+from app.services.skill_catalog import default_alias_map, normalize_skill
+from tests.fixtures.factories import create_candidate, create_position, create_skill
+
+
+def test_default_aliases_are_normalized():
+    aliases = default_alias_map()
+    assert aliases["js"] == "JavaScript"
+    assert aliases["javascript es6"] == "JavaScript"
+    assert aliases["k8s"] == "Kubernetes"
+    assert normalize_skill("  Machine\tLearning ") == "machine learning"
+
+
+@pytest.mark.asyncio
+async def test_resolve_uses_aliases_and_creates_entries(db_session):
+    javascript = SkillCatalog(name="JavaScript", normalized_name="javascript")
+    db_session.add(javascript)
+    await db_session.flush()
+    db_session.add_all([
+        SkillAlias(alias="javascript", skill_id=javascript.id),
+        SkillAlias(alias="js", skill_id=javascript.id),
+    ])
+    await db_session.commit()
+
+    ids = await SkillCatalogRepository.resolve(
+        db_session, ["JS", "Javascript", " rust ", "Rust", " "]
+    )
+    await db_session.commit()
+
+    assert ids["js"] == ids["javascript"] == javascript.id
+    assert set(ids) == {"js", "javascript", "rust"}
+    rust = await db_session.get(SkillCatalog, ids["rust"])
+    assert rust.name == "rust"  # Spelled as first given
+
+    # Resolving again finds the same entries without adding any
+    assert await SkillCatalogRepository.resolve(db_session, ["RUST", "js"]) == {
+        "rust": ids["rust"], "js": javascript.id,
+    }
+    entries = await db_session.execute(select(SkillCatalog.id))
+    assert len(entries.all()) == 2
+
+
+@pytest.mark.asyncio
+async def test_canonicalize_skills_backfills_in_batches(db_session):
+    candidate = create_candidate()
+    position = create_position()
+    db_session.add_all([candidate, position])
+    await db_session.flush()
+    db_session.add_all(
+        [create_skill(candidate.id, name=name) for name in ["Go", "go", "Golang", "SQL", "Elm"]]
+        + [PositionSkill(position_id=position.id, name="GO")]
+    )
+    await db_session.commit()
+
+    resolved = await SkillCatalogRepository.canonicalize_skills(db_session, batch_size=2)
+
+    assert resolved == 6
+    rows = (await db_session.execute(select(Skill.name, Skill.skill_id))).all()
+    ids = dict(rows)
+    assert None not in ids.values()
+    assert ids["Go"] == ids["go"] != ids["Golang"]  # No alias seeded in this database
+    position_skill_id = await db_session.scalar(select(PositionSkill.skill_id))
+    assert position_skill_id == ids["Go"]
+    assert await SkillCatalogRepository.canonicalize_skills(db_session) == 0
@@ -0,0 +1,95 @@
+"""Unit tests for the skill inverted index."""
+
+import pytest
+
+from app.models.skill import SkillLevel
+from app.services.skill_index import (
+    CHUNK_BITS,
+    Bitmap,
+    SkillExpressionError,
+    SkillIndex,
+    SkillOperation,
+    SkillTerm,
+    parse_skill_expression,
+)
+
+
+def _bitmap(*values: int) -> Bitmap:
+    bitmap = Bitmap()
+    for value in values:
+        bitmap.add(value)
+    return bitmap
+
+
+def test_bitmap_set_operations():
+    far = 5 * CHUNK_BITS + 7
+    left, right = _bitmap(1, 3, far), _bitmap(3, 4, far, 10 * CHUNK_BITS)
+
+    assert list(left & right) == [3, far]
+    assert list(left | right) == [1, 3, 4, far, 10 * CHUNK_BITS]
+    assert len(left | right) == 5
+
+    left.discard(far)
+    left.discard(999)
+    assert list(left) == [1, 3]
+    assert sorted(left.chunks) == [0]  # Emptied chunks are dropped
+
+
+def test_parse_skill_expression():
+    assert parse_skill_expression("Python AND Kubernetes AND (AWS OR gcp)") == SkillOperation(
+        "and",
+        (
+            SkillTerm("python"),
+            SkillTerm("kubernetes"),
+            SkillOperation("or", (SkillTerm("aws"), SkillTerm("gcp"))),
+        ),
+    )
+    # AND binds tighter than OR; words join into one name; levels and quotes
+    assert parse_skill_expression('machine  learning or go:Expert and "R and D"') == (
+        SkillOperation(
+            "or",
+            (
+                SkillTerm("machine learning"),
+                SkillOperation(
+                    "and", (SkillTerm("go", SkillLevel.EXPERT), SkillTerm("r and d"))
+                ),
+            ),
+        )
+    )
+
+    for invalid in ["", "python AND", "(python", "python)", "AND go", 'c "sharp', '""']:
+        with pytest.raises(SkillExpressionError):
+            parse_skill_expression(invalid)
+
+
+def test_skill_index_evaluates_expressions_and_updates():
+    # Catalog ids, as resolved from the expression's names
+    ids = {"python": 1, "kubernetes": 2, "aws": 3, "gcp": 4, "azure": 5, "cobol": 6, "k8s": 2}
+    index = SkillIndex()
+    index.set_candidate(
+        "ann", [(1, SkillLevel.EXPERT), (2, SkillLevel.BEGINNER), (3, SkillLevel.ADVANCED)]
+    )
+    index.set_candidate(
+        "bob", [(1, SkillLevel.BEGINNER), (2, SkillLevel.EXPERT), (4, SkillLevel.EXPERT)]
+    )
+    index.set_candidate("cat", [(1, SkillLevel.ADVANCED), (5, SkillLevel.EXPERT)])
+
+    def match(expression: str) -> set[str]:
+        bitmap = index.evaluate(parse_skill_expression(expression), ids)
+        return set(index.candidate_ids(bitmap))
+
+    assert match("python AND kubernetes AND (aws OR gcp)") == {"ann", "bob"}
+    assert match("Python AND K8s AND (AWS OR GCP)") == {"ann", "bob"}
+    assert match("python:advanced") == {"ann", "cat"}
+    assert match("kubernetes:advanced OR azure") == {"bob", "cat"}
+    assert match("cobol OR (unknown AND python)") == set()
+
+    index.set_candidate("bob", [(6, SkillLevel.EXPERT)])
+    index.remove("ann")
+    assert match("python") == {"cat"}
+    assert match("cobol") == {"bob"}
+    assert len(index) == 2
+
+    # The freed slot is reused for the next new candidate
+    index.set_candidate("dan", [(4, SkillLevel.INTERMEDIATE)])
+    assert match("gcp OR cobol") == {"bob", "dan"}
@@ -0,0 +1,152 @@
+"""Unit tests for document text extraction."""
+
+import time
+import zipfile
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.base import Base
+from app.db.session import create_engine
+from app.models.document_text import DocumentText, ExtractionStatus
+from app.services.text_extraction import (
+    TextExtractor,
+    UnsupportedDocumentError,
+    document_format,
+    extract_text,
+)
+from tests.fixtures.factories import create_candidate, create_document
+from tests.fixtures.files import minimal_pdf
+
+DOCX_BODY = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body>"
+    "<w:p><w:r><w:t>Senior Engineer</w:t></w:r></w:p>"
+    "<w:p><w:r><w:t>Kubernetes</w:t><w:tab/><w:t>Terraform</w:t></w:r></w:p>"
+    "</w:body></w:document>"
+)
+
+
+def _write_docx(path) -> None:
+    """Write a minimal DOCX with two paragraphs."""
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("word/document.xml", DOCX_BODY)
+
+
+def slow_extract(path: str, file_format: str) -> str:
+    """Stand-in for a parser stuck on a pathological file."""
+    if "slow" in path:
+        time.sleep(30)
+    return extract_text(path, file_format)
+
+
+def test_extract_text_formats(tmp_path):
+    """PDF text, DOCX paragraphs as lines and UTF-8 text files."""
+    pdf = tmp_path / "cv.pdf"
+    pdf.write_bytes(minimal_pdf("Hello Kubernetes"))
+    docx = tmp_path / "cv.docx"
+    _write_docx(docx)
+    txt = tmp_path / "cv.txt"
+    txt.write_text("Python\nGo", encoding="utf-8")
+
+    assert extract_text(str(pdf), ".pdf") == "Hello Kubernetes"
+    assert extract_text(str(docx), ".docx") == "Senior Engineer\nKubernetes\tTerraform"
+    assert extract_text(str(txt), ".txt") == "Python\nGo"
+    with pytest.raises(UnsupportedDocumentError):
+        extract_text(str(txt), ".png")
+
+
+def test_document_format_prefers_content_type():
+    """The content type wins over the file name."""
+    assert document_format("cv", "application/pdf") == ".pdf"
+    assert document_format("CV.DOCX", "application/octet-stream") == ".docx"
+    assert document_format("photo", None) == ""
+
+
+@pytest.fixture
+async def session_factory(tmp_path, monkeypatch):
+    """Sessions on a throwaway SQLite file, with storage next to it."""
+    monkeypatch.setattr(settings, "STORAGE_PATH", str(tmp_path / "storage"))
+    (tmp_path / "storage").mkdir()
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'extract.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _add_documents(session_factory, tmp_path, files: dict[str, bytes]) -> dict[str, str]:
+    """Store files and create a document row for each; return name -> id."""
+    ids = {}
+    async with session_factory() as session:
+        candidate = create_candidate(email="extract@example.com")
+        session.add(candidate)
+        await session.flush()
+        for name, content in files.items():
+            (tmp_path / "storage" / name).write_bytes(content)
+            document = create_document(candidate.id, name=name, storage_key=name)
+            session.add(document)
+            await session.flush()
+            ids[name] = document.id
+        await session.commit()
+    return ids
+
+
+async def _texts(session_factory) -> dict[str, DocumentText]:
+    async with session_factory() as session:
+        result = await session.execute(select(DocumentText))
+        return {text.document_id: text for text in result.scalars()}
+
+
+@pytest.mark.asyncio
+async def test_extractor_backfill_stores_text(session_factory, tmp_path):
+    """Backfill extracts every stored document into document_texts."""
+    docx = tmp_path / "source.docx"
+    _write_docx(docx)
+    ids = await _add_documents(
+        session_factory,
+        tmp_path,
+        {"cv.docx": docx.read_bytes(), "notes.txt": b"AWS", "photo.png": b"\x89PNG"},
+    )
+
+    extractor = TextExtractor(session_factory, workers=2, queue_size=2, timeout=30)
+    await extractor.start()
+    try:
+        assert await extractor.backfill() == 3
+        # Nothing left to do for the default (missing only) mode
+        assert await extractor.backfill() == 0
+    finally:
+        await extractor.stop()
+
+    texts = await _texts(session_factory)
+    assert texts[ids["cv.docx"]].status == ExtractionStatus.EXTRACTED
+    assert "Kubernetes" in texts[ids["cv.docx"]].content
+    assert texts[ids["notes.txt"]].content == "AWS"
+    assert texts[ids["photo.png"]].status == ExtractionStatus.UNSUPPORTED
+
+
+@pytest.mark.asyncio
+async def test_extractor_times_out_and_recovers(session_factory, tmp_path):
+    """A stuck file fails after the timeout without blocking the others."""
+    ids = await _add_documents(
+        session_factory, tmp_path, {"slow.txt": b"never", "fast.txt": b"Rust"}
+    )
+
+    extractor = TextExtractor(
+        session_factory, workers=1, queue_size=10, timeout=1, extract=slow_extract
+    )
+    await extractor.start()
+    try:
+        started = time.monotonic()
+        await extractor.backfill()
+        assert time.monotonic() - started < 20
+    finally:
+        await extractor.stop()
+
+    texts = await _texts(session_factory)
+    assert texts[ids["slow.txt"]].status == ExtractionStatus.FAILED
+    assert "Timed out" in texts[ids["slow.txt"]].error
+    assert texts[ids["fast.txt"]].content == "Rust"